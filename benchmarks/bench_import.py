@@ -0,0 +1,66 @@
+"""
+Import-time benchmark for ``import xlea``.
+
+Runs ``python -X importtime -c "import xlea"`` in fresh interpreters and
+reports the median cumulative import time of the package. The run fails if
+a parsing library gets imported eagerly or if the median exceeds the
+budget given with ``--max-ms``.
+
+Usage::
+
+    python benchmarks/bench_import.py --runs 20 --max-ms 150
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("openpyxl", "xlrd", "pyxlsb", "numpy", "pyarrow")
+
+
+def import_time_us() -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import xlea"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "xlea":
+            return int(cumulative)
+    raise RuntimeError("xlea import time not found")
+
+
+def eagerly_imported() -> list[str]:
+    code = (
+        "import sys, xlea; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return proc.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    median_ms = statistics.median(import_time_us() for _ in range(args.runs)) / 1000
+    heavy = eagerly_imported()
+
+    print(f"import xlea: {median_ms:.1f} ms (median of {args.runs})")
+    if heavy:
+        print(f"eagerly imported: {', '.join(heavy)}")
+        sys.exit(1)
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"over budget of {args.max_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
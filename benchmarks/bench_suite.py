@@ -0,0 +1,242 @@
+"""
+Benchmark suite for providers, header resolution and row binding.
+
+Generates synthetic workbooks (cached next to the system temp files) and
+measures each stage separately, every case in a fresh interpreter:
+
+- ``provider:openpyxl``, ``provider:xlrd``, ``provider:xlsx-stream``,
+  ``provider:pyxlsb``: a full pass over ``rows()``;
+- ``resolve``: ``BoundSchema.resolve()`` over the preamble and header;
+- ``construct``: row object construction, validators included;
+- ``access``: reading every attribute of every row object.
+
+Reported are the throughput, the peak RSS of the worker process and the
+peak memory traced by ``tracemalloc`` per item. With ``--baseline``, the
+run fails if a case got slower or heavier than the baseline by more than
+``--tolerance``; ``--save`` writes the results as a new baseline.
+
+``.xls`` files are written with ``xlwt`` (limited to 65536 rows). There is
+no ``.xlsb`` writer, so ``provider:pyxlsb`` reads the file given in the
+``XLEA_BENCH_XLSB`` environment variable and is skipped without it.
+
+Usage::
+
+    python benchmarks/bench_suite.py --rows 100000 --cols 50 --save base.json
+    python benchmarks/bench_suite.py --rows 100000 --cols 50 --baseline base.json
+    python benchmarks/bench_suite.py --cases resolve --preamble 500 --header-rows 2
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from harness import (
+    Params,
+    Result,
+    load_baseline,
+    make_schema,
+    measure,
+    regressions,
+    save_baseline,
+    synthetic_rows,
+    workbook,
+)
+
+RESOLVES = 200
+
+
+class Skip(Exception):
+    pass
+
+
+def _provider_case(module: str, name: str, fmt: str):
+    def case(params: Params):
+        from importlib import import_module
+
+        provider = getattr(import_module(module), name)
+        if fmt == "xlsb":
+            path = os.environ.get("XLEA_BENCH_XLSB")
+            if not path:
+                raise Skip("set XLEA_BENCH_XLSB to an .xlsb file")
+        else:
+            try:
+                path = workbook(params, fmt)
+            except (ImportError, ValueError) as exc:
+                raise Skip(str(exc))
+
+        def run() -> int:
+            with provider(path) as p:
+                return sum(1 for _ in p.rows())
+
+        return run, "rows"
+
+    return case
+
+
+def _resolve_case(params: Params):
+    from xlea.core.bound_schema import BoundSchema
+
+    schema = make_schema(params)
+    rows = list(synthetic_rows(params._replace(rows=1)))
+
+    def run() -> int:
+        for _ in range(RESOLVES):
+            BoundSchema(rows, schema).resolve()
+        return RESOLVES
+
+    return run, "resolves"
+
+
+def _bound_rows(params: Params):
+    from xlea.core.bound_schema import BoundSchema
+    from xlea.core.row import make_row_type
+
+    schema = make_schema(params)
+    bound = BoundSchema(synthetic_rows(params), schema).resolve()
+    data = list(bound.data_rows())
+    return bound, make_row_type(schema), data
+
+
+def _construct_case(params: Params):
+    bound, row_type, data = _bound_rows(params)
+
+    def run() -> int:
+        for i, row in enumerate(data):
+            row_type(row, i, bound)
+        return len(data)
+
+    return run, "rows"
+
+
+def _access_case(params: Params):
+    bound, row_type, data = _bound_rows(params)
+    objects = [row_type(row, i, bound) for i, row in enumerate(data)]
+    objects = [o for o in objects if hasattr(o, "row_index")]
+    attrs = [b.attr for b in bound.plan.columns]
+
+    def run() -> int:
+        for obj in objects:
+            for attr in attrs:
+                getattr(obj, attr)
+        return len(objects)
+
+    return run, "rows"
+
+
+CASES = {
+    "provider:openpyxl": _provider_case(
+        "xlea.providers.openpyxl", "OpenPyXlProvider", "xlsx"
+    ),
+    "provider:xlrd": _provider_case("xlea.providers.xlrd", "XLRDProvider", "xls"),
+    "provider:xlsx-stream": _provider_case(
+        "xlea.providers.xlsx", "XLSXStreamProvider", "xlsx"
+    ),
+    "provider:pyxlsb": _provider_case(
+        "xlea.providers.pyxlsb", "PyXLSBProvider", "xlsb"
+    ),
+    "resolve": _resolve_case,
+    "construct": _construct_case,
+    "access": _access_case,
+}
+
+
+def worker(case: str, params: Params, repeat: int):
+    try:
+        run, unit = CASES[case](params)
+    except Skip as exc:
+        print(json.dumps({"skipped": str(exc)}))
+        return
+    print(json.dumps(measure(case, run, unit, repeat)._asdict()))
+
+
+def run_case(case: str, params: Params, repeat: int):
+    proc = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            case,
+            "--params",
+            json.dumps(params._asdict()),
+            "--repeat",
+            str(repeat),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(f"{case} failed:\n{proc.stderr}")
+    out = json.loads(proc.stdout.splitlines()[-1])
+    if "skipped" in out:
+        return out["skipped"]
+    return Result(**out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--preamble", type=int, default=10)
+    parser.add_argument("--header-rows", type=int, default=1)
+    parser.add_argument(
+        "--validators",
+        type=float,
+        default=0.0,
+        help="share of columns with a validator",
+    )
+    parser.add_argument(
+        "--invalid",
+        type=float,
+        default=0.0,
+        help="share of rows skipped by a skip_invalid_row validator",
+    )
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--params", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, Params(**json.loads(args.params)), args.repeat)
+        return
+
+    params = Params(
+        args.rows,
+        args.cols,
+        args.preamble,
+        args.header_rows,
+        args.validators,
+        args.invalid,
+    )
+    results = []
+    for case in args.cases:
+        result = run_case(case, params, args.repeat)
+        if isinstance(result, str):
+            print(f"{case:<22} skipped: {result}")
+            continue
+        results.append(result)
+        print(
+            f"{case:<22} {result.per_second:14,.0f} {result.unit}/s"
+            f"  {result.peak_rss_mb:8.1f} MB RSS"
+            f"  {result.peak_bytes_per_item:10,.1f} B/{result.unit[:-1]}"
+        )
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.baseline:
+        failed = regressions(results, load_baseline(args.baseline), args.tolerance)
+        for line in failed:
+            print(f"regression: {line}")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare ``XLSXStreamProvider`` against ``OpenPyXlProvider``.
+
+Generates a synthetic workbook (cached next to the system temp files) with
+a mix of shared strings, integers and floats, then times a full pass over
+its rows with each provider.
+
+Usage::
+
+    python benchmarks/bench_xlsx_stream.py --rows 100000 --cols 50
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+
+def generate(rows: int, cols: int) -> Path:
+    path = Path(tempfile.gettempdir()) / f"xlea-bench-{rows}x{cols}.xlsx"
+    if path.exists():
+        return path
+
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet()
+    sheet.append([f"col{c}" for c in range(cols)])
+    for r in range(rows):
+        sheet.append(
+            [
+                f"value {r % 100}" if c % 3 == 0 else r * c if c % 3 == 1 else r / 7
+                for c in range(cols)
+            ]
+        )
+    book.save(path)
+    return path
+
+
+def consume(provider) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = sum(1 for _ in provider.rows())
+    return time.perf_counter() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=50)
+    args = parser.parse_args()
+
+    path = generate(args.rows, args.cols)
+    results = {}
+    for provider in (OpenPyXlProvider, XLSXStreamProvider):
+        elapsed, count = consume(provider(path))
+        results[provider.__name__] = elapsed
+        print(
+            f"{provider.__name__:<20} {elapsed:8.2f} s  "
+            f"{count / elapsed:12,.0f} rows/s"
+        )
+
+    speedup = results["OpenPyXlProvider"] / results["XLSXStreamProvider"]
+    print(f"speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Shared helpers of the benchmark suite: synthetic data, measurements and
+baseline comparison.
+
+Every case is measured in a fresh interpreter (see ``bench_suite.py``) so
+that the peak RSS reported for it is not inflated by earlier cases.
+"""
+
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from xlea import Column, Schema, config
+
+
+class Params(NamedTuple):
+    rows: int
+    cols: int
+    preamble: int
+    header_rows: int
+    validators: float
+    invalid: float
+
+    @property
+    def tag(self) -> str:
+        return "-".join(f"{k}{v}" for k, v in self._asdict().items())
+
+
+class Result(NamedTuple):
+    """
+    Measurements of one benchmark case.
+
+    Attributes
+    ----------
+    case : str
+        Case name.
+    items : int
+        Number of items processed in one run (rows, or header resolutions).
+    unit : str
+        What an item is.
+    seconds : float
+        Best wall time of one run.
+    per_second : float
+        Throughput, ``items / seconds``.
+    peak_rss_mb : float
+        Peak resident set size of the worker process, setup included.
+    peak_bytes_per_item : float
+        Peak memory traced by ``tracemalloc`` during one run, per item.
+    """
+
+    case: str
+    items: int
+    unit: str
+    seconds: float
+    per_second: float
+    peak_rss_mb: float
+    peak_bytes_per_item: float
+
+
+def header(params: Params) -> list[list[str]]:
+    """
+    Header rows: ``col{c}``, under ``group{c // 5}`` for multi-row headers.
+    """
+
+    names = [f"col{c}" for c in range(params.cols)]
+    if params.header_rows == 1:
+        return [names]
+    groups = [f"group{c // 5}" for c in range(params.cols)]
+    return [groups] + [[""] * params.cols] * (params.header_rows - 2) + [names]
+
+
+def synthetic_rows(params: Params) -> Iterator[list]:
+    """
+    Preamble, header and data rows of a synthetic sheet.
+
+    Data columns cycle through strings, integers and floats. A share of
+    ``params.invalid`` rows has an empty first cell, which the benchmark
+    schema rejects.
+    """
+
+    for i in range(params.preamble):
+        yield [f"report line {i}"]
+    yield from header(params)
+
+    invalid_every = round(1 / params.invalid) if params.invalid else 0
+    for r in range(params.rows):
+        row = [
+            f"value {r % 100}" if c % 3 == 0 else r * c if c % 3 == 1 else r / 7
+            for c in range(params.cols)
+        ]
+        if invalid_every and r % invalid_every == 0:
+            row[0] = None
+        yield row
+
+
+def make_schema(params: Params) -> type:
+    """
+    Schema binding every column, with validators on a share of them.
+    """
+
+    ns: dict = {"__annotations__": {}}
+    names = header(params)
+    with_validator = round(params.cols * params.validators)
+    for c in range(params.cols):
+        pattern = ";".join(n[c] for n in names if n[c])
+        kind = (str, int, float)[c % 3]
+        validator = None
+        if c == 0 and params.invalid:
+            validator = _not_none
+        elif c < with_validator:
+            validator = _always
+        ns[f"col{c}"] = Column(
+            pattern, validator=validator, skip_invalid_row=validator is _not_none
+        )
+        ns["__annotations__"][f"col{c}"] = kind
+
+    schema = type("BenchSchema", (Schema,), ns)
+    return config(header_rows=params.header_rows)(schema)
+
+
+def _not_none(value) -> bool:
+    return value is not None
+
+
+def _always(value) -> bool:
+    return True
+
+
+def workbook(params: Params, fmt: str) -> Path:
+    """
+    Write the synthetic sheet as ``fmt`` ("xlsx" or "xls"), cached in the
+    system temp directory.
+    """
+
+    path = Path(tempfile.gettempdir()) / f"xlea-bench-{params.tag}.{fmt}"
+    if path.exists():
+        return path
+
+    if fmt == "xlsx":
+        import openpyxl
+
+        book = openpyxl.Workbook(write_only=True)
+        sheet = book.create_sheet()
+        for row in synthetic_rows(params):
+            sheet.append(row)
+        book.save(path)
+    elif fmt == "xls":
+        import xlwt  # only needed to generate the benchmark files
+
+        if params.rows + params.preamble + params.header_rows > 65536:
+            raise ValueError(".xls sheets are limited to 65536 rows")
+        book = xlwt.Workbook()
+        sheet = book.add_sheet("Sheet1")
+        for r, row in enumerate(synthetic_rows(params)):
+            for c, value in enumerate(row):
+                if value is not None:
+                    sheet.write(r, c, value)
+        book.save(str(path))
+    else:
+        raise ValueError(f"Can't generate {fmt!r} workbooks")
+    return path
+
+
+def measure(
+    case: str,
+    run: Callable[[], int],
+    unit: str = "rows",
+    repeat: int = 3,
+) -> Result:
+    """
+    Time ``run`` (which returns the number of items it processed) ``repeat``
+    times, then run it once more under ``tracemalloc``.
+    """
+
+    best = float("inf")
+    items = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        case=case,
+        items=items,
+        unit=unit,
+        seconds=best,
+        per_second=items / best if best else float("inf"),
+        peak_rss_mb=peak_rss_mb(),
+        peak_bytes_per_item=peak / items if items else 0.0,
+    )
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: list[Result]):
+    path.write_text(json.dumps({r.case: r._asdict() for r in results}, indent=2) + "\n")
+
+
+def regressions(
+    results: list[Result],
+    baseline: dict[str, dict],
+    tolerance: float,
+) -> list[str]:
+    """
+    Describe every result slower or heavier than its baseline by more than
+    ``tolerance`` (a fraction). Cases missing from the baseline are ignored.
+    """
+
+    out = []
+    for r in results:
+        base: Optional[dict] = baseline.get(r.case)
+        if base is None:
+            continue
+        if r.per_second < base["per_second"] * (1 - tolerance):
+            out.append(
+                f"{r.case}: {r.per_second:,.0f} {r.unit}/s, "
+                f"baseline {base['per_second']:,.0f}"
+            )
+        for field in ("peak_rss_mb", "peak_bytes_per_item"):
+            # small absolute floor, so near-zero baselines don't flag noise
+            if getattr(r, field) > max(base[field], 1.0) * (1 + tolerance):
+                out.append(
+                    f"{r.case}: {field} {getattr(r, field):,.1f}, "
+                    f"baseline {base[field]:,.1f}"
+                )
+    return out
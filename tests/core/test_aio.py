@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from xlea import Schema, Column, ErrorReport, ReadStats, aread, aautoread
+from xlea.exc import HeaderNotFound, UnknownFileExtensionError
+
+
+class TrackingProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+        self.consumed = 0
+        self.closed = False
+
+    def rows(self):
+        try:
+            for row in self._rows:
+                self.consumed += 1
+                yield row
+        finally:
+            self.closed = True
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+def _rows(n: int) -> list[tuple]:
+    return [("ID", "Name")] + [(str(i), f"n{i}") for i in range(n)]
+
+
+def test_aread_yields_schema_rows():
+    async def main():
+        provider = TrackingProvider(_rows(2500))
+        rows = [(p.id, p.name) async for p in aread(provider, PersonSchema)]
+        return rows, provider.closed
+
+    rows, closed = asyncio.run(main())
+
+    assert rows == [(i, f"n{i}") for i in range(2500)]
+    assert closed
+
+
+def test_aread_forwards_read_options():
+    rows = _rows(100)
+    rows[6] = ("x", "bad")
+    stats, errors = ReadStats(), ErrorReport()
+
+    async def main():
+        return [
+            p.id
+            async for p in aread(
+                TrackingProvider(rows),
+                PersonSchema,
+                stats=stats,
+                errors=errors,
+                start=2,
+                stop=8,
+            )
+        ]
+
+    assert asyncio.run(main()) == [2, 3, 4, 6, 7]
+    assert errors.rows == [5]
+    assert stats.rows_read == 6
+
+
+def test_aread_applies_backpressure_and_closes_early():
+    """
+    The worker reads a bounded number of batches ahead and stops when the
+    consumer closes the iterator.
+
+    Arrange:
+        A large provider, small batches and a queue of two batches.
+
+    Act:
+        Consume one row, give the worker time to fill the queue, then close
+        the iterator.
+
+    Assert:
+        Only a few batches were read from the provider and the provider's
+        iterator was closed by the time ``aclose()`` returned.
+    """
+
+    async def main():
+        provider = TrackingProvider(_rows(100_000))
+        rows = aread(provider, PersonSchema, batch_size=10, queue_size=2)
+
+        first = await rows.__anext__()
+        await asyncio.sleep(0.1)
+        consumed = provider.consumed
+        await rows.aclose()
+        return first, consumed, provider.closed
+
+    first, consumed, closed = asyncio.run(main())
+
+    assert first.id == 0
+    assert consumed <= 1 + 4 * 10
+    assert closed
+
+
+def test_aread_propagates_errors():
+    async def main():
+        return [row async for row in aread(TrackingProvider([("x",)]), PersonSchema)]
+
+    with pytest.raises(HeaderNotFound):
+        asyncio.run(main())
+
+
+def test_aautoread_unknown_extension():
+    async def main():
+        return [row async for row in aautoread("data.unknown", schema=PersonSchema)]
+
+    with pytest.raises(UnknownFileExtensionError):
+        asyncio.run(main())
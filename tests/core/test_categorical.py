@@ -0,0 +1,142 @@
+from typing import Optional
+
+import pytest
+
+from xlea import Schema, Column, Categorical, config, read, read_columns
+from xlea.core.constants import DEFAULT_CATEGORICAL_LIMIT
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+def _city(name: str) -> str:
+    # a new str object per cell, as read from a workbook
+    return "".join([name, ""])
+
+
+class OrderSchema(Schema):
+    id: int = Column("ID")
+    city: str = Column("City", categorical=True)
+    level: int = Column("Level", categorical=True)
+
+
+@config(auto_categorical=True)
+class AutoOrderSchema(Schema):
+    id: str = Column("ID")
+    city: Optional[str] = Column("City")
+    level: int = Column("Level")
+
+
+ROWS = [("ID", "City", "Level")] + [
+    (str(i), _city(["Kazan", "Tula"][i % 2]), str(i % 3)) for i in range(10)
+]
+
+
+def test_categorical_values_are_shared():
+    """
+    Values of categorical columns are one shared instance per distinct
+    value in every row of a read.
+
+    Arrange:
+        Rows where every city cell is a distinct ``str`` object.
+
+    Act:
+        Read them with a schema declaring ``City`` categorical.
+
+    Assert:
+        Rows are read as usual and equal cities are the same object.
+    """
+    orders = list(read(ListProvider(ROWS), OrderSchema))
+
+    assert [o.city for o in orders[:3]] == ["Kazan", "Tula", "Kazan"]
+    assert orders[0].city is orders[2].city
+    assert orders[0]._row[1] is orders[8]._row[1]
+
+
+def test_short_rows_are_padded():
+    rows = [("ID", "City", "Level"), ("1", "Kazan"), ("2",)]
+
+    orders = list(read(ListProvider(rows), OrderSchema))
+
+    assert [o._row for o in orders] == [("1", "Kazan", None), ("2", None, None)]
+
+
+def test_columnar_categorical_codes():
+    batches = list(
+        read_columns(ListProvider(ROWS), OrderSchema, batch_size=4, as_numpy=False)
+    )
+
+    first, second, last = [batch["level"] for batch in batches]
+    assert first == Categorical([0, 1, 2, 0], [0, 1, 2])
+    assert second.categories[: len(first.categories)] == first.categories
+    assert last.values() == [2, 0]
+    assert batches[0]["city"].values() == ["Kazan", "Tula", "Kazan", "Tula"]
+    assert batches[0]["id"] == [0, 1, 2, 3]
+
+
+def test_columnar_categorical_codes_with_numpy():
+    np = pytest.importorskip("numpy")
+
+    (batch,) = read_columns(ListProvider(ROWS), OrderSchema)
+
+    assert batch["city"].codes.dtype == np.int32
+    assert batch["city"].categories == ["Kazan", "Tula"]
+
+
+def test_auto_categorical_detects_low_cardinality():
+    (batch,) = read_columns(ListProvider(ROWS), AutoOrderSchema, as_numpy=False)
+
+    assert isinstance(batch["city"], Categorical)
+    assert batch["id"] == [str(i) for i in range(10)]
+    assert batch["level"] == [i % 3 for i in range(10)]
+
+
+def test_auto_categorical_stops_interning_past_limit():
+    distinct = DEFAULT_CATEGORICAL_LIMIT + 1
+    rows = [("ID", "City", "Level")] + [
+        (_city("id"), _city(f"city {i % distinct}"), "1") for i in range(4 * distinct)
+    ]
+
+    orders = list(read(ListProvider(rows), AutoOrderSchema))
+
+    assert orders[0].id is orders[-1].id
+    assert orders[1].city is orders[1 + distinct].city
+    assert orders[-1].city == orders[-1 - distinct].city
+    assert orders[-1].city is not orders[-1 - distinct].city
+
+
+def test_equal_values_of_different_types_are_kept_apart():
+    """
+    Values that compare equal but differ in type are interned separately.
+
+    Arrange:
+        Rows mixing ``1``, ``True`` and ``1.0`` cells, which are equal and
+        hash the same.
+
+    Act:
+        Read them with an unannotated auto-categorical column and with a
+        ``str`` column declared categorical, as rows and as columns.
+
+    Assert:
+        Every cell keeps its own type and converts as in a plain read.
+    """
+
+    @config(auto_categorical=True)
+    class MixedSchema(Schema):
+        raw = Column("Raw")
+        text: str = Column("Text", categorical=True)
+
+    rows = [("Raw", "Text"), (1, 1), (True, True), (1.0, 1.0), (True, True)]
+
+    mixed = list(read(ListProvider(rows), MixedSchema))
+    (batch,) = read_columns(ListProvider(rows), MixedSchema, as_numpy=False)
+
+    assert [type(m.raw) for m in mixed] == [int, bool, float, bool]
+    assert [m.text for m in mixed] == ["1", "True", "1.0", "True"]
+    assert batch["text"].values() == ["1", "True", "1.0", "True"]
+    assert batch["text"].categories == ["1", "True", "1.0"]
@@ -0,0 +1,97 @@
+import pytest
+
+from xlea import Schema, Column, read_columns
+from xlea.exc import InvalidRowError
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: str = Column("ID")
+    age: int = Column("Age", validator=str.isnumeric, skip_invalid_row=True)
+    score: float = Column("Score", validator=lambda v: v != "bad")
+    city = Column("City", required=False, default="Voronezh")
+
+
+ROWS = [
+    ("ID", "Age", "Score"),
+    ("1", "30", "1.5"),
+    ("2", "n/a", "2"),
+    ("3", "12", "0"),
+]
+
+
+def test_pure_python_batches_are_column_lists():
+    """
+    Without NumPy every batch is a dict of converted column lists.
+
+    Arrange:
+        A header and three data rows, one of them rejected by a
+        ``skip_invalid_row`` validator.
+
+    Act:
+        Read columns in batches of two with ``as_numpy=False``.
+
+    Assert:
+        Two batches are produced, the invalid row is dropped and values
+        are converted using the schema annotations.
+    """
+    batches = list(
+        read_columns(ListProvider(ROWS), PersonSchema, batch_size=2, as_numpy=False)
+    )
+
+    assert batches == [
+        {"id": ["1"], "age": [30], "score": [1.5], "city": ["Voronezh"]},
+        {"id": ["3"], "age": [12], "score": [0.0], "city": ["Voronezh"]},
+    ]
+
+
+def test_numpy_batches_use_typed_arrays():
+    np = pytest.importorskip("numpy")
+
+    (batch,) = read_columns(ListProvider(ROWS), PersonSchema)
+
+    assert batch["age"].dtype == np.int64
+    assert batch["score"].dtype == np.float64
+    assert batch["id"].dtype == object
+    assert batch["age"].tolist() == [30, 12]
+    assert batch["id"].tolist() == ["1", "3"]
+
+
+def test_failing_validator_without_skip_raises():
+    rows = ROWS + [("4", "40", "bad")]
+
+    with pytest.raises(InvalidRowError):
+        list(read_columns(ListProvider(rows), PersonSchema, as_numpy=False))
+
+
+class MeasureSchema(Schema):
+    id: int = Column("ID")
+    score: float = Column("Score")
+
+
+def test_numpy_columns_of_typed_cells():
+    np = pytest.importorskip("numpy")
+    rows = [("ID", "Score"), (1, 1.5), (2, 2), (3, 0.5)]
+
+    (batch,) = read_columns(ListProvider(rows), MeasureSchema)
+
+    assert batch["id"].dtype == np.int64
+    assert batch["id"].tolist() == [1, 2, 3]
+    assert batch["score"].tolist() == [1.5, 2.0, 0.5]
+
+
+def test_numpy_conversion_error_keeps_its_cause():
+    pytest.importorskip("numpy")
+    rows = [("ID", "Score"), (1, 1.5), (2**70, 2.5)]
+
+    with pytest.raises(TypeError, match="'id'") as raised:
+        list(read_columns(ListProvider(rows), MeasureSchema))
+
+    assert isinstance(raised.value.__cause__, OverflowError)
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from xlea import Schema, Column, read
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+    city: str = Column("City", required=False, default="Voronezh")
+
+
+def test_interleaved_reads_keep_their_own_bindings():
+    """
+    Reads of one schema must not share column bindings.
+
+    Arrange:
+        Two providers with the schema columns in different orders, one of
+        them without the optional column.
+
+    Act:
+        Resolve both reads before consuming any row, then consume them
+        alternately.
+
+    Assert:
+        Every row object reports the values of its own file.
+    """
+    first = read(
+        ListProvider([("ID", "Name", "City"), ("1", "Alice", "Moscow")]),
+        schema=PersonSchema,
+    )
+    second = read(
+        ListProvider([("Name", "ID"), ("Bob", "2")]),
+        schema=PersonSchema,
+    )
+
+    alice = next(first)
+    bob = next(second)
+
+    assert alice.asdict() == {"id": 1, "name": "Alice", "city": "Moscow"}
+    assert bob.asdict() == {"id": 2, "name": "Bob", "city": "Voronezh"}
+
+
+def test_parallel_reads_in_threads():
+    def job(n: int):
+        if n % 2:
+            rows = [("ID", "Name")] + [(str(i), f"n{i}") for i in range(500)]
+        else:
+            rows = [("Name", "ID")] + [(f"n{i}", str(i)) for i in range(500)]
+        return [(p.id, p.name) for p in read(ListProvider(rows), schema=PersonSchema)]
+
+    expected = [(i, f"n{i}") for i in range(500)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(job, range(32)))
+
+    assert all(result == expected for result in results)
@@ -0,0 +1,143 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Literal, Optional, Union
+
+import pytest
+
+from xlea import Schema, Column, read, register_converter
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class Status(Enum):
+    ACTIVE = 1
+    CLOSED = 2
+
+
+class Account(Schema):
+    id: int = Column("ID")
+    note: Optional[str] = Column("Note")
+    amount: Decimal = Column("Amount")
+    opened: date = Column("Opened")
+    updated: datetime = Column("Updated")
+    active: bool = Column("Active")
+    status: Status = Column("Status")
+    kind: Literal["retail", "corporate"] = Column("Kind")
+    code: Union[int, str] = Column("Code")
+
+
+HEADER = (
+    "ID",
+    "Note",
+    "Amount",
+    "Opened",
+    "Updated",
+    "Active",
+    "Status",
+    "Kind",
+    "Code",
+)
+
+
+def test_annotations_are_converted():
+    """
+    Values are converted according to the full annotation of each column.
+
+    Arrange:
+        Rows as produced by different providers: xlrd floats and Excel
+        serial dates, text from CSV files, native values from openpyxl.
+
+    Act:
+        Read them with a schema using rich annotations.
+
+    Assert:
+        Every value has the annotated type.
+    """
+    rows = [
+        HEADER,
+        (3.0, None, 0.1, 45000, 45000.5, "yes", 1.0, "retail", 12.0),
+        (
+            "4",
+            "",
+            "10.50",
+            "2023-03-15",
+            datetime(2023, 1, 2),
+            0,
+            "CLOSED",
+            "corporate",
+            "A1",
+        ),
+    ]
+
+    first, second = read(ListProvider(rows), Account)
+
+    assert first.asdict() == {
+        "id": 3,
+        "note": None,
+        "amount": Decimal("0.1"),
+        "opened": date(2023, 3, 15),
+        "updated": datetime(2023, 3, 15, 12),
+        "active": True,
+        "status": Status.ACTIVE,
+        "kind": "retail",
+        "code": 12,
+    }
+    assert second.asdict() == {
+        "id": 4,
+        "note": None,
+        "amount": Decimal("10.50"),
+        "opened": date(2023, 3, 15),
+        "updated": datetime(2023, 1, 2),
+        "active": False,
+        "status": Status.CLOSED,
+        "kind": "corporate",
+        "code": "A1",
+    }
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [("id", 3.5), ("active", "maybe"), ("status", 7), ("kind", "private")],
+)
+def test_invalid_values_raise_type_error(column, value):
+    row = [3, None, 1, 45000, 45000, True, 1, "retail", 1]
+    row[[a for a in Account.__annotations__].index(column)] = value
+
+    account = next(read(ListProvider([HEADER, tuple(row)]), Account))
+
+    with pytest.raises(TypeError, match=f"column '{column}'"):
+        getattr(account, column)
+
+
+def test_registered_converter_is_used():
+    class Money:
+        def __init__(self, cents: int):
+            self.cents = cents
+
+    register_converter(Money, lambda value: Money(round(float(value) * 100)))
+
+    class Payment(Schema):
+        total: Money = Column("Total")
+
+    payment = next(read(ListProvider([("Total",), ("12.34",)]), Payment))
+
+    assert payment.total.cents == 1234
+
+
+def test_string_annotations_are_resolved():
+    class Late(Schema):
+        when: "Optional[date]" = Column("When")
+
+    rows = [("When",), (45000,), (None,)]
+
+    assert [r.when for r in read(ListProvider(rows), Late)] == [
+        date(2023, 3, 15),
+        None,
+    ]
@@ -0,0 +1,108 @@
+from xlea import Schema, Column, ErrorReport, ReadStats, read
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID", validator=lambda v: v != "", skip_invalid_row=True)
+    age: int = Column("Age", validator=lambda v: v != "-")
+    name: str = Column("Name")
+
+
+def test_errors_are_collected_instead_of_raised():
+    """
+    In collect-errors mode every invalid cell is reported and valid rows
+    are still returned.
+
+    Arrange:
+        Rows with a failed validator, an unconvertible value, a row with
+        two errors and a row skipped by a ``skip_invalid_row`` validator.
+
+    Act:
+        Read them with an ``ErrorReport``.
+
+    Assert:
+        Only valid rows are returned, every error is reported with its row
+        index, column, raw value and reason, and skipped rows are not.
+    """
+    rows = [
+        ("ID", "Age", "Name"),
+        ("1", "30", "Alice"),
+        ("2", "-", "Bob"),
+        ("3", "old", "Carol"),
+        ("x", "-", "Dave"),
+        ("", "-", "Nobody"),
+        ("6", "41", "Eve"),
+    ]
+    errors = ErrorReport()
+
+    persons = [
+        (p.row_index, p.id, p.age)
+        for p in read(ListProvider(rows), PersonSchema, errors=errors)
+    ]
+
+    assert persons == [(0, 1, 30), (5, 6, 41)]
+    assert errors.rows == [1, 2, 3, 3]
+    assert errors.columns == ["age", "age", "id", "age"]
+    assert errors.values == ["-", "old", "x", "-"]
+    assert errors.reasons[0] == "validation failed"
+    assert "column 'age'" in errors.reasons[1]
+    assert (errors.total, errors.invalid_rows) == (4, 3)
+    assert errors.by_column == {"age": 3, "id": 1}
+    assert list(errors)[2] == (3, "id", "x", errors.reasons[2])
+    assert errors.asdict()["row"] == errors.rows
+    assert not errors.truncated
+
+
+def test_stored_errors_are_capped():
+    rows = [("ID", "Age", "Name")] + [(str(i), "-", "n") for i in range(100)]
+    errors = ErrorReport(max_errors=10)
+
+    assert list(read(ListProvider(rows), PersonSchema, errors=errors)) == []
+
+    assert len(errors) == 10
+    assert errors.total == errors.invalid_rows == 100
+    assert errors.by_column["age"] == 100
+    assert errors.truncated
+
+
+def test_errors_with_stats():
+    rows = [
+        ("ID", "Age", "Name"),
+        ("1", "-", "A"),
+        ("2", "3", "B"),
+        ("", "4", "skipped"),
+        ("4", "x", "C"),
+        ("5", "-", "D"),
+    ]
+    stats, errors = ReadStats(), ErrorReport()
+
+    persons = list(read(ListProvider(rows), PersonSchema, stats=stats, errors=errors))
+
+    assert [p.age for p in persons] == [3]
+    assert errors.rows == [0, 3, 4]
+    assert (errors.total, errors.invalid_rows) == (3, 3)
+    assert (stats.rows_read, stats.rows_skipped) == (5, 1)
+
+
+def test_checked_rows_are_validated_and_converted_once():
+    calls = []
+
+    class CountedSchema(Schema):
+        age: int = Column("Age", validator=lambda v: calls.append(v) or True)
+        name: str = Column("Name")
+
+    rows = [("Age", "Name"), ("30", "Alice"), ("31", "Bob")]
+
+    (alice, bob) = read(ListProvider(rows), CountedSchema, errors=ErrorReport())
+
+    assert calls == ["30", "31"]
+    assert (alice.age, bob.age) == (30, 31)
+    assert alice._row == (30, "Alice")
+    assert bob.asdict() == {"age": 31, "name": "Bob"}
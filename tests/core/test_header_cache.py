@@ -0,0 +1,139 @@
+from xlea import Schema, Column, HeaderCache, read
+
+
+class CountingProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+        self.consumed = 0
+
+    def rows(self):
+        for row in self._rows:
+            self.consumed += 1
+            yield row
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+    city: str = Column("City", required=False, default="Voronezh")
+
+
+def _template(header=("Name", "x", "ID"), preamble=50):
+    data = {"Name": ("Alice", "Bob"), "x": ("", ""), "ID": ("1", "2")}
+    rows = [(f"report line {i}",) for i in range(preamble)]
+    rows.append(header)
+    rows += zip(*(data[name] for name in header))
+    return rows
+
+
+def test_cached_layout_is_reused(tmp_path):
+    """
+    A second read of the same template restores the header from the cache.
+
+    Arrange:
+        A cache and a template with a long preamble before the header.
+
+    Act:
+        Read the template twice.
+
+    Assert:
+        Both reads produce the same rows, the second one is a hit.
+    """
+    cache = HeaderCache(tmp_path / "headers.sqlite")
+
+    first = [
+        p.asdict()
+        for p in read(CountingProvider(_template()), PersonSchema, cache=cache)
+    ]
+    second = [
+        p.asdict()
+        for p in read(CountingProvider(_template()), PersonSchema, cache=cache)
+    ]
+
+    assert (
+        first
+        == second
+        == [
+            {"id": 1, "name": "Alice", "city": "Voronezh"},
+            {"id": 2, "name": "Bob", "city": "Voronezh"},
+        ]
+    )
+    assert cache.stats == (1, 1, 0, 0)
+    assert len(cache) == 1
+
+
+def test_files_with_new_data_share_the_layout(tmp_path):
+    """
+    Files sharing a template hit the cache whatever data they hold.
+
+    Arrange:
+        A cache and two files with the same preamble and header, followed
+        by different data rows.
+
+    Act:
+        Read both files with the cache.
+
+    Assert:
+        The second read is a hit and returns its own rows.
+    """
+    cache = HeaderCache(tmp_path / "headers.sqlite")
+    monday = _template()
+    tuesday = monday[:51] + [("Carol", "", "3"), ("Dave", "", "4")]
+
+    list(read(CountingProvider(monday), PersonSchema, cache=cache))
+    rows = list(read(CountingProvider(tuesday), PersonSchema, cache=cache))
+
+    assert [p.id for p in rows] == [3, 4]
+    assert cache.stats == (1, 1, 0, 0)
+
+
+def test_stale_layout_falls_back_to_search(tmp_path):
+    """
+    A cached layout whose header no longer matches is replaced.
+
+    Arrange:
+        Two files with the same leading rows, but the columns of the header
+        are in a different order in the second one.
+
+    Act:
+        Read both files with the cache.
+
+    Assert:
+        The second read finds the new bindings and counts a stale entry.
+    """
+    cache = HeaderCache(tmp_path / "headers.sqlite")
+
+    list(read(CountingProvider(_template()), PersonSchema, cache=cache))
+    rows = list(
+        read(
+            CountingProvider(_template(header=("ID", "x", "Name"))),
+            PersonSchema,
+            cache=cache,
+        )
+    )
+
+    assert [p.name for p in rows] == ["Alice", "Bob"]
+    assert cache.stats.stale == 1
+    assert cache.stats.misses == 2
+
+
+def test_eviction_by_size_and_age(tmp_path):
+    cache = HeaderCache(tmp_path / "headers.sqlite", max_entries=2)
+    for preamble in range(4):
+        list(
+            read(
+                CountingProvider(_template(preamble=preamble)),
+                PersonSchema,
+                cache=cache,
+            )
+        )
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 2
+
+    expired = HeaderCache(tmp_path / "headers.sqlite", max_age=-1)
+    list(read(CountingProvider(_template(preamble=3)), PersonSchema, cache=expired))
+
+    assert expired.stats.hits == 0
+    assert expired.stats.evictions == 3  # both old entries and the new one
+    assert len(expired) == 0
@@ -0,0 +1,100 @@
+import re
+
+import pytest
+
+from xlea import Schema, Column, config, read
+from xlea.core.bound_schema import schema_columns
+from xlea.core.matcher import HeaderMatcher
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class MixedSchema(Schema):
+    id: str = Column("ID")
+    name: str = Column("name", ignore_case=True)
+    age: str = Column(re.compile(r"^age\b", re.IGNORECASE), required=False)
+    score: str = Column(r"score$", regexp=True, required=False)
+    twice: str = Column(re.compile(r"(x)\1"), required=False)
+    city: str = Column(lambda v: v.startswith("City"), required=False)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "ID",
+        "id",
+        "NAME",
+        "Name ",
+        "Age",
+        "age group",
+        "page",
+        "final score",
+        "score 1",
+        "xx",
+        "x",
+        "City",
+        "Cityname",
+        "",
+        "None",
+    ],
+)
+def test_matcher_agrees_with_column_matching(value):
+    """
+    The compiled matcher reports exactly the columns whose own
+    ``matching()`` accepts the value, for every kind of pattern.
+    """
+    columns = schema_columns(MixedSchema)
+    matcher = HeaderMatcher(columns, ";")
+
+    expected = {attr for attr, col in columns.items() if col.matching(value)}
+
+    assert set(matcher.match(value)) == expected
+
+
+def test_one_cell_binds_several_regex_columns():
+    class Schema2(Schema):
+        first: str = Column(re.compile("foo"))
+        second: str = Column(re.compile("bar"))
+
+    row = next(read(ListProvider([("foo bar",), ("v",)]), schema=Schema2))
+
+    assert row.first == row.second == "v"
+
+
+def test_multirow_header_after_rejected_windows():
+    """
+    Windows that can't hold a hierarchical header are skipped cheaply
+    without hiding the real header.
+
+    Arrange:
+        A two-row header preceded by rows sharing some of its names.
+
+    Act:
+        Read the data row.
+
+    Assert:
+        Columns are bound to the flattened header, the last match wins.
+    """
+
+    @config(header_rows=2)
+    class ProfileSchema(Schema):
+        fio: str = Column("profile;FIO", ignore_case=True)
+        age: str = Column("profile;age")
+
+    rows = [
+        ("profile", "junk"),
+        ("other", "junk"),
+        ("profile", None, "profile"),
+        ("fio", "age", "age"),
+        ("Ivan", "30", "31"),
+    ]
+
+    row = next(read(ListProvider(rows), schema=ProfileSchema))
+
+    assert (row.fio, row.age) == ("Ivan", "31")
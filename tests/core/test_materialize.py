@@ -0,0 +1,82 @@
+import pytest
+
+from xlea import Schema, Column, config, read
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class CountingInt(int):
+    calls = 0
+
+    def __new__(cls, value):
+        cls.calls += 1
+        return super().__new__(cls, value)
+
+
+@config(materialize=True)
+class PersonSchema(Schema):
+    id: str = Column("ID")
+    age: CountingInt = Column("Age", validator=str.isnumeric, skip_invalid_row=True)
+    city: str = Column("City", required=False, default="Voronezh")
+
+    @property
+    def is_adult(self) -> bool:
+        return self.age >= 18
+
+
+def test_materialized_records_convert_once():
+    """
+    Materialized records convert every value once, at construction.
+
+    Arrange:
+        A schema configured with ``materialize=True`` whose ``age``
+        annotation counts conversions.
+
+    Act:
+        Read the rows and access ``age`` several times.
+
+    Assert:
+        Conversion ran once per row, invalid rows are skipped and schema
+        properties still work.
+    """
+    rows = [("ID", "Age"), ("1", "30"), ("2", "x"), ("3", "12")]
+    CountingInt.calls = 0
+
+    persons = list(read(ListProvider(rows), schema=PersonSchema))
+    ages = [p.age for p in persons] + [p.age for p in persons]
+
+    assert ages == [30, 12, 30, 12]
+    assert CountingInt.calls == 2
+    assert [p.is_adult for p in persons] == [True, False]
+    assert persons[0].asdict() == {"id": "1", "age": 30, "city": "Voronezh"}
+    assert persons[1].row_index == 2
+
+
+def test_materialized_records_have_no_instance_dict():
+    rows = [("ID", "Age"), ("1", "30")]
+
+    (person,) = read(ListProvider(rows), schema=PersonSchema)
+
+    assert not hasattr(person, "__dict__")
+    assert person["Age"] == 30
+    with pytest.raises(AttributeError):
+        person.unknown = 1
+
+
+def test_records_are_indexed_like_row_objects():
+    rows = [("Age", "Name", "ID"), ("30", "Alice", "1")]
+
+    (person,) = read(ListProvider(rows), schema=PersonSchema)
+
+    assert [person[0], person[1]] == [30, "1"]
+    assert person["ID"] == "1"
+    with pytest.raises(KeyError):
+        person["Name"]
+    with pytest.raises(IndexError):
+        person[2]
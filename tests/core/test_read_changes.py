@@ -0,0 +1,143 @@
+import pytest
+
+from xlea import Schema, Column, ChangeState, read_changes
+from xlea.exc import DuplicateKeyError
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PriceSchema(Schema):
+    sku: int = Column("SKU", key=True)
+    price: float = Column("Price", validator=lambda v: v != "", skip_invalid_row=True)
+
+
+HEADER = ("SKU", "Price")
+
+
+def _changes(rows, state, **options):
+    return [
+        (c.kind, c.key, None if c.row is None else c.row.price)
+        for c in read_changes(
+            ListProvider([HEADER] + rows), PriceSchema, state, **options
+        )
+    ]
+
+
+def test_only_changes_are_reported(tmp_path):
+    """
+    A second read reports added, changed and removed rows only.
+
+    Arrange:
+        A state filled by a first read of four rows.
+
+    Act:
+        Read again with one row changed, one removed, one added and one
+        rejected by a ``skip_invalid_row`` validator.
+
+    Assert:
+        Unchanged rows are not reported, the rejected row counts as
+        removed, and a third identical read reports nothing.
+    """
+    state = ChangeState(tmp_path / "state.sqlite")
+    first = [("1", "1.5"), ("2", "2.5"), ("3", "3.5"), ("4", "4.5")]
+    second = [("1", "1.5"), ("2", "9.0"), ("4", ""), ("5", "5.5")]
+
+    assert [c[0] for c in _changes(first, state)] == ["added"] * 4
+    assert _changes(second, state) == [
+        ("changed", (2,), 9.0),
+        ("added", (5,), 5.5),
+        ("removed", (3,), None),
+        ("removed", (4,), None),
+    ]
+    assert _changes(second, state) == []
+    assert len(state) == 3
+
+
+def test_state_is_kept_when_read_stops_early(tmp_path):
+    state = ChangeState(tmp_path / "state.sqlite")
+    rows = [("1", "1.5"), ("2", "2.5")]
+
+    changes = read_changes(ListProvider([HEADER] + rows), PriceSchema, state)
+    next(changes)
+    changes.close()
+
+    assert len(state) == 0
+    assert len(_changes(rows, state)) == 2
+
+
+def test_datasets_are_independent(tmp_path):
+    state = ChangeState(tmp_path / "state.sqlite")
+    rows = [("1", "1.5")]
+
+    _changes(rows, state, dataset="a")
+
+    assert _changes(rows, state, dataset="b") == [("added", (1,), 1.5)]
+    state.clear("a")
+    assert _changes(rows, state, dataset="a") == [("added", (1,), 1.5)]
+
+
+def test_duplicate_and_missing_keys(tmp_path):
+    state = ChangeState(tmp_path / "state.sqlite")
+
+    with pytest.raises(DuplicateKeyError):
+        _changes([("1", "1.5"), ("1", "2.5")], state)
+
+    class NoKey(Schema):
+        sku: int = Column("SKU")
+
+    with pytest.raises(ValueError):
+        list(read_changes(ListProvider([HEADER]), NoKey, state))
+
+
+def test_rows_skipped_before_key_check(tmp_path):
+    class SkuSchema(Schema):
+        sku = Column(
+            "SKU", key=True, validator=lambda v: v is not None, skip_invalid_row=True
+        )
+        price = Column("Price")
+
+    state = ChangeState(tmp_path / "state.sqlite")
+    rows = [HEADER, (None, None), ("1", "1.5"), (None, None)]
+
+    changes = list(read_changes(ListProvider(rows), SkuSchema, state))
+
+    assert [(c.kind, c.key) for c in changes] == [("added", ("1",))]
+
+
+def test_non_finite_keys_are_stored(tmp_path):
+    """
+    Keys that have no Python literal are read back from the state.
+
+    Arrange:
+        A state filled by a read of rows keyed by NaN and infinities.
+
+    Act:
+        Read again without them.
+
+    Assert:
+        They are reported as removed, and the next read succeeds.
+    """
+
+    class FloatSchema(Schema):
+        sku: float = Column("SKU", key=True)
+        price: float = Column("Price")
+
+    state = ChangeState(tmp_path / "state.sqlite")
+    rows = [(float("nan"), 1.0), (float("inf"), 2.0), (float("-inf"), 3.0)]
+
+    def changes(rows):
+        provider = ListProvider([HEADER] + rows)
+        return [(c.kind, c.key) for c in read_changes(provider, FloatSchema, state)]
+
+    assert len(changes(rows)) == 3
+    removed = changes([(1.0, 1.0)])
+    assert removed[0] == ("added", (1.0,))
+    assert [kind for kind, _ in removed[1:]] == ["removed"] * 3
+    assert sorted(repr(key) for _, (key,) in removed[1:]) == ["-inf", "inf", "nan"]
+    assert changes([(1.0, 1.0)]) == []
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import openpyxl
+import pytest
+
+from xlea import Schema, Column, read_many
+from xlea.exc import HeaderNotFound, UnknownFileExtensionError
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+def _write_xlsx(path, rows):
+    book = openpyxl.Workbook()
+    sheet = book.active
+    for row in rows:
+        sheet.append(row)
+    book.save(path)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_read_many_expands_globs_and_keeps_input_order(tmp_path, executor):
+    """
+    ``read_many`` reads every matched file and yields plain records.
+
+    Arrange:
+        Three workbooks with different column orders and one file with an
+        unknown extension.
+
+    Act:
+        Read a glob and the unknown file with ``ordered=True``.
+
+    Assert:
+        Results follow the input order, records are dictionaries and the
+        unknown extension is reported as an error instead of raised.
+    """
+    for n in range(3):
+        header = ("ID", "Name") if n % 2 else ("Name", "ID")
+        rows = [(n, f"p{n}") if n % 2 else (f"p{n}", n)]
+        _write_xlsx(tmp_path / f"part{n}.xlsx", [header, *rows])
+    (tmp_path / "notes.txt").write_text("ID,Name")
+
+    results = list(
+        read_many(
+            [str(tmp_path / "part*.xlsx"), tmp_path / "notes.txt"],
+            PersonSchema,
+            executor=executor,
+            workers=2,
+        )
+    )
+
+    assert [r.path.name for r in results] == [
+        "part0.xlsx",
+        "part1.xlsx",
+        "part2.xlsx",
+        "notes.txt",
+    ]
+    assert [r.records for r in results[:3]] == [
+        [{"id": n, "name": f"p{n}"}] for n in range(3)
+    ]
+    assert isinstance(results[3].error, UnknownFileExtensionError)
+
+
+def test_read_many_captures_per_file_errors(tmp_path):
+    _write_xlsx(tmp_path / "good.xlsx", [("ID", "Name"), (1, "Alice")])
+    _write_xlsx(tmp_path / "bad.xlsx", [("ID", "Surname"), (1, "Smith")])
+
+    results = {
+        r.path.name: r
+        for r in read_many(
+            [tmp_path / "good.xlsx", tmp_path / "bad.xlsx"],
+            PersonSchema,
+            executor="thread",
+            ordered=False,
+        )
+    }
+
+    assert results["good.xlsx"].ok
+    assert not results["bad.xlsx"].ok
+    assert isinstance(results["bad.xlsx"].error, HeaderNotFound)
+    assert results["bad.xlsx"].records is None
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_read_many_bounds_files_in_flight(tmp_path, ordered):
+    for n in range(10):
+        _write_xlsx(tmp_path / f"part{n}.xlsx", [("ID", "Name"), (n, f"p{n}")])
+
+    with RecordingExecutor() as executor:
+        results = read_many(
+            str(tmp_path / "part*.xlsx"),
+            PersonSchema,
+            executor=executor,
+            workers=1,
+            ordered=ordered,
+        )
+        first = next(results)
+        submitted = executor.submitted
+        rest = list(results)
+
+    assert submitted == 3
+    assert sorted(r.records[0]["id"] for r in [first, *rest]) == list(range(10))
@@ -0,0 +1,95 @@
+import logging
+
+from xlea import Schema, Column, ReadStats, config, log_stats, read
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID", validator=lambda v: v != "", skip_invalid_row=True)
+    name: str = Column("Name")
+
+
+ROWS = [
+    ("Report",),
+    ("ID", "Name"),
+    ("1", "Alice"),
+    ("", "Nobody"),
+    ("2", "Bob"),
+]
+
+
+def test_stats_report_rows_and_timings():
+    """
+    Stats passed to ``read()`` describe where the read spent its time.
+
+    Arrange:
+        A provider with a preamble, a header and one row rejected by a
+        ``skip_invalid_row`` validator.
+
+    Act:
+        Read every row and access its attributes, then read again with
+        the same stats.
+
+    Assert:
+        Rows read and skipped are counted and accumulate, validation is
+        timed per attribute and conversion per type, and the sink is
+        called once per read.
+    """
+    finished = []
+    stats = ReadStats(sink=lambda s: finished.append(s.rows_read), tags={"v": 1})
+
+    for _ in range(2):
+        persons = [
+            (p.id, p.name) for p in read(ListProvider(ROWS), PersonSchema, stats=stats)
+        ]
+
+    assert persons == [(1, "Alice"), (2, "Bob")]
+    assert finished == [3, 6]
+    assert (stats.rows_read, stats.rows_skipped) == (6, 2)
+    assert set(stats.validation_seconds) == {"id"}
+    assert set(stats.conversion_seconds) == {"int", "str"}
+    assert stats.provider == "ListProvider"
+    assert stats.total_seconds >= stats.provider_seconds > 0
+    assert stats.resolve_seconds > 0
+    assert stats.rows_per_second > 0
+    assert stats.asdict()["v"] == 1
+
+
+def test_materialized_rows_and_raw_reads():
+    @config(materialize=True)
+    class Record(Schema):
+        id: int = Column("ID", validator=lambda v: v != "", skip_invalid_row=True)
+        name: str = Column("Name")
+
+    stats = ReadStats()
+    list(read(ListProvider(ROWS), Record, stats=stats))
+    assert set(stats.conversion_seconds) == {"int", "str"}
+
+    raw = ReadStats()
+    assert len(list(read(ListProvider(ROWS), stats=raw))) == 5
+    assert raw.rows_read == 5
+
+
+def test_log_stats_sink(caplog):
+    stats = ReadStats(sink=log_stats())
+
+    with caplog.at_level(logging.INFO, logger="xlea"):
+        list(read(ListProvider(ROWS), PersonSchema, stats=stats))
+
+    (record,) = caplog.records
+    assert record.xlea_stats["rows_read"] == 3
+    assert "rows_skipped=1" in record.getMessage()
+
+
+def test_reads_without_stats_are_not_instrumented():
+    bound = read(ListProvider(ROWS), PersonSchema)
+    person = next(bound)
+
+    assert person._plan.accessors["id"][1] == PersonSchema.id.converter
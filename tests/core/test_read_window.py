@@ -0,0 +1,82 @@
+import pytest
+
+from xlea import Schema, Column, ReadStats, read
+
+
+class CountingProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+        self.pulled = 0
+
+    def rows(self):
+        for row in self._rows:
+            self.pulled += 1
+            yield row
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+ROWS = [("Report",), ("ID", "Name")] + [(str(i), f"n{i}") for i in range(1000)]
+
+
+def test_start_and_stop_limit_the_rows_read():
+    """
+    Only the requested data rows are bound and the provider is not read
+    past ``stop``.
+
+    Arrange:
+        A provider counting the rows pulled from it.
+
+    Act:
+        Read data rows 10 to 15.
+
+    Assert:
+        Rows keep their index in the file and rows after the range are
+        never pulled.
+    """
+    provider = CountingProvider(ROWS)
+
+    persons = list(read(provider, PersonSchema, start=10, stop=15))
+
+    assert [(p.row_index, p.id) for p in persons] == [(i, i) for i in range(10, 15)]
+    assert provider.pulled <= 2 + 15 + 1
+
+
+def test_raw_rows_window():
+    rows = list(read(CountingProvider(ROWS), start=1, stop=3))
+
+    assert rows == [("ID", "Name"), ("0", "n0")]
+
+
+def test_sample_is_reproducible():
+    def sample(seed):
+        return [
+            p.id
+            for p in read(CountingProvider(ROWS), PersonSchema, sample=0.1, seed=seed)
+        ]
+
+    first = sample(7)
+
+    assert first == sample(7)
+    assert first != sample(8)
+    assert 50 < len(first) < 150
+    assert first == sorted(first)
+
+
+@pytest.mark.parametrize("schema", [PersonSchema, None])
+def test_sampled_reads_count_every_row_read(schema):
+    stats = ReadStats()
+
+    sampled = list(read(CountingProvider(ROWS), schema, stats=stats, sample=0.5))
+
+    assert len(sampled) < 600
+    assert stats.rows_read == (1000 if schema else 1002)
+
+
+@pytest.mark.parametrize("options", [{"start": -1}, {"sample": 0}, {"sample": 1.5}])
+def test_invalid_window(options):
+    with pytest.raises(ValueError):
+        read(CountingProvider(ROWS), PersonSchema, **options)
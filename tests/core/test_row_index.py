@@ -0,0 +1,148 @@
+import pytest
+
+from xlea import Schema, Column, ReadStats, read
+from xlea.exc import DuplicateKeyError
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+        self.closed = False
+
+    def rows(self):
+        return iter(self._rows)
+
+    def close(self):
+        self.closed = True
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID", validator=lambda v: v != "", skip_invalid_row=True)
+    team: str = Column("Team")
+    name: str = Column("Name")
+
+
+ROWS = [
+    ("ID", "Team", "Name"),
+    ("1", "red", "Alice"),
+    ("2", "blue", "Bob"),
+    ("", "red", "Nobody"),
+    ("1", "blue", "Carol"),
+    ("3", "red", "Dave"),
+]
+
+
+def test_index_by_builds_rows_on_lookup():
+    """
+    Rows are indexed by converted key values and only built when looked up.
+
+    Arrange:
+        Rows with a duplicated id and a row rejected by a
+        ``skip_invalid_row`` validator.
+
+    Act:
+        Index them by id, keeping the last row of each key.
+
+    Assert:
+        Keys are converted ids, lookups return rows with their row index,
+        skipped rows are left out and the provider is closed.
+    """
+    provider = ListProvider(ROWS)
+
+    by_id = read(provider, PersonSchema).index_by("id", on_duplicate="last")
+
+    assert list(by_id) == [2, 1, 3]
+    assert (by_id[1].name, by_id[1].row_index) == ("Carol", 3)
+    assert by_id[3].team == "red"
+    assert 4 not in by_id
+    assert by_id.get(4) is None
+    assert provider.closed
+
+
+def test_index_by_keeps_first_row():
+    by_id = read(ListProvider(ROWS), PersonSchema).index_by("id", on_duplicate="first")
+
+    assert by_id[1].name == "Alice"
+
+
+def test_index_by_raises_on_duplicate_key():
+    provider = ListProvider(ROWS)
+
+    with pytest.raises(DuplicateKeyError, match="rows 0 and 3"):
+        read(provider, PersonSchema).index_by("id")
+
+    assert provider.closed
+
+
+def test_index_by_several_attributes():
+    index = read(ListProvider(ROWS), PersonSchema).index_by("id", "team")
+
+    assert set(index) == {(1, "red"), (2, "blue"), (1, "blue"), (3, "red")}
+    assert index[1, "blue"].name == "Carol"
+
+
+def test_group_by():
+    teams = read(ListProvider(ROWS), PersonSchema).group_by("team")
+
+    assert [p.name for p in teams["red"]] == ["Alice", "Dave"]
+    assert teams.count("blue") == 2
+    assert teams.count("green") == 0
+
+
+def test_unique_keeps_file_order():
+    rows = read(ListProvider(ROWS), PersonSchema)
+
+    assert [p.name for p in rows.unique("id", on_duplicate="last")] == [
+        "Bob",
+        "Carol",
+        "Dave",
+    ]
+
+
+def test_unique_keeps_first_row_by_default():
+    names = [p.name for p in read(ListProvider(ROWS), PersonSchema).unique("id")]
+
+    assert names == ["Alice", "Bob", "Dave"]
+
+
+def test_index_with_stats():
+    stats = ReadStats()
+
+    index = read(ListProvider(ROWS), PersonSchema, stats=stats).index_by(
+        "id", on_duplicate="last"
+    )
+
+    assert len(index) == 3
+    assert (stats.rows_read, stats.rows_skipped) == (5, 1)
+
+
+def test_index_after_iteration_fails():
+    rows = read(ListProvider(ROWS), PersonSchema)
+    next(rows)
+
+    with pytest.raises(RuntimeError):
+        rows.index_by("id")
+
+
+def test_unknown_attribute_or_policy():
+    with pytest.raises(ValueError, match="no column"):
+        read(ListProvider(ROWS), PersonSchema).index_by("age")
+    with pytest.raises(ValueError, match="on_duplicate"):
+        read(ListProvider(ROWS), PersonSchema).unique("id", on_duplicate="any")
+
+
+def test_lookups_do_not_validate_rows_again():
+    calls = []
+
+    class CheckedSchema(Schema):
+        id: int = Column("ID", validator=lambda v: calls.append(v) or True)
+        team: str = Column("Team")
+
+    by_id = read(ListProvider(ROWS[:3]), CheckedSchema).index_by("id")
+    teams = read(ListProvider(ROWS[:3]), CheckedSchema).group_by("team")
+    del calls[:]
+
+    assert [by_id[1].team, by_id[2].team] == ["red", "blue"]
+    assert [p.id for p in teams["red"]] == [1]
+    assert len(teams) == 2
+    assert calls == []
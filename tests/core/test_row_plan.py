@@ -0,0 +1,71 @@
+import pytest
+
+from xlea import Schema, Column, read
+from xlea.core.bound_schema import BoundSchema
+from xlea.exc import InvalidRowError
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: str = Column("ID", validator=lambda v: v is not None)
+    age: str = Column("Age", validator=str.isnumeric, skip_invalid_row=True)
+    city: str = Column("City", required=False)
+
+
+def test_plan_is_compiled_once_per_read():
+    """
+    ``resolve()`` compiles a plan describing the bound columns.
+
+    Arrange:
+        A header with the schema columns out of declaration order and
+        an unrelated column in between.
+
+    Act:
+        Resolve the schema against the header.
+
+    Assert:
+        The plan exposes the max index, sorted indices, the name mapping
+        and only the columns that declare validators.
+    """
+    bound = BoundSchema(iter([("Age", "Other", "ID")]), PersonSchema).resolve()
+    plan = bound.plan
+
+    assert plan.max_index == 2
+    assert plan.indices == (0, 2)
+    assert dict(plan.index_by_name) == {"ID": 2, "Age": 0}
+    assert [index for index, _, _ in plan.validators] == [2, 0]
+
+
+def test_rows_use_plan_for_lookup_and_validation():
+    """
+    Row objects validate and index values through the shared plan.
+
+    Arrange:
+        A header, a valid row, a row skipped by ``skip_invalid_row`` and a
+        row failing a non-skipping validator.
+
+    Act:
+        Iterate over ``read()``.
+
+    Assert:
+        The valid row supports name and position lookup, the skipped row
+        is dropped and the failing row raises ``InvalidRowError``.
+    """
+    rows = [("ID", "Age"), ("1", "30"), ("2", "n/a"), ()]
+    persons = read(ListProvider(rows), schema=PersonSchema)
+
+    first = next(persons)
+    assert first["ID"] == "1"
+    assert first[1] == "30"
+    assert "Age" in first
+    assert "City" not in first
+
+    with pytest.raises(InvalidRowError):
+        next(persons)
@@ -0,0 +1,132 @@
+import csv
+import io
+import sqlite3
+
+import pytest
+
+from xlea import Schema, Column, config, read, to_arrow, to_csv, to_parquet, to_sqlite
+
+
+class ListProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+
+    def rows(self):
+        return iter(self._rows)
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+    score: float = Column("Score", required=False, default=0.0)
+
+
+@config(materialize=True)
+class PersonRecord(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+    score: float = Column("Score", required=False, default=0.0)
+
+
+ROWS = [("Name", "ID")] + [(f"n{i}", str(i)) for i in range(25)]
+
+
+@pytest.mark.parametrize("schema", [PersonSchema, PersonRecord])
+def test_astuple_follows_schema_order(schema):
+    row = next(read(ListProvider(ROWS), schema))
+
+    assert row.astuple() == (0, "n0", 0.0)
+    assert row.astuple() == tuple(row.asdict().values())
+
+
+@pytest.mark.parametrize("schema", [PersonSchema, PersonRecord])
+def test_to_sqlite_inserts_batches(schema):
+    """
+    Rows are inserted in batches into a table created from the schema.
+
+    Arrange:
+        25 rows and an in-memory database.
+
+    Act:
+        Insert them with a batch size not dividing the row count.
+
+    Assert:
+        Every row is inserted with converted values, in schema order.
+    """
+    conn = sqlite3.connect(":memory:")
+
+    count = to_sqlite(read(ListProvider(ROWS), schema), conn, "people", batch_size=10)
+
+    assert count == 25
+    assert conn.execute("SELECT * FROM people ORDER BY id LIMIT 2").fetchall() == [
+        (0, "n0", 0.0),
+        (1, "n1", 0.0),
+    ]
+    assert [c[1] for c in conn.execute("PRAGMA table_info(people)")] == [
+        "id",
+        "name",
+        "score",
+    ]
+
+
+def test_to_sqlite_path_and_empty_input(tmp_path):
+    path = tmp_path / "db.sqlite"
+
+    assert to_sqlite(read(ListProvider(ROWS), PersonSchema), path, "people") == 25
+    assert to_sqlite(read(ListProvider(ROWS[:1]), PersonSchema), path, "people") == 0
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT count(*) FROM people").fetchone() == (25,)
+
+
+def test_to_csv(tmp_path):
+    buffer = io.StringIO(newline="")
+
+    assert to_csv(read(ListProvider(ROWS), PersonSchema), buffer, batch_size=7) == 25
+
+    rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+    assert rows[:2] == [["id", "name", "score"], ["0", "n0", "0.0"]]
+    assert len(rows) == 26
+
+    path = tmp_path / "people.csv"
+    to_csv(read(ListProvider(ROWS), PersonSchema), path, header=False, delimiter=";")
+    assert path.read_text().splitlines()[0] == "0;n0;0.0"
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    table = to_arrow(read(ListProvider(ROWS), PersonSchema), batch_size=10)
+
+    assert table.num_rows == 25
+    assert table.schema.field("id").type == pa.int64()
+    assert table.column("name")[1].as_py() == "n1"
+
+
+def test_to_parquet_with_null_first_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from typing import Optional
+
+    class Note(Schema):
+        id: int = Column("ID")
+        note: Optional[str] = Column("Note")
+
+    rows = [("ID", "Note")] + [(i, None if i < 10 else "x") for i in range(20)]
+    path = tmp_path / "notes.parquet"
+
+    assert to_parquet(read(ListProvider(rows), Note), path, batch_size=10) == 20
+
+    table = pq.read_table(path)
+    assert table.column("note").to_pylist() == [None] * 10 + ["x"] * 10
+
+
+def test_arrow_sinks_reject_empty_reads(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "empty.parquet"
+
+    with pytest.raises(ValueError, match="empty read"):
+        to_arrow(read(ListProvider(ROWS[:1]), PersonSchema))
+    with pytest.raises(ValueError, match="empty read"):
+        to_parquet(read(ListProvider(ROWS[:1]), PersonSchema), path)
+
+    assert not path.exists()
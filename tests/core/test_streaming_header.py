@@ -0,0 +1,117 @@
+import pytest
+
+from xlea import Schema, Column, config, read
+from xlea.core.bound_schema import BoundSchema
+from xlea.core.constants import DEFAULT_HEADER_SCAN_DEPTH
+from xlea.exc import HeaderNotFound
+
+
+class PersonSchema(Schema):
+    id: str = Column("ID")
+    name: str = Column("Name")
+
+
+class CountingProvider:
+    def __init__(self, rows: list[tuple], *args, **kwargs):
+        self._rows = rows
+        self.consumed = 0
+
+    def rows(self):
+        for row in self._rows:
+            self.consumed += 1
+            yield row
+
+
+def test_rows_are_streamed_after_header():
+    """
+    Only the rows up to the header are buffered before data is yielded.
+
+    Arrange:
+        A provider with two preamble rows, a header and many data rows,
+        counting how many rows were pulled from it.
+
+    Act:
+        Take the first object from ``read()``.
+
+    Assert:
+        The provider has produced exactly the preamble, the header and
+        the first data row.
+    """
+    rows = [("Report",), (), ("ID", "Name")]
+    rows += [(str(i), f"name {i}") for i in range(1000)]
+    provider = CountingProvider(rows)
+
+    persons = read(provider, schema=PersonSchema)
+    first = next(persons)
+
+    assert first.id == "0"
+    assert provider.consumed == 4
+    assert len(list(persons)) == 999
+
+
+def test_header_scan_depth_limits_lookahead():
+    """
+    ``header_scan_depth`` bounds how many rows are inspected for the header.
+
+    Arrange:
+        A schema that scans at most two rows and a provider whose header
+        is on the third row.
+
+    Act:
+        Call ``read()`` and start iterating.
+
+    Assert:
+        ``HeaderNotFound`` is raised after at most two rows were pulled.
+    """
+
+    @config(header_scan_depth=2)
+    class ShallowSchema(Schema):
+        id: str = Column("ID")
+
+    provider = CountingProvider([(), (), ("ID",), ("1",)])
+
+    with pytest.raises(HeaderNotFound):
+        next(read(provider, schema=ShallowSchema))
+
+    assert provider.consumed == 2
+
+
+def test_header_scan_is_bounded_by_default():
+    rows = [()] * DEFAULT_HEADER_SCAN_DEPTH + [("ID", "Name"), ("1", "Alice")]
+
+    @config(header_scan_depth=None)
+    class DeepSchema(Schema):
+        name: str = Column("Name")
+
+    provider = CountingProvider(rows)
+    with pytest.raises(HeaderNotFound):
+        next(read(provider, schema=PersonSchema))
+
+    assert provider.consumed == DEFAULT_HEADER_SCAN_DEPTH
+    assert next(read(CountingProvider(rows), schema=DeepSchema)).name == "Alice"
+
+
+def test_header_search_keeps_only_the_current_window():
+    @config(header_rows=2)
+    class TwoRowSchema(Schema):
+        id: str = Column("Person;ID")
+
+    cached = []
+
+    def rows():
+        for i in range(50):
+            cached.append(len(bound._cells))
+            yield (f"note {i}",)
+        yield ("Person",)
+        yield ("ID",)
+
+    bound = BoundSchema(rows(), TwoRowSchema)
+
+    assert bound.resolve()._data_row == 52
+    assert max(cached) <= 2
+
+
+def test_read_without_schema_returns_raw_rows():
+    rows = [("ID", "Name"), ("1", "Alice")]
+
+    assert list(read(CountingProvider(rows))) == rows
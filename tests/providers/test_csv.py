@@ -0,0 +1,57 @@
+import pytest
+
+from xlea import Schema, Column, autoread, read
+from xlea.providers.csv import CSVProvider, TSVProvider
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+def test_csv_dialect_and_encoding_are_sniffed(tmp_path):
+    """
+    The CSV provider detects the BOM encoding and the delimiter.
+
+    Arrange:
+        A UTF-8 file with a byte order mark, ``;`` delimiters and a
+        quoted field containing a delimiter.
+
+    Act:
+        Read it through ``autoread`` with a schema.
+
+    Assert:
+        Rows are split on ``;`` and the BOM is not part of the header.
+    """
+    path = tmp_path / "persons.csv"
+    path.write_text('ID;Name\n1;"Doe; John"\n2;Ивана\n', encoding="utf-8-sig")
+
+    persons = [p.asdict() for p in autoread(path, schema=PersonSchema)]
+
+    assert persons == [{"id": 1, "name": "Doe; John"}, {"id": 2, "name": "Ивана"}]
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_csv_rows_are_tuples(tmp_path, use_mmap):
+    path = tmp_path / "persons.csv"
+    path.write_bytes('ID,Name\r\n1,"multi\r\nline"\r\n2,Bob\r\n'.encode("cp1252"))
+
+    rows = list(read(CSVProvider(path, use_mmap=use_mmap)))
+
+    assert rows == [("ID", "Name"), ("1", "multi\r\nline"), ("2", "Bob")]
+
+
+def test_non_utf8_prefix_uses_fallback_encoding(tmp_path):
+    path = tmp_path / "persons.csv"
+    path.write_bytes("ID,Name\n1,Андрей\n".encode("cp1251"))
+
+    rows = list(read(CSVProvider(path, fallback_encoding="cp1251")))
+
+    assert rows[1] == ("1", "Андрей")
+
+
+def test_tsv_provider_defaults_to_tab(tmp_path):
+    path = tmp_path / "persons.tsv"
+    path.write_text("ID\tName\n1\tA,B\n")
+
+    assert list(read(TSVProvider(path))) == [("ID", "Name"), ("1", "A,B")]
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+from xlea import register_provider
+from xlea.providers import providers
+
+
+def test_import_does_not_load_parsing_libraries():
+    """
+    ``import xlea`` must not import any parsing library.
+
+    Arrange:
+        A fresh interpreter.
+
+    Act:
+        Import ``xlea`` and list the loaded provider libraries.
+
+    Assert:
+        None of openpyxl, xlrd, pyxlsb or numpy has been imported.
+    """
+    code = (
+        "import sys, xlea; "
+        "print([m for m in ('openpyxl', 'xlrd', 'pyxlsb', 'numpy') if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_registered_entry_point_is_imported_on_first_lookup():
+    register_provider("LAZY", "xlea.providers.xlrd:XLRDProvider")
+
+    assert providers._PROVIDERS[".lazy"] == "xlea.providers.xlrd:XLRDProvider"
+
+    provider = providers.select_by_extension(".lazy")
+
+    from xlea.providers.xlrd import XLRDProvider
+
+    assert provider is XLRDProvider
+    assert providers._PROVIDERS[".lazy"] is XLRDProvider
+    del providers._PROVIDERS[".lazy"]
+
+
+def test_unknown_extension_returns_none():
+    assert providers.select_by_extension(".unknown") is None
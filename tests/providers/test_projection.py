@@ -0,0 +1,136 @@
+import openpyxl
+import pytest
+
+from xlea import Schema, Column, read
+from xlea.providers.csv import CSVProvider
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlrd import XLRDProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+ROWS = [
+    ("Report",),
+    ("ID", "Skip", "Name", "Skip too", "Age"),
+    (1, "x", "Alice", "y", 30),
+    (),
+    (2, "x", "Bob"),
+]
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+    age: int = Column("Age", required=False, default=0)
+
+
+def _write_xlsx(path):
+    book = openpyxl.Workbook()
+    for row in ROWS:
+        book.active.append(row)
+    book.save(path)
+
+
+def _write_xls(path):
+    xlwt = pytest.importorskip("xlwt")
+    book = xlwt.Workbook()
+    sheet = book.add_sheet("Sheet1")
+    for r, row in enumerate(ROWS):
+        for c, value in enumerate(row):
+            sheet.write(r, c, value)
+    book.save(str(path))
+
+
+def _write_csv(path):
+    path.write_text("\n".join(",".join(map(str, row)) for row in ROWS) + "\n")
+
+
+def _normalize(value):
+    # xlrd returns floats and empty strings, csv returns strings
+    if value is None or value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+PROVIDERS = [
+    ("book.xlsx", _write_xlsx, OpenPyXlProvider),
+    ("book.xlsx", _write_xlsx, XLSXStreamProvider),
+    ("book.xls", _write_xls, XLRDProvider),
+    ("book.csv", _write_csv, CSVProvider),
+]
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_iter_rows_projects_columns(tmp_path, name, write, provider):
+    """
+    ``iter_rows`` starts at the given row and keeps only the given columns.
+
+    Arrange:
+        The same table written in every supported format.
+
+    Act:
+        Read from the first data row, keeping columns 0, 2 and 4.
+
+    Assert:
+        Every provider yields the same three-value rows, padded with
+        ``None`` for cells missing in the file.
+    """
+    path = tmp_path / name
+    write(path)
+
+    rows = [
+        tuple(map(_normalize, row))
+        for row in provider(path).iter_rows(start=2, columns=[0, 2, 4])
+    ]
+
+    assert rows == [
+        ("1", "Alice", "30"),
+        (None, None, None),
+        ("2", "Bob", None),
+    ]
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_rows_only_keep_bound_columns(tmp_path, name, write, provider):
+    path = tmp_path / name
+    write(path)
+
+    persons = read(provider(path), schema=PersonSchema)
+    alice = next(persons)
+
+    assert len(alice._row) == 3
+    assert (alice.id, alice.name, alice.age) == (1, "Alice", 30)
+    assert alice["Name"] == "Alice"
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_iter_rows_stops_early(tmp_path, name, write, provider):
+    path = tmp_path / name
+    write(path)
+
+    rows = list(provider(path).iter_rows(start=1, columns=[0, 2], stop=3))
+
+    assert [tuple(map(_normalize, row)) for row in rows] == [
+        ("ID", "Name"),
+        ("1", "Alice"),
+    ]
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_read_window(tmp_path, name, write, provider):
+    path = tmp_path / name
+    write(path)
+
+    persons = list(read(provider(path), schema=PersonSchema, start=2))
+
+    assert [(p.row_index, p.id, p.name) for p in persons] == [(2, 2, "Bob")]
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_empty_read_window(tmp_path, name, write, provider):
+    path = tmp_path / name
+    write(path)
+
+    assert list(read(provider(path), stop=0)) == []
+    assert list(read(provider(path), start=3, stop=2)) == []
+    assert list(read(provider(path), schema=PersonSchema, stop=0)) == []
@@ -0,0 +1,187 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import openpyxl
+import pytest
+
+from xlea import Schema, Column, ErrorReport, read, read_parallel, register_provider
+from xlea.core import parallel
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+ROWS = [("Report",), ("ID", "Name")] + [(i, f"name {i}") for i in range(1, 101)]
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+def _write_xlsx(path, rows=ROWS, write_only=False):
+    book = openpyxl.Workbook(write_only=write_only)
+    sheet = book.create_sheet() if write_only else book.active
+    for row in rows:
+        sheet.append(row)
+    book.save(path)
+
+
+def _write_xls(path):
+    xlwt = pytest.importorskip("xlwt")
+    book = xlwt.Workbook()
+    sheet = book.add_sheet("Sheet1")
+    for r, row in enumerate(ROWS):
+        for c, value in enumerate(row):
+            sheet.write(r, c, value)
+    book.save(str(path))
+
+
+@pytest.fixture(params=[OpenPyXlProvider, XLSXStreamProvider])
+def xlsx_provider(request):
+    register_provider(".xlsx", request.param)
+    yield request.param
+    register_provider(".xlsx", OpenPyXlProvider)
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_ranges_are_merged_in_order(tmp_path, xlsx_provider, write_only):
+    """
+    Rows read in parallel ranges are the rows of a sequential read.
+
+    Arrange:
+        A sheet with a preamble, with and without a declared dimension.
+
+    Act:
+        Read it in ranges of 7 rows in a thread pool.
+
+    Assert:
+        Every row is produced once, in file order, with its index.
+    """
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path, write_only=write_only)
+
+    persons = read_parallel(
+        path, PersonSchema, executor="thread", workers=3, shard_rows=7
+    )
+
+    assert [(p.row_index, p.id, p.name) for p in persons] == [
+        (i, i + 1, f"name {i + 1}") for i in range(100)
+    ]
+
+
+def test_process_pool_and_read_options(tmp_path):
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+    errors = ErrorReport()
+
+    persons = read_parallel(
+        path,
+        PersonSchema,
+        workers=2,
+        shard_rows=30,
+        provider=XLSXStreamProvider,
+        start=5,
+        stop=95,
+        errors=errors,
+    )
+
+    assert [p.id for p in persons] == list(range(6, 96))
+    assert not errors
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_providers_without_seek_are_read_sequentially(tmp_path):
+    path = tmp_path / "book.xls"
+    _write_xls(path)
+
+    with RecordingExecutor() as executor:
+        persons = list(
+            read_parallel(path, PersonSchema, executor=executor, shard_rows=10)
+        )
+
+    assert [p.id for p in persons] == list(range(1, 101))
+    assert executor.submitted == 0
+
+
+def test_registered_provider_is_kept(tmp_path):
+    """
+    ``.xlsx`` files are read with the registered provider unless another
+    one is given.
+
+    Arrange:
+        A sheet with a datetime cell, ``OpenPyXlProvider`` registered for
+        ``.xlsx``.
+
+    Act:
+        Read it with ``read_parallel()``, with and without the streaming
+        provider.
+
+    Assert:
+        The default read returns the values of ``read()``, the streaming
+        one the stored Excel serial.
+    """
+
+    class StampSchema(Schema):
+        stamp = Column("Stamp")
+
+    path = tmp_path / "stamps.xlsx"
+    _write_xlsx(path, [("Stamp",), (datetime(2024, 5, 1, 12),)])
+
+    with RecordingExecutor() as executor:
+        (row,) = read_parallel(path, StampSchema, executor=executor)
+        (streamed,) = read_parallel(
+            path, StampSchema, executor=executor, provider=XLSXStreamProvider
+        )
+
+    assert row.stamp == datetime(2024, 5, 1, 12)
+    assert streamed.stamp == 45413.5
+    assert executor.submitted == 1
+
+
+def test_pool_is_created_on_first_rows(tmp_path, monkeypatch):
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+    pools = []
+    make_pool = parallel._make_pool
+    monkeypatch.setattr(
+        parallel, "_make_pool", lambda *args: pools.append(1) or make_pool(*args)
+    )
+
+    persons = read_parallel(
+        path,
+        PersonSchema,
+        executor="thread",
+        shard_rows=10,
+        provider=XLSXStreamProvider,
+    )
+    assert pools == []
+
+    assert next(persons).id == 1
+    persons.close()
+    assert pools == [1]
+
+    with pytest.raises(ValueError, match="Unknown executor"):
+        read_parallel(path, PersonSchema, executor="fiber")
+
+
+def test_xlsx_stream_seeks_to_start(tmp_path):
+    rows = [("ID", "Name")] + [(i, f"n{i}") if i % 3 else () for i in range(1, 60)]
+    path = tmp_path / "sparse.xlsx"
+    _write_xlsx(path, rows)
+    provider = XLSXStreamProvider(path)
+    expected = [tuple(r) for r in provider.iter_rows()]
+
+    for start in range(0, 65, 4):
+        assert list(provider.iter_rows(start=start)) == expected[start:]
+        assert list(provider.iter_rows(start=start, stop=start + 5)) == (
+            expected[start : start + 5]
+        )
+    assert provider.row_count() == 60
@@ -0,0 +1,192 @@
+import gc
+import os
+from functools import partial
+
+import openpyxl
+import pytest
+
+from xlea import Schema, Column, autoread, read
+from xlea.exc import HeaderNotFound
+from xlea.providers.csv import CSVProvider
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlrd import XLRDProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+# Open file limits are commonly 1024 to 4096 descriptors, a leak of one
+# descriptor per read exhausts them well before the last iteration.
+ITERATIONS = 10_000
+
+ROWS = [("ID", "Name")] + [(i, f"name {i}") for i in range(20)]
+
+pytestmark = pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd"
+)
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+class MissingSchema(Schema):
+    id: int = Column("Missing")
+
+
+def _write_xlsx(path):
+    book = openpyxl.Workbook()
+    for row in ROWS:
+        book.active.append(row)
+    book.save(path)
+
+
+def _write_xls(path):
+    xlwt = pytest.importorskip("xlwt")
+    book = xlwt.Workbook()
+    sheet = book.add_sheet("Sheet1")
+    for r, row in enumerate(ROWS):
+        for c, value in enumerate(row):
+            sheet.write(r, c, value)
+    book.save(str(path))
+
+
+def _write_csv(path):
+    path.write_text("\n".join(",".join(map(str, row)) for row in ROWS) + "\n")
+
+
+def _open_fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+def _exhaust(provider):
+    assert len(list(read(provider, PersonSchema))) == 20
+
+
+def _break_early(provider):
+    for _ in read(provider, PersonSchema):
+        break
+
+
+def _break_raw(provider):
+    for _ in read(provider):
+        break
+
+
+def _fail(provider):
+    with pytest.raises(HeaderNotFound):
+        next(read(provider, MissingSchema))
+
+
+def _close_unread(provider):
+    read(provider, PersonSchema).close()
+
+
+READS = (_exhaust, _break_early, _break_raw, _fail, _close_unread)
+
+
+@pytest.mark.parametrize(
+    "name, write, provider, iterations",
+    [
+        ("data.csv", _write_csv, partial(CSVProvider, delimiter=","), ITERATIONS),
+        pytest.param(
+            "data.csv",
+            _write_csv,
+            partial(CSVProvider, use_mmap=True),
+            ITERATIONS,
+            marks=pytest.mark.slow,
+        ),
+        pytest.param(
+            "book.xlsx",
+            _write_xlsx,
+            XLSXStreamProvider,
+            ITERATIONS,
+            marks=pytest.mark.slow,
+        ),
+        pytest.param(
+            "book.xlsx",
+            _write_xlsx,
+            OpenPyXlProvider,
+            ITERATIONS,
+            marks=pytest.mark.slow,
+        ),
+        pytest.param(
+            "book.xls", _write_xls, XLRDProvider, ITERATIONS, marks=pytest.mark.slow
+        ),
+    ],
+)
+def test_reads_do_not_leak_file_descriptors(
+    tmp_path, name, write, provider, iterations
+):
+    """
+    Files are closed when a read ends, without relying on garbage collection.
+
+    Arrange:
+        A file in the provider's format and the number of open descriptors.
+
+    Act:
+        Read the file many times with the collector disabled, alternating
+        exhausted reads, early breaks and reads failing on the header.
+
+    Assert:
+        The number of open descriptors has not grown.
+    """
+    path = tmp_path / name
+    write(path)
+    for read_once in READS:  # warm up lazily opened module state
+        read_once(provider(path))
+    before = _open_fds()
+
+    gc.disable()
+    try:
+        for i in range(iterations):
+            READS[i % len(READS)](provider(path))
+        after = _open_fds()
+    finally:
+        gc.enable()
+
+    assert after <= before
+
+
+def test_provider_is_a_context_manager(tmp_path):
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+    gc.collect()  # files left to the collector by earlier tests
+    before = _open_fds()
+
+    with OpenPyXlProvider(path) as provider:
+        rows = provider.rows()
+        next(rows)
+        assert _open_fds() > before
+
+    assert _open_fds() == before
+
+
+def test_reads_closed_before_iterating(tmp_path):
+    """
+    Reads that are never iterated leave no file open.
+
+    Arrange:
+        An ``.xlsx`` file and the number of open descriptors.
+
+    Act:
+        Start reads with ``autoread()``, close some of them and drop the
+        others without iterating any, with the collector disabled.
+
+    Assert:
+        The number of open descriptors has not grown.
+    """
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+    gc.collect()
+    before = _open_fds()
+
+    gc.disable()
+    try:
+        reads = [autoread(path, schema=PersonSchema) for _ in range(20)]
+        reads.append(autoread(path))
+        for rows in reads[:10]:
+            rows.close()
+        after = _open_fds()
+    finally:
+        gc.enable()
+
+    assert after == before
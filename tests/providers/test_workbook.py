@@ -0,0 +1,126 @@
+import openpyxl
+import pytest
+
+import xlea
+from xlea import Schema, Column
+from xlea.exc import HeaderNotFound
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlrd import XLRDProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+SHEETS = {
+    "Sales": [("ID", "Amount"), (1, 10), (2, 20)],
+    "Returns": [("Report",), ("ID", "Reason"), (3, "broken")],
+}
+
+
+class Sales(Schema):
+    id: int = Column("ID")
+    amount: int = Column("Amount")
+
+
+class Returns(Schema):
+    id: int = Column("ID")
+    reason: str = Column("Reason")
+
+
+def _write_xlsx(path):
+    book = openpyxl.Workbook()
+    book.remove(book.active)
+    for name, rows in SHEETS.items():
+        sheet = book.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    book.save(path)
+
+
+def _write_xls(path):
+    xlwt = pytest.importorskip("xlwt")
+    book = xlwt.Workbook()
+    for name, rows in SHEETS.items():
+        sheet = book.add_sheet(name)
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                sheet.write(r, c, value)
+    book.save(str(path))
+
+
+PROVIDERS = [
+    ("book.xlsx", _write_xlsx, OpenPyXlProvider),
+    ("book.xlsx", _write_xlsx, XLSXStreamProvider),
+    ("book.xls", _write_xls, XLRDProvider),
+]
+
+
+@pytest.mark.parametrize("name, write, provider", PROVIDERS)
+def test_sheets_are_read_with_matching_schemas(tmp_path, name, write, provider):
+    """
+    Every sheet of an opened workbook is read with the schema matching
+    its header.
+
+    Arrange:
+        A workbook with two sheets having different headers.
+
+    Act:
+        Open it and read every sheet with both schemas as candidates.
+
+    Assert:
+        Sheets are listed in order and each one is bound to its schema.
+    """
+    path = tmp_path / name
+    write(path)
+
+    with xlea.open(path, provider) as book:
+        assert book.sheets == ["Sales", "Returns"]
+        result = {
+            sheet: [row.asdict() for row in book.read(sheet, [Sales, Returns])]
+            for sheet in book.sheets
+        }
+
+    assert result == {
+        "Sales": [{"id": 1, "amount": 10}, {"id": 2, "amount": 20}],
+        "Returns": [{"id": 3, "reason": "broken"}],
+    }
+
+
+def test_book_is_loaded_once(tmp_path, monkeypatch):
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+    loads = []
+    load_workbook = openpyxl.load_workbook
+
+    def counting(*args, **kwargs):
+        loads.append(args)
+        return load_workbook(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, "load_workbook", counting)
+
+    with xlea.open(path, OpenPyXlProvider) as book:
+        for _ in range(3):
+            assert len(list(book.read("Sales", Sales))) == 2
+            assert len(list(book.read("Returns", Returns))) == 1
+
+    assert len(loads) == 1
+
+
+def test_no_matching_schema(tmp_path):
+    path = tmp_path / "book.xlsx"
+    _write_xlsx(path)
+
+    with xlea.open(path) as book:
+        with pytest.raises(HeaderNotFound):
+            book.match("Sales", [Returns])
+
+
+def test_match_probes_a_bounded_depth(tmp_path):
+    path = tmp_path / "book.xlsx"
+    book = openpyxl.Workbook()
+    for row in [("Report",)] * 5 + [("ID", "Reason"), (3, "broken")]:
+        book.active.append(row)
+    book.save(path)
+
+    with xlea.open(path) as book:
+        with pytest.raises(HeaderNotFound):
+            book.match(None, [Sales, Returns], depth=5)
+        assert book.match(None, [Sales, Returns], depth=6) is Returns
+        assert book.match(None, [Sales, Returns], depth=None) is Returns
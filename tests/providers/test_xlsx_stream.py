@@ -0,0 +1,71 @@
+import openpyxl
+import pytest
+
+from xlea import Schema, Column, read
+from xlea.exc import ProviderError
+from xlea.providers.openpyxl import OpenPyXlProvider
+from xlea.providers.xlsx import XLSXStreamProvider
+
+
+class PersonSchema(Schema):
+    id: int = Column("ID")
+    name: str = Column("Name")
+
+
+def _strip(row):
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return tuple(row)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "Persons"
+    sheet.append(["ID", "Name", "Adult", "Score"])
+    sheet.append([1, "Alice", True, 1.5])
+    sheet.append([2, "Bob", False, -3e10])
+    sheet["B6"] = "gap"
+    other = book.create_sheet("Other")
+    other.append(["only", "here"])
+
+    path = tmp_path / "persons.xlsx"
+    book.save(path)
+    return path
+
+
+@pytest.mark.parametrize("sheet", [None, "Persons", "Other"])
+def test_stream_provider_matches_openpyxl(workbook, sheet):
+    """
+    The streaming provider yields the same values as openpyxl.
+
+    Arrange:
+        A workbook with strings, numbers, booleans and a gap of empty rows.
+
+    Act:
+        Read every sheet with both providers.
+
+    Assert:
+        The rows are equal once openpyxl's padding to the sheet width is
+        stripped.
+    """
+    expected = [_strip(r) for r in OpenPyXlProvider(workbook, sheet).rows()]
+    actual = [_strip(r) for r in XLSXStreamProvider(workbook, sheet).rows()]
+
+    assert actual == expected
+
+
+def test_stream_provider_with_schema(workbook):
+    persons = read(XLSXStreamProvider(workbook), schema=PersonSchema)
+
+    assert [next(persons).asdict() for _ in range(2)] == [
+        {"id": 1, "name": "Alice"},
+        {"id": 2, "name": "Bob"},
+    ]
+
+
+def test_unknown_sheet_raises(workbook):
+    with pytest.raises(ProviderError):
+        list(XLSXStreamProvider(workbook, "Missing").rows())
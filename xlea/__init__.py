@@ -1,5 +1,17 @@
 from xlea.core.reader import read, autoread
+from xlea.core.aio import aread, aautoread
+from xlea.core.columnar import read_columns
+from xlea.core.categorical import Categorical
+from xlea.core.parallel import read_many, read_parallel
+from xlea.core.sinks import to_sqlite, to_csv, to_arrow, to_parquet
+from xlea.core.workbook import Workbook, open
 from xlea.core.column import Column
+from xlea.core.converters import register_converter
 from xlea.core.schema import Schema, config
+from xlea.core.cache import HeaderCache
+from xlea.core.incremental import read_changes, ChangeState, Change
+from xlea.core.index import Rows, RowIndex, RowGroups
+from xlea.core.report import ErrorReport
+from xlea.core.stats import ReadStats, log_stats
 
 from xlea.providers.providers import register_provider
@@ -0,0 +1,219 @@
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+)
+
+from xlea.core.cache import HeaderCache
+from xlea.core.constants import DEFAULT_ASYNC_BATCH_SIZE, DEFAULT_QUEUE_SIZE
+from xlea.core.reader import autoread, read
+from xlea.core.report import ErrorReport
+from xlea.core.stats import ReadStats
+from xlea.core.types import TSchema
+from xlea.providers.proto import ProviderProto
+
+
+def aread(
+    provider: ProviderProto,
+    schema: Optional[Type[TSchema]] = None,
+    *,
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_ASYNC_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronous version of ``read()``.
+
+    The file is parsed in a worker thread, so the event loop is not blocked
+    while rows are produced.
+
+    Parameters
+    ----------
+    provider : ProviderProto
+        Data provider instance producing raw rows.
+    schema : type, optional
+        Schema class used to map rows into structured objects.
+    cache : HeaderCache, optional
+        Cache of resolved header layouts, see ``read()``.
+    stats : ReadStats, optional
+        Collect timings and row counts of the read, see ``read()``.
+    errors : ErrorReport, optional
+        Collect invalid cells instead of failing, see ``read()``.
+    start, stop, sample, seed
+        Rows read, see ``read()``.
+    batch_size : int, default=DEFAULT_ASYNC_BATCH_SIZE
+        Number of rows handed over from the worker to the loop at once.
+    queue_size : int, default=DEFAULT_QUEUE_SIZE
+        Maximum number of batches read ahead of the consumer. The worker
+        waits when the queue is full.
+    executor : Executor, optional
+        Thread pool running the worker. Defaults to the loop's default
+        executor. Row objects can't leave the process they are created
+        in, so process pools are not supported.
+
+    Returns
+    -------
+    AsyncIterator
+        Raw rows or schema instances, as returned by ``read()``.
+
+    Notes
+    -----
+    Closing the iterator (``aclose()``, or cancelling the task consuming
+    it) stops the worker and closes the underlying row iterator before
+    ``aclose()`` returns.
+    """
+
+    return _aiter(
+        partial(
+            read,
+            provider,
+            schema,
+            cache=cache,
+            stats=stats,
+            errors=errors,
+            start=start,
+            stop=stop,
+            sample=sample,
+            seed=seed,
+        ),
+        batch_size,
+        queue_size,
+        executor,
+    )
+
+
+def aautoread(
+    path: Union[str, Path],
+    sheet: Optional[str] = None,
+    *,
+    schema: Optional[Type[TSchema]] = None,
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_ASYNC_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronous version of ``autoread()``.
+
+    Takes the parameters of ``autoread()`` and the worker options of
+    ``aread()``. Provider lookup errors are raised on the first iteration.
+    """
+
+    return _aiter(
+        partial(
+            autoread,
+            path,
+            sheet,
+            schema=schema,
+            cache=cache,
+            stats=stats,
+            errors=errors,
+            start=start,
+            stop=stop,
+            sample=sample,
+            seed=seed,
+        ),
+        batch_size,
+        queue_size,
+        executor,
+    )
+
+
+class _Failure(NamedTuple):
+    error: BaseException
+
+
+_DONE = object()
+
+
+async def _aiter(
+    open_rows: Callable[[], Iterable],
+    batch_size: int,
+    queue_size: int,
+    executor: Optional[Executor],
+):
+    # asyncio is only imported when an async read starts, it is slow to import
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(queue_size)
+    stop = threading.Event()
+
+    worker = loop.run_in_executor(
+        executor,
+        _produce,
+        open_rows,
+        batch_size,
+        partial(loop.call_soon_threadsafe, queue.put_nowait),
+        slots,
+        stop,
+    )
+    try:
+        while True:
+            item = await queue.get()
+            slots.release()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            for row in item:
+                yield row
+    finally:
+        stop.set()
+        slots.release()
+        await worker
+
+
+def _produce(
+    open_rows: Callable[[], Iterable],
+    batch_size: int,
+    put: Callable[[Any], Any],
+    slots: threading.Semaphore,
+    stop: threading.Event,
+):
+    rows = None
+    try:
+        rows = iter(open_rows())
+        while True:
+            slots.acquire()
+            if stop.is_set():
+                return
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            put(batch)
+        put(_DONE)
+    except BaseException as exc:
+        if not stop.is_set():
+            put(_Failure(exc))
+    finally:
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+
+__all__ = ("aread", "aautoread")
@@ -1,49 +1,123 @@
-from typing import Iterable, Union
+from itertools import chain, islice
+from typing import Iterable, Iterator, Mapping, Optional, Sequence, Union
+from weakref import WeakKeyDictionary
 
+from xlea.core.cache import HeaderCache, HeaderLayout
 from xlea.core.column import _Column
-from xlea.core.constants import DEFAULT_DELIMITER
+from xlea.core.constants import DEFAULT_DELIMITER, DEFAULT_HEADER_SCAN_DEPTH
+from xlea.core.matcher import HeaderMatcher
+from xlea.core.plan import ColumnBinding, RowPlan, compile_plan, project_plan
 from xlea.exc import HeaderNotFound, MissingRequiredColumnError
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import projector
+
+
+_SCHEMA_COLUMNS: "WeakKeyDictionary[type, Mapping[str, _Column]]" = WeakKeyDictionary()
+
+
+def schema_columns(schema) -> Mapping[str, _Column]:
+    """
+    Return the ``Column`` descriptors declared on ``schema``.
+
+    The mapping is derived once per schema class and cached, so repeated
+    reads of the same schema don't walk the class namespace again.
+    """
+
+    columns = _SCHEMA_COLUMNS.get(schema)
+    if columns is None:
+        columns = {
+            attr: col
+            for attr, col in schema.__dict__.items()
+            if isinstance(col, _Column)
+        }
+        _SCHEMA_COLUMNS[schema] = columns
+    return columns
+
+
+_SCHEMA_MATCHERS: "WeakKeyDictionary[type, HeaderMatcher]" = WeakKeyDictionary()
+
+
+def schema_matcher(schema, delimiter: str) -> HeaderMatcher:
+    """
+    Return the compiled ``HeaderMatcher`` of ``schema``, cached per class.
+    """
+
+    matcher = _SCHEMA_MATCHERS.get(schema)
+    if matcher is None:
+        matcher = HeaderMatcher(schema_columns(schema), delimiter)
+        _SCHEMA_MATCHERS[schema] = matcher
+    return matcher
 
 
 class BoundSchema:
-    def __init__(self, rows: tuple[Iterable, ...], schema):
-        self._rows = rows
+    def __init__(
+        self,
+        rows: Iterable[Iterable],
+        schema,
+        prefix: Sequence[Iterable] = (),
+    ):
+        self._rows = iter(rows)
+        self._buffer = list(prefix)
         self._schema = schema
         self._data_row = -1
+        self.plan: Optional[RowPlan] = None
 
         self._config = getattr(schema, "__schema_config__", {})
         self._delimiter = self._config.get("delimiter", DEFAULT_DELIMITER)
         self._header_rows = self._config.get("header_rows", 1)
+        self._scan_depth = self._config.get(
+            "header_scan_depth", DEFAULT_HEADER_SCAN_DEPTH
+        )
 
-        self._columns: dict[str, _Column] = {
-            attr: col
-            for attr, col in schema.__dict__.items()
-            if isinstance(col, _Column)
-        }
+        self._columns = schema_columns(schema)
+        self._matcher = schema_matcher(schema, self._delimiter)
+        self._matches: dict[str, list[str]] = {}
+        self._cells: dict[int, tuple[str, ...]] = {}
+
+    def _fetch(self, idx: int) -> bool:
+        while len(self._buffer) <= idx:
+            try:
+                self._buffer.append(next(self._rows))
+            except StopIteration:
+                return False
+        return True
+
+    def _match(self, value: str) -> list[str]:
+        matched = self._matches.get(value)
+        if matched is None:
+            matched = self._matches[value] = self._matcher.match(value)
+        return matched
 
     def _is_header(
         self,
-        required: tuple[_Column, ...],
+        required: frozenset[str],
         row: Union[tuple[str, ...], list],
     ) -> bool:
-        for c in required:
-            if not any(c.matching(val) for val in row):
-                return False
+        found = set()
+        for val in row:
+            found.update(self._match(val))
+            if found >= required:
+                return True
 
-        return True
+        return not required
 
-    def _bind_columns(self, header):
-        for col in self._columns.values():
-            for idx, val in enumerate(header):
-                if not col.matching(val):
-                    continue
-                col.index = idx
-                col.name = val
+    def _bind_columns(self, header) -> tuple[ColumnBinding, ...]:
+        index_by_attr: dict[str, int] = {}
+        for idx, val in enumerate(header):
+            for attr in self._match(val):
+                index_by_attr[attr] = idx
 
-            if col._required and col.index == -1:
+        bindings = []
+        for attr, col in self._columns.items():
+            index = index_by_attr.get(attr)
+            if col._required and index is None:
                 raise MissingRequiredColumnError(
                     f"Cant find required column '{col._pattern}'"
                 )
+            name = None if index is None else header[index]
+            bindings.append(ColumnBinding(attr, index, name, col))
+
+        return tuple(bindings)
 
     def _flatten_candidates(
         self,
@@ -69,40 +143,146 @@ class BoundSchema:
             out.append(self._delimiter.join(parts))
         return out
 
-    def _build_header_candidatte(self, start: int):
-        rows = []
+    def _row_cells(self, idx: int) -> tuple[str, ...]:
+        cells = self._cells.get(idx)
+        if cells is None:
+            cells = self._cells[idx] = tuple(str(v) for v in self._buffer[idx])
+        return cells
 
-        for offset in range(self._header_rows):
-            idx = start + offset
-            if idx >= len(self._rows):
-                return None
+    def _build_header_candidatte(self, start: int):
+        if not self._fetch(start + self._header_rows - 1):
+            return None
 
-            rows.append(tuple(str(v) for v in self._rows[idx]))
+        if self._header_rows == 1:
+            return tuple(str(v) for v in self._buffer[start])
 
-            if self._header_rows == 1:
-                return rows[0]
+        # only the rows of the current window are kept stringified
+        self._cells.pop(start - 1, None)
+        rows = [self._row_cells(start + offset) for offset in range(self._header_rows)]
+        if not self._matcher.may_contain_header(chain.from_iterable(rows)):
+            return ()
 
         return self._flatten_candidates(tuple(zip(*rows)))
 
-    def _find_header(self, required: tuple[_Column, ...]):
-        for row_index in range(len(self._rows)):
+    def _find_header(self, required: frozenset[str]):
+        row_index = 0
+        while self._scan_depth is None or row_index < self._scan_depth:
             header = self._build_header_candidatte(
                 start=row_index,
             )
+            if header is None:
+                break
 
             if header and self._is_header(required, header):
                 return header, row_index + self._header_rows
+            row_index += 1
         return None, None
 
-    def _get_required_columns(self) -> tuple[_Column, ...]:
-        return tuple(c for c in self._columns.values() if c._required)
+    def _preamble(self, layout: HeaderLayout) -> list:
+        # rows preceding the header of ``layout``
+        start = max(layout.data_row - self._header_rows, 0)
+        self._fetch(start - 1)
+        return self._buffer[:start]
+
+    def _restore(self, layout: HeaderLayout) -> bool:
+        start = layout.data_row - self._header_rows
+        header = self._build_header_candidatte(start) if start >= 0 else None
+        if not header:
+            return False
+
+        index_by_attr = dict(layout.bindings)
+        for attr, idx in layout.bindings:
+            if idx >= len(header) or attr not in self._match(header[idx]):
+                return False
+        if not self._matcher.required <= index_by_attr.keys():
+            return False
+
+        self._data_row = layout.data_row
+        self.plan = compile_plan(
+            tuple(
+                ColumnBinding(
+                    attr,
+                    index_by_attr.get(attr),
+                    header[index_by_attr[attr]] if attr in index_by_attr else None,
+                    col,
+                )
+                for attr, col in self._columns.items()
+            )
+        )
+        return True
+
+    def resolve(self, cache: Optional[HeaderCache] = None):
+        """
+        Find the header and compile the row plan.
 
-    def resolve(self):
-        header, header_index = self._find_header(self._get_required_columns())
+        With a ``cache``, a layout previously resolved for a file with the
+        same rows before the header is verified and reused instead of
+        searching the header, and newly resolved layouts are stored.
+        """
+
+        if cache is not None:
+            if cache.lookup(self._schema, self._preamble, self._restore):
+                self._matches = {}
+                self._cells = {}
+                return self
+
+        header, header_index = self._find_header(self._matcher.required)
         if header is None:
             raise HeaderNotFound("Header not found")
 
-        self._bind_columns(header)
         self._data_row = header_index
+        self.plan = compile_plan(self._bind_columns(header))
+        self._matches = {}
+        self._cells = {}
+
+        if cache is not None:
+            bindings = tuple(
+                (b.attr, b.index) for b in self.plan.columns if b.index is not None
+            )
+            layout = HeaderLayout(self._data_row, bindings)
+            cache.store(cache.key(self._schema, self._preamble(layout)), layout)
 
         return self
+
+    def data_rows(
+        self,
+        provider: Optional[ProviderProto] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[tuple]:
+        """
+        Iterate over the data rows following the resolved header.
+
+        Only the data rows from index ``start`` up to, excluding, ``stop``
+        are produced (both relative to the first data row).
+
+        Rows are projected onto the bound columns and the plan is remapped
+        accordingly, so rows only keep the values the schema uses. If
+        ``provider`` implements ``iter_rows``, the projection is pushed down
+        and the provider is asked for the data rows directly; otherwise the
+        buffered rows past the header are followed by the rest of the live
+        provider iterator. The lookahead buffer is released either way.
+        """
+
+        columns = self.plan.indices
+        buffered = self._buffer[self._data_row :]
+        self._buffer = []
+
+        iter_rows = getattr(provider, "iter_rows", None)
+        if iter_rows is not None:
+            close = getattr(self._rows, "close", None)
+            if close is not None:
+                close()
+            rows = iter_rows(
+                start=self._data_row + start,
+                columns=columns,
+                stop=None if stop is None else self._data_row + stop,
+            )
+        else:
+            rows = chain(buffered, self._rows)
+            if start or stop is not None:
+                rows = islice(rows, start, stop)
+            rows = map(projector(columns), rows)
+
+        self.plan = project_plan(self.plan, columns)
+        return iter(rows)
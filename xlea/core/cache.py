@@ -0,0 +1,282 @@
+import json
+import time
+from contextlib import closing
+from pathlib import Path
+from re import Pattern
+from typing import Callable, Iterable, NamedTuple, Optional, Union
+
+from xlea.core.constants import DEFAULT_CACHE_MAX_AGE, DEFAULT_CACHE_MAX_ENTRIES
+
+_FORMAT_VERSION = 2
+
+
+class HeaderLayout(NamedTuple):
+    """
+    Resolved header layout stored in a ``HeaderCache``.
+
+    Attributes
+    ----------
+    data_row : int
+        Index of the first data row, right after the header.
+    bindings : tuple[tuple[str, int], ...]
+        ``(attr, index)`` pairs of the columns bound in the header.
+    """
+
+    data_row: int
+    bindings: tuple[tuple[str, int], ...]
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters of a ``HeaderCache`` since it was created.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from the cache.
+    misses : int
+        Lookups that required a header search, including stale entries.
+    stale : int
+        Cached layouts that no longer matched the file.
+    evictions : int
+        Entries removed because of their age or the size limit.
+    """
+
+    hits: int
+    misses: int
+    stale: int
+    evictions: int
+
+
+class HeaderCache:
+    """
+    Persistent cache of resolved header layouts.
+
+    Files that share a template (same leading rows, same schema) resolve to
+    the same header. The cache remembers where the header was found and how
+    columns were bound, so repeated reads can skip the header search. It is
+    stored in a SQLite database and can be shared between processes.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the SQLite database, created if missing.
+    max_entries : int, default=DEFAULT_CACHE_MAX_ENTRIES
+        Maximum number of entries. The least recently used entries are
+        evicted first.
+    max_age : float, optional, default=DEFAULT_CACHE_MAX_AGE
+        Maximum time in seconds since an entry was last used. ``None``
+        keeps entries regardless of their age.
+
+    Notes
+    -----
+    The key combines the schema identity, its column definitions and
+    ``@config`` options with a digest of the rows preceding the header.
+    Data rows are not part of the key, so files sharing a template hit
+    the cache whatever data they hold. A cached layout is always verified
+    against the file (the header cells must still match their columns)
+    before the search is skipped; a stale entry is replaced after a
+    regular search.
+
+    Examples
+    --------
+    ::
+
+        cache = HeaderCache("~/.cache/xlea/headers.sqlite")
+        for row in autoread("report.xlsx", schema=Report, cache=cache):
+            ...
+        print(cache.stats)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_age: Optional[float] = DEFAULT_CACHE_MAX_AGE,
+    ):
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._hits = self._misses = self._stale = self._evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS headers ("
+                "key TEXT PRIMARY KEY, layout TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._stale, self._evictions)
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM headers").fetchone()[0]
+
+    def key(self, schema, rows: Iterable[Iterable]) -> str:
+        """
+        Return the cache key of ``schema`` for a header preceded by ``rows``.
+        """
+
+        from hashlib import blake2b
+
+        digest = blake2b(digest_size=16)
+        for row in rows:
+            digest.update(repr(tuple(row)).encode())
+            digest.update(b"\x1e")
+        return f"{self._prefix(schema)}{digest.hexdigest()}"
+
+    def lookup(
+        self,
+        schema,
+        preamble: Callable[[HeaderLayout], Iterable[Iterable]],
+        restore: Callable[[HeaderLayout], bool],
+    ) -> bool:
+        """
+        Find a cached layout of ``schema`` fitting the file and restore it.
+
+        Layouts of ``schema`` are tried from the most recently used one.
+        ``preamble`` returns the rows of the file preceding the header of a
+        layout: the layout is only tried if they match those it was stored
+        with. ``restore`` verifies the layout against the file and applies
+        it, returning ``False`` if the layout doesn't fit. Returns whether a
+        layout was restored.
+        """
+
+        stale = False
+        for key, layout in self._layouts(schema):
+            if key != self.key(schema, preamble(layout)):
+                continue
+            if restore(layout):
+                self._hits += 1
+                with self._connect() as db:
+                    db.execute(
+                        "UPDATE headers SET accessed = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                return True
+            stale = True
+
+        self._misses += 1
+        self._stale += stale
+        return False
+
+    def store(self, key: str, layout: HeaderLayout):
+        """
+        Store ``layout`` under ``key`` and evict old entries.
+        """
+
+        now = time.time()
+        data = json.dumps([layout.data_row, layout.bindings])
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO headers VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            self._evict(db, now)
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM headers")
+
+    def _layouts(self, schema) -> list[tuple[str, HeaderLayout]]:
+        now = time.time()
+        prefix = self._prefix(schema)
+        with self._connect() as db:
+            if self.max_age is not None:
+                removed = db.execute(
+                    "DELETE FROM headers WHERE key >= ? AND key < ? AND accessed < ?",
+                    (prefix, prefix + "~", now - self.max_age),
+                )
+                self._evictions += removed.rowcount
+            found = db.execute(
+                "SELECT key, layout FROM headers WHERE key >= ? AND key < ? "
+                "ORDER BY accessed DESC",
+                (prefix, prefix + "~"),
+            ).fetchall()
+
+        layouts = []
+        for key, data in found:
+            data_row, bindings = json.loads(data)
+            layouts.append((key, HeaderLayout(data_row, tuple(map(tuple, bindings)))))
+        return layouts
+
+    @staticmethod
+    def _prefix(schema) -> str:
+        from hashlib import blake2b
+
+        digest = blake2b(repr(_schema_signature(schema)).encode(), digest_size=16)
+        return f"{_FORMAT_VERSION}:{digest.hexdigest()}:"
+
+    def _evict(self, db, now: float):
+        if self.max_age is not None:
+            removed = db.execute(
+                "DELETE FROM headers WHERE accessed < ?", (now - self.max_age,)
+            )
+            self._evictions += removed.rowcount
+
+        removed = db.execute(
+            "DELETE FROM headers WHERE key IN ("
+            "SELECT key FROM headers ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._evictions += removed.rowcount
+
+    def _connect(self):
+        import sqlite3
+
+        db = sqlite3.connect(self.path, timeout=30)
+        return _Transaction(db)
+
+
+class _Transaction:
+    # sqlite3 connections commit on ``__exit__`` but stay open.
+    def __init__(self, db):
+        self._db = db
+
+    def __enter__(self):
+        return self._db.__enter__()
+
+    def __exit__(self, *exc):
+        with closing(self._db):
+            return self._db.__exit__(*exc)
+
+
+def _schema_signature(schema) -> tuple:
+    from xlea.core.bound_schema import schema_columns
+
+    config = getattr(schema, "__schema_config__", {})
+    columns = tuple(
+        (
+            attr,
+            _pattern_signature(col._pattern),
+            col._ignore_case,
+            col._required,
+        )
+        for attr, col in schema_columns(schema).items()
+    )
+    return (
+        f"{schema.__module__}.{schema.__qualname__}",
+        columns,
+        sorted((k, repr(v)) for k, v in config.items()),
+    )
+
+
+def _pattern_signature(pattern) -> tuple:
+    if isinstance(pattern, str):
+        return ("str", pattern)
+    if isinstance(pattern, Pattern):
+        return ("re", pattern.pattern, pattern.flags)
+    # The repr of a callable contains its address, which changes every run.
+    return (
+        "callable",
+        getattr(pattern, "__module__", None),
+        getattr(pattern, "__qualname__", type(pattern).__qualname__),
+    )
+
+
+__all__ = ("HeaderCache", "HeaderLayout", "CacheStats")
@@ -0,0 +1,156 @@
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Union
+
+from xlea.core.constants import DEFAULT_CATEGORICAL_LIMIT
+from xlea.core.converters import value_type
+from xlea.core.plan import RowPlan
+
+# Columns of these types are never detected as categorical
+_SCALAR_TYPES = frozenset((int, float, bool, datetime, date))
+
+
+class Categorical(NamedTuple):
+    """
+    Column of a ``read_columns()`` batch encoded as codes.
+
+    Attributes
+    ----------
+    codes : numpy.ndarray | list[int]
+        Position of every value in ``categories``.
+    categories : list
+        Distinct converted values, in order of appearance. Codes are
+        stable across the batches of a read: the categories of a batch
+        start with those of the previous batches.
+    """
+
+    codes: Any
+    categories: list
+
+    def values(self) -> list:
+        """
+        Return the decoded values.
+        """
+
+        categories = self.categories
+        return [categories[code] for code in self.codes]
+
+
+class Categories:
+    """
+    Distinct values of a categorical column over one read.
+
+    Raw values are converted once per distinct value and mapped to an
+    integer code, so converting a column of repeated values costs one
+    dictionary lookup per cell.
+
+    Parameters
+    ----------
+    convert : Callable[[Any], Any]
+        Converter of the column.
+    """
+
+    def __init__(self, convert: Callable[[Any], Any]):
+        self.values: list = []
+        self._convert = convert
+        self._codes: dict[Any, int] = {}
+        self._raw_codes: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, raw_values: Iterable) -> list[int]:
+        """
+        Return the codes of ``raw_values``, adding new values.
+        """
+
+        raw_codes, add = self._raw_codes, self._add
+        codes = []
+        for raw in raw_values:
+            key = (type(raw), raw)
+            code = raw_codes.get(key)
+            codes.append(add(raw, key) if code is None else code)
+        return codes
+
+    def _add(self, raw, key: tuple) -> int:
+        value = self._convert(raw)
+        code = self._codes.setdefault((type(value), value), len(self.values))
+        if code == len(self.values):
+            self.values.append(value)
+        self._raw_codes[key] = code
+        return code
+
+
+def categorical_indices(
+    plan: RowPlan, auto: bool
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Return the row indices of the declared and of the candidate categorical
+    columns of ``plan``.
+
+    Candidates are the bound columns not declared with
+    ``Column(categorical=True)`` and not of a scalar type (``int``,
+    ``float``, ``bool``, ``datetime``, ``date``, optional or not), if
+    ``auto``.
+    """
+
+    declared = []
+    candidates = []
+    for c in plan.columns:
+        if c.index is None:
+            continue
+        if c.column._categorical:
+            declared.append(c.index)
+        elif auto and value_type(c.column._type) not in _SCALAR_TYPES:
+            candidates.append(c.index)
+    return tuple(declared), tuple(candidates)
+
+
+def interned_rows(
+    rows: Iterable[Union[tuple, list]],
+    declared: tuple[int, ...],
+    candidates: tuple[int, ...],
+    limit: int = DEFAULT_CATEGORICAL_LIMIT,
+) -> Iterator[tuple]:
+    """
+    Replace the values of categorical columns by one shared instance per
+    distinct value.
+
+    Values of ``declared`` columns are always interned. Values of
+    ``candidates`` are interned until a column has more than ``limit``
+    distinct values, then the column is left as read. Rows are padded up
+    to the last categorical column.
+
+    Values are pooled by type and value, so equal values of different
+    types, such as ``1``, ``1.0`` and ``True``, are kept apart.
+    """
+
+    pools = {index: {} for index in declared + candidates}
+    detected = set(candidates)
+    interns = [(index, pool.setdefault) for index, pool in pools.items()]
+    width = max(pools, default=-1) + 1
+
+    rows = iter(rows)
+    for i, row in enumerate(rows, 1):
+        values = list(row)
+        if len(values) < width:
+            values.extend([None] * (width - len(values)))
+        for index, intern in interns:
+            value = values[index]
+            values[index] = intern((type(value), value), value)
+        yield tuple(values)
+
+        # cardinality of candidates is checked every few rows
+        if detected and not i & 0x3FF:
+            overflow = {index for index in detected if len(pools[index]) > limit}
+            if not overflow:
+                continue
+            detected -= overflow
+            for index in overflow:
+                del pools[index]
+            interns = [(index, pool.setdefault) for index, pool in pools.items()]
+            if not interns:
+                yield from rows
+                return
+
+
+__all__ = ("Categorical",)
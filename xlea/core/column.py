@@ -2,7 +2,19 @@ import re
 from re import Pattern
 from sys import excepthook
 import warnings
-from typing import Any, Callable, Generic, Optional, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    ForwardRef,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    get_type_hints,
+    overload,
+)
+
+from xlea.core.converters import make_converter
 
 T = TypeVar("T")
 
@@ -16,6 +28,8 @@ def Column(  # type: ignore[reportInconsistentOverload]
     regexp: bool = False,
     validator: Union[Callable[[str], bool], None] = None,
     skip_invalid_row=False,
+    key: bool = False,
+    categorical: bool = False,
 ) -> T: ...
 def Column(
     pattern: Union[str, Pattern[str], Callable[[str], bool]],
@@ -25,6 +39,8 @@ def Column(
     regexp: bool = False,
     validator: Union[Callable[[str], bool], None] = None,
     skip_invalid_row=False,
+    key: bool = False,
+    categorical: bool = False,
 ) -> Any:
     """
     Declare a column mapping within a schema.
@@ -58,6 +74,14 @@ def Column(
     skip_invalid_row : bool, default=False
         Whether rows with invalid values for this column should be skipped
         entirely during iteration.
+    key : bool, default=False
+        Whether the column is part of the key identifying rows across
+        reads, see ``read_changes()``.
+    categorical : bool, default=False
+        Whether the column holds a few distinct values repeated over many
+        rows. Rows read share one instance per distinct value, and
+        ``read_columns()`` returns the column as codes into its distinct
+        values.
 
     Returns
     -------
@@ -74,8 +98,11 @@ def Column(
     Notes
     -----
     Type conversion is driven by the owning schema's type annotations.
-    If an annotation is present, the raw value is converted using the
-    annotated type.
+    If an annotation is present, the raw value is converted with the
+    converter registered for the annotated type (see
+    ``register_converter``), or by calling the type otherwise.
+    ``Optional``, ``Union``, ``Literal`` and ``Enum`` annotations are
+    supported, and ``date``/``datetime`` columns accept Excel serials.
     """
 
     if isinstance(pattern, str) and regexp:
@@ -95,6 +122,8 @@ def Column(
         default=default,
         validator=validator,
         skip_invalid_row=skip_invalid_row,
+        key=key,
+        categorical=categorical,
     )
 
 
@@ -143,45 +172,83 @@ class _Column(Generic[T]):
         default: Optional[T] = None,
         validator: Union[Callable[[str], bool], None] = None,
         skip_invalid_row=False,
+        key: bool = False,
+        categorical: bool = False,
     ) -> None:
         self._pattern = pattern
         self._ignore_case = ignore_case
+        self._folded = pattern.casefold() if isinstance(pattern, str) else None
         self._required = required
         self._default = default
         self._validator = validator
         self._skip_invalid_row = skip_invalid_row
+        self._key = key
+        self._categorical = categorical
 
-        self._index = None
-        self._name = None
         self._attr_name = None
+        self._owner = None
         self._type: Optional[T] = None
+        self._converter: Optional[Callable[[Any], Any]] = None
 
     def __set_name__(self, owner, name):
         self._attr_name = name
+        self._owner = owner
         self._type = owner.__annotations__.get(name)
 
     def __get__(self, instance, _):
         if instance is None:
             return self
 
-        if self._index is None:
-            return self._default
+        index, convert, default = instance._plan.accessors[self._attr_name]
+        if index is None:
+            return default
 
-        value = instance._row[self._index]
-        if self._type is not None:
+        return convert(instance._row[index])
+
+    @property
+    def converter(self) -> Callable[[Any], Any]:
+        """
+        Function converting raw cell values to the column's annotated type.
+
+        Built once from the annotation (see ``xlea.core.converters``) the
+        first time the column is used, values already of the target type
+        are returned without entering the conversion.
+        """
+
+        if self._converter is None:
+            self._converter = self._build_converter()
+        return self._converter
+
+    def _build_converter(self) -> Callable[[Any], Any]:
+        if isinstance(self._type, (str, ForwardRef)):
+            self._type = get_type_hints(self._owner)[self._attr_name]
+
+        exact, convert = make_converter(self._type)
+        if convert is None:
+            return _identity
+
+        attr_name = self._attr_name
+        type_name = getattr(self._type, "__name__", str(self._type))
+
+        def converter(value):
+            if value.__class__ is exact:
+                return value
             try:
-                return self._type(value)
-            except ValueError:
+                return convert(value)
+            except (ValueError, TypeError, ArithmeticError):
                 raise TypeError(
-                    f"invalid value {value!r} in row {self._index}: "
-                    f"expected type {self._type.__name__}, got {type(value).__name__}"
-                )
+                    f"invalid value {value!r} in column {attr_name!r}: "
+                    f"expected type {type_name}, got {type(value).__name__}"
+                ) from None
+
+        return converter
 
-        return value
+    def convert(self, value):
+        return self.converter(value)
 
     def matching(self, value: str) -> bool:
         if self._ignore_case and isinstance(self._pattern, str):
-            return value.casefold() == self._pattern.casefold()
+            return value.casefold() == self._folded
 
         if isinstance(self._pattern, Pattern):
             return re.search(self._pattern, value) is not None
@@ -197,18 +264,6 @@ class _Column(Generic[T]):
 
         return self._validator(value)
 
-    @property
-    def index(self) -> Union[int, None]:
-        return self._index
-
-    @property
-    def name(self) -> Union[str, None]:
-        return self._name
-
-    @index.setter
-    def index(self, value: int):
-        self._index = value
 
-    @name.setter
-    def name(self, value: str):
-        self._name = value
+def _identity(value):
+    return value
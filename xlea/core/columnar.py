@@ -0,0 +1,230 @@
+from datetime import date, datetime
+from itertools import compress
+from typing import Any, Iterator, Optional, Type, Union
+
+from xlea.core.bound_schema import BoundSchema
+from xlea.core.categorical import Categorical, Categories, categorical_indices
+from xlea.core.constants import DEFAULT_BATCH_SIZE, DEFAULT_CATEGORICAL_LIMIT
+from xlea.core.plan import RowPlan
+from xlea.core.types import TSchema
+from xlea.exc import InvalidRowError
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import release
+
+
+_NUMPY_DTYPES = {
+    int: "int64",
+    float: "float64",
+    bool: "bool",
+    datetime: "datetime64[us]",
+    date: "datetime64[D]",
+}
+
+# Cell types NumPy converts to the dtype of a column as the default
+# converter of its type does
+_NUMPY_INPUTS = {
+    int: frozenset((int,)),
+    float: frozenset((float, int)),
+    bool: frozenset((bool,)),
+    datetime: frozenset((datetime,)),
+    date: frozenset((date,)),
+}
+
+
+def read_columns(
+    provider: ProviderProto,
+    schema: Type[TSchema],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    as_numpy: Optional[bool] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Read rows from a provider as column-oriented batches.
+
+    The header is resolved exactly like in ``read()``, but instead of one
+    object per row every batch is a mapping of schema attribute names to
+    column values.
+
+    Parameters
+    ----------
+    provider : ProviderProto
+        Data provider instance producing raw rows.
+    schema : type
+        Schema class used to resolve and convert columns.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Maximum number of data rows per batch.
+    as_numpy : bool, optional
+        Whether columns are returned as NumPy arrays. Defaults to ``True``
+        when NumPy is installed.
+
+    Yields
+    ------
+    dict[str, numpy.ndarray | list | Categorical]
+        Column values of the valid rows of a batch, keyed by attribute
+        name.
+
+    Raises
+    ------
+    InvalidRowError
+        If a value fails a validator of a column without
+        ``skip_invalid_row``.
+    TypeError
+        If a value cannot be converted to the annotated column type.
+
+    Notes
+    -----
+    Validators and conversions run column by column over a whole batch.
+    With NumPy, ``int``, ``float``, ``bool``, ``datetime`` and ``date``
+    columns become typed arrays of the converted values; every other
+    column becomes an object array. Without NumPy columns are plain lists.
+    Rows rejected by a ``skip_invalid_row`` validator are dropped from
+    the batch.
+
+    Categorical columns (see ``Column(categorical=True)`` and the
+    ``auto_categorical`` option of ``@config``) are returned as
+    ``Categorical`` codes into their distinct values, ``int32`` arrays
+    with NumPy. Each distinct raw value is converted once. With
+    ``auto_categorical``, the candidate columns having at most half as
+    many distinct values as rows in the first batch are categorical for
+    the whole read.
+    """
+
+    np = None if as_numpy is False else _import_numpy()
+    if as_numpy and np is None:
+        raise ImportError(
+            "numpy not found, ensure that you installed it:\npip install xlea[numpy]"
+        )
+
+    rows = provider.rows()
+    try:
+        bound = BoundSchema(rows, schema).resolve()
+        data_rows = bound.data_rows(provider)
+        declared, candidates = categorical_indices(
+            bound.plan,
+            getattr(schema, "__schema_config__", {}).get("auto_categorical", False),
+        )
+        converters = {c.index: c.column.converter for c in bound.plan.columns}
+        categories = {index: Categories(converters[index]) for index in declared}
+
+        batch = []
+        offset = 0
+        for row in data_rows:
+            batch.append(row)
+            if len(batch) < batch_size:
+                continue
+            if candidates:
+                for index in _detect_categorical(batch, candidates):
+                    categories[index] = Categories(converters[index])
+                candidates = ()
+            yield _build_batch(batch, offset, bound.plan, np, categories)
+            offset += len(batch)
+            batch = []
+
+        if batch:
+            for index in _detect_categorical(batch, candidates):
+                categories[index] = Categories(converters[index])
+            yield _build_batch(batch, offset, bound.plan, np, categories)
+    finally:
+        release(rows, provider)
+
+
+def _detect_categorical(rows: list, candidates: tuple[int, ...]) -> list[int]:
+    limit = min(DEFAULT_CATEGORICAL_LIMIT, len(rows) // 2)
+    return [
+        index
+        for index in candidates
+        if len({row[index] if len(row) > index else None for row in rows}) <= limit
+    ]
+
+
+def _build_batch(
+    rows: list,
+    offset: int,
+    plan: RowPlan,
+    np,
+    categories: Optional[dict[int, Categories]] = None,
+):
+    width = plan.max_index + 1
+    rows = [
+        row if len(row) >= width else tuple(row) + (None,) * (width - len(row))
+        for row in rows
+    ]
+    values = {index: [row[index] for row in rows] for index in plan.indices}
+
+    keep = None
+    for index, validator, skip in plan.validators:
+        valid = list(map(validator, values[index]))
+        if all(valid):
+            continue
+        if not skip:
+            for position, ok in enumerate(valid):
+                if ok or (keep is not None and not keep[position]):
+                    continue
+                raise InvalidRowError(
+                    f"The value in row {offset + position} failed validation: "
+                    f"{values[index][position]}"
+                )
+        keep = valid if keep is None else [k and v for k, v in zip(keep, valid)]
+
+    if keep is not None:
+        values = {index: list(compress(col, keep)) for index, col in values.items()}
+    size = len(rows) if keep is None else sum(keep)
+
+    categories = categories or {}
+    return {
+        attr: (
+            _default_column(col._default, size, np)
+            if index is None
+            else (
+                _encode_column(categories[index], values[index], np)
+                if index in categories
+                else _convert_column(col, values[index], np)
+            )
+        )
+        for attr, index, _, col in plan.columns
+    }
+
+
+def _encode_column(categories: Categories, values: list, np) -> Categorical:
+    codes = categories.encode(values)
+    if np is not None:
+        codes = np.array(codes, dtype="int32")
+    return Categorical(codes, list(categories.values))
+
+
+def _default_column(default, size: int, np):
+    if np is None:
+        return [default] * size
+    return np.full(size, default, dtype=object)
+
+
+def _convert_column(col, values: list, np) -> Union[list, Any]:
+    if np is None:
+        return list(map(col.converter, values))
+
+    dtype = _NUMPY_DTYPES.get(col._type)
+    if dtype is None:
+        return np.array(list(map(col.converter, values)), dtype=object)
+
+    # Values already of the target type are returned as is by the column
+    # converter, so they are handed to NumPy without calling it.
+    if set(map(type, values)) <= _NUMPY_INPUTS[col._type]:
+        try:
+            return np.array(values, dtype=dtype)
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+    values = list(map(col.converter, values))
+    try:
+        return np.array(values, dtype=dtype)
+    except (ValueError, TypeError, OverflowError) as exc:
+        raise TypeError(
+            f"cannot convert column {col._attr_name!r} to {dtype}: {exc}"
+        ) from exc
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -1 +1,10 @@
 DEFAULT_DELIMITER = ";"
+DEFAULT_HEADER_SCAN_DEPTH = 1_000
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_ASYNC_BATCH_SIZE = 1_000
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+DEFAULT_MAX_ERRORS = 10_000
+DEFAULT_SHARD_ROWS = 100_000
+DEFAULT_CATEGORICAL_LIMIT = 1_024
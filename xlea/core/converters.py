@@ -0,0 +1,256 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Literal, Optional, Union, get_args, get_origin
+
+Converter = Callable[[Any], Any]
+
+# Excel serial dates count days from 1899-12-30 (which absorbs the
+# non-existent 1900-02-29 for every date after February 1900).
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_TRUE = frozenset(("true", "t", "yes", "y", "1", "1.0"))
+_FALSE = frozenset(("false", "f", "no", "n", "0", "0.0", ""))
+
+
+def to_int(value) -> int:
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value!r} is not an integer")
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return to_int(float(value))
+    return int(value)
+
+
+def to_bool(value) -> bool:
+    if isinstance(value, str):
+        folded = value.strip().casefold()
+        if folded in _TRUE:
+            return True
+        if folded in _FALSE:
+            return False
+        raise ValueError(f"{value!r} is not a boolean")
+    if isinstance(value, (int, float)):
+        return bool(value)
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def to_decimal(value) -> Decimal:
+    if isinstance(value, float):
+        # repr() is the shortest string round-tripping to the same float,
+        # Decimal(0.1) would keep the binary expansion instead.
+        return Decimal(repr(value))
+    if isinstance(value, str):
+        return Decimal(value.strip())
+    return Decimal(value)
+
+
+def to_datetime(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return EXCEL_EPOCH + timedelta(days=value)
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.strip())
+    raise ValueError(f"{value!r} is not a datetime")
+
+
+def to_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return to_datetime(value).date()
+
+
+def to_time(value) -> time:
+    if isinstance(value, time):
+        return value
+    if isinstance(value, datetime):
+        return value.time()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # fraction of a day, as stored by Excel for time cells
+        return (EXCEL_EPOCH + timedelta(days=value % 1)).time()
+    if isinstance(value, str):
+        return time.fromisoformat(value.strip())
+    raise ValueError(f"{value!r} is not a time")
+
+
+_CONVERTERS: dict[type, Converter] = {
+    str: str,
+    int: to_int,
+    float: float,
+    bool: to_bool,
+    Decimal: to_decimal,
+    datetime: to_datetime,
+    date: to_date,
+    time: to_time,
+}
+
+
+def register_converter(annotation: type, converter: Converter):
+    """
+    Register the converter used for columns annotated with ``annotation``.
+
+    Parameters
+    ----------
+    annotation : type
+        Annotation type. Also used for ``Optional`` and ``Union`` members.
+    converter : Callable[[Any], Any]
+        Function converting a raw cell value. It is only called for values
+        that are not already exactly of type ``annotation`` and should raise
+        ``ValueError`` for values it can't convert.
+
+    Examples
+    --------
+    ::
+
+        register_converter(UUID, lambda value: UUID(str(value)))
+    """
+
+    _CONVERTERS[annotation] = converter
+
+
+def make_converter(annotation) -> tuple[Optional[type], Optional[Converter]]:
+    """
+    Build the converter of a column annotated with ``annotation``.
+
+    Returns
+    -------
+    tuple[type | None, Callable | None]
+        The type of values that can be returned unchanged (``None`` if no
+        such fast path applies) and the converter for every other value,
+        ``None`` if values are not converted at all.
+    """
+
+    if annotation is None or annotation is Any:
+        return None, None
+
+    origin = get_origin(annotation)
+    if origin is Union:
+        return None, _union_converter(get_args(annotation))
+    if origin is Literal:
+        return None, _literal_converter(get_args(annotation))
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return annotation, _enum_converter(annotation)
+        converter = _CONVERTERS.get(annotation)
+        if converter is not None:
+            return annotation, converter
+        return annotation, annotation
+
+    return None, annotation
+
+
+def value_type(annotation):
+    """
+    Return the type of the values of a column annotated with ``annotation``.
+
+    ``Optional[X]`` columns hold values of type ``X``, other annotations
+    are returned as they are.
+    """
+
+    args = get_args(annotation)
+    if get_origin(annotation) is Union and len(args) == 2 and type(None) in args:
+        return args[0] if args[1] is type(None) else args[1]
+    return annotation
+
+
+def _fast(annotation) -> Converter:
+    exact, converter = make_converter(annotation)
+    if converter is None:
+        return _identity
+    if exact is None:
+        return converter
+
+    def convert(value):
+        if value.__class__ is exact:
+            return value
+        return converter(value)
+
+    return convert
+
+
+def _identity(value):
+    return value
+
+
+def _union_converter(members: tuple) -> Converter:
+    optional = type(None) in members
+    members = tuple(m for m in members if m is not type(None))
+    exact = tuple(m for m in members if isinstance(m, type))
+    converters = tuple(_fast(m) for m in members)
+
+    if len(converters) == 1:
+        (only,) = converters
+
+        def convert(value):
+            if optional and (value is None or value == ""):
+                return None
+            return only(value)
+
+        return convert
+
+    def convert(value):
+        if optional and (value is None or value == ""):
+            return None
+        if value.__class__ in exact:
+            return value
+        for converter in converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+        raise ValueError(f"{value!r} matches none of {members!r}")
+
+    return convert
+
+
+def _literal_converter(choices: tuple) -> Converter:
+    allowed = set(choices)
+    kinds = tuple(_fast(kind) for kind in dict.fromkeys(type(c) for c in choices))
+
+    def convert(value):
+        if value in allowed:
+            return value
+        for converter in kinds:
+            try:
+                converted = converter(value)
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+            if converted in allowed:
+                return converted
+        raise ValueError(f"{value!r} is not one of {choices!r}")
+
+    return convert
+
+
+def _enum_converter(enum: type) -> Converter:
+    values = tuple(dict.fromkeys(type(m.value) for m in enum))
+    value_converters = tuple(_fast(kind) for kind in values)
+
+    def convert(value):
+        try:
+            return enum(value)
+        except ValueError:
+            pass
+        if isinstance(value, str) and value in enum.__members__:
+            return enum[value]
+        for converter in value_converters:
+            try:
+                return enum(converter(value))
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+        raise ValueError(f"{value!r} is not a valid {enum.__name__}")
+
+    return convert
+
+
+__all__ = ("register_converter", "make_converter", "value_type", "EXCEL_EPOCH")
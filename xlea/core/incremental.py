@@ -0,0 +1,273 @@
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Type, Union
+
+from xlea.core.bound_schema import BoundSchema
+from xlea.core.cache import HeaderCache, _Transaction
+from xlea.core.row import make_row_type
+from xlea.core.types import TSchema
+from xlea.exc import DuplicateKeyError, MissingRequiredColumnError
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import release
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+class Change(NamedTuple):
+    """
+    A row added, changed or removed since the previous read.
+
+    Attributes
+    ----------
+    kind : str
+        ``"added"``, ``"changed"`` or ``"removed"``.
+    key : tuple
+        Values of the key columns, converted to their annotated types.
+    row : TSchema | None
+        The row, ``None`` for removed rows.
+    """
+
+    kind: str
+    key: tuple
+    row: Optional[Any]
+
+
+class ChangeState:
+    """
+    On-disk digests of the rows of previous reads, for ``read_changes()``.
+
+    One 8-byte content digest is kept per row key, so the state stays
+    small even for large sheets. It is stored in a SQLite database and
+    holds one independent set of rows per dataset.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the SQLite database, created if missing.
+
+    Examples
+    --------
+    ::
+
+        state = ChangeState("~/.cache/xlea/prices.sqlite")
+        for change in read_changes(provider, Price, state, dataset="vendor"):
+            ...
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS rows ("
+                "dataset TEXT NOT NULL, key TEXT NOT NULL, digest BLOB NOT NULL, "
+                "PRIMARY KEY (dataset, key)) WITHOUT ROWID"
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def clear(self, dataset: Optional[str] = None):
+        """
+        Forget the rows of ``dataset``, or of every dataset.
+        """
+
+        with self._connect() as db:
+            if dataset is None:
+                db.execute("DELETE FROM rows")
+            else:
+                db.execute("DELETE FROM rows WHERE dataset = ?", (dataset,))
+
+    def load(self, dataset: str) -> dict[str, bytes]:
+        """
+        Return the digests of the rows of ``dataset`` by encoded key.
+        """
+
+        with self._connect() as db:
+            return dict(
+                db.execute("SELECT key, digest FROM rows WHERE dataset = ?", (dataset,))
+            )
+
+    def update(
+        self,
+        dataset: str,
+        digests: Iterable[tuple[str, bytes]],
+        removed: Iterable[str],
+    ):
+        """
+        Store the digests of added and changed rows and forget removed ones.
+        """
+
+        with self._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO rows VALUES (?, ?, ?)",
+                ((dataset, key, digest) for key, digest in digests),
+            )
+            db.executemany(
+                "DELETE FROM rows WHERE dataset = ? AND key = ?",
+                ((dataset, key) for key in removed),
+            )
+
+    def _connect(self):
+        import sqlite3
+
+        return _Transaction(sqlite3.connect(self.path, timeout=30))
+
+
+def read_changes(
+    provider: ProviderProto,
+    schema: Type[TSchema],
+    state: ChangeState,
+    *,
+    dataset: Optional[str] = None,
+    cache: Optional[HeaderCache] = None,
+) -> Iterator[Change]:
+    """
+    Read only the rows added, changed or removed since the previous read.
+
+    Rows are identified by the columns declared with ``Column(key=True)``.
+    Each data row is hashed as read from the provider; rows whose digest
+    matches the state are skipped before a row object is built, so
+    unchanged rows cost little more than reading them.
+
+    Parameters
+    ----------
+    provider : ProviderProto
+        Data provider instance producing raw rows.
+    schema : type
+        Schema class with at least one key column.
+    state : ChangeState
+        Digests of the previous read, updated by this one.
+    dataset : str, optional
+        Name of the rows in ``state``. Defaults to the schema's qualified
+        name; pass one per source when several sources share a schema.
+    cache : HeaderCache, optional
+        Cache of resolved header layouts, see ``read()``.
+
+    Yields
+    ------
+    Change
+        Added and changed rows in file order, then removed rows.
+
+    Raises
+    ------
+    ValueError
+        If the schema has no key column.
+    MissingRequiredColumnError
+        If a key column is not found in the header.
+    DuplicateKeyError
+        If two data rows have the same key.
+
+    Notes
+    -----
+    The state is only updated once every change has been consumed: a read
+    stopped early leaves the state of the previous read untouched. Rows
+    rejected by a ``skip_invalid_row`` validator count as absent. Keys and
+    digests cover the raw values of the bound columns, so a file
+    re-exported to another format (e.g. ``.xls`` to ``.xlsx``) may report
+    every row as removed and added again.
+    """
+
+    if dataset is None:
+        dataset = f"{schema.__module__}.{schema.__qualname__}"
+    return _read_changes(provider, schema, state, dataset, cache)
+
+
+def _read_changes(
+    provider: ProviderProto,
+    schema: Type[TSchema],
+    state: ChangeState,
+    dataset: str,
+    cache: Optional[HeaderCache],
+) -> Iterator[Change]:
+    from hashlib import blake2b
+
+    rows = None
+    try:
+        rows = provider.rows()
+        bound = BoundSchema(rows, schema).resolve(cache)
+        RowType = make_row_type(schema)
+        data_rows = bound.data_rows(provider)
+        plan = bound.plan
+        keys = _key_columns(plan, schema)
+        key_indices = [index for index, _ in keys]
+
+        previous = state.load(dataset)
+        seen = set()
+        digests = []
+        for i, row in enumerate(data_rows):
+            if len(row) <= plan.max_index:
+                row = tuple(row) + (None,) * (plan.max_index - len(row) + 1)
+
+            # Keys are compared as raw values, they are only converted for
+            # the rows that are reported.
+            raw = tuple([_key_value(row[index]) for index in key_indices])
+            encoded = _encode_key(raw)
+            digest = blake2b(repr(tuple(row)).encode(), digest_size=8).digest()
+            old = previous.get(encoded)
+
+            # unchanged rows were valid when they were stored
+            row_object = None
+            if old != digest:
+                row_object = RowType(row, i, bound)
+                if not hasattr(row_object, "row_index"):
+                    continue
+
+            if encoded in seen:
+                raise DuplicateKeyError(f"Duplicate key {raw} in row {i}")
+            seen.add(encoded)
+            previous.pop(encoded, None)
+            if row_object is None:
+                continue
+
+            digests.append((encoded, digest))
+            kind = ADDED if old is None else CHANGED
+            yield Change(kind, _convert_key(raw, keys), row_object)
+
+        for encoded in previous:
+            yield Change(REMOVED, _convert_key(_decode_key(encoded), keys), None)
+
+        state.update(dataset, digests, previous)
+    finally:
+        release(rows, provider)
+
+
+def _key_columns(plan, schema) -> list:
+    keys = []
+    for attr, index, _, col in plan.columns:
+        if not col._key:
+            continue
+        if index is None:
+            raise MissingRequiredColumnError(f"Cant find key column '{col._pattern}'")
+        keys.append((index, col.converter))
+
+    if not keys:
+        raise ValueError(f"{schema.__name__} has no key column, use Column(key=True)")
+    return keys
+
+
+def _key_value(value):
+    # raw keys are stored as JSON
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+def _encode_key(raw: tuple) -> str:
+    # NaN and infinities are written as the NaN and Infinity literals,
+    # which json.loads() reads back
+    return json.dumps(raw, separators=(",", ":"))
+
+
+def _decode_key(encoded: str) -> tuple:
+    return tuple(json.loads(encoded))
+
+
+def _convert_key(raw: tuple, keys: list) -> tuple:
+    return tuple([convert(value) for value, (_, convert) in zip(raw, keys)])
+
+
+__all__ = ("read_changes", "ChangeState", "Change", "ADDED", "CHANGED", "REMOVED")
@@ -0,0 +1,270 @@
+from typing import Any, Callable, Iterator, Mapping
+
+from xlea.core.bound_schema import BoundSchema
+from xlea.core.row import make_row_type
+from xlea.core.types import TSchema
+from xlea.exc import DuplicateKeyError
+from xlea.providers.utils import release
+
+ERROR = "error"
+FIRST = "first"
+LAST = "last"
+
+_POLICIES = (ERROR, FIRST, LAST)
+
+
+class Rows(Iterator[TSchema]):
+    """
+    Iterator of the row objects of a read, returned by ``read()`` with a
+    schema.
+
+    Besides being iterated, the rows of a read can be indexed by schema
+    attributes with ``index_by()``, ``group_by()`` and ``unique()``. These
+    consume the read in a single pass that only converts the key columns:
+    rows are kept as the raw tuples of their bound columns and row objects
+    are built when looked up.
+
+    Notes
+    -----
+    Indexes are built from the rows not yet read, so they must be requested
+    before the iteration starts. Every lookup builds a new row object.
+    """
+
+    def __init__(self, rows: Iterator[TSchema], prepared: Iterator, provider=None):
+        self._rows = rows
+        self._prepared = prepared
+        self._provider = provider
+        self._started = False
+
+    def __next__(self) -> TSchema:
+        self._started = True
+        return next(self._rows)
+
+    def close(self):
+        """
+        Stop the read and release its provider, even if no row was read.
+        """
+
+        release(self._rows, self._prepared, self._provider)
+
+    def index_by(self, *attrs: str, on_duplicate: str = ERROR) -> "RowIndex[TSchema]":
+        """
+        Index the rows by the values of one or more schema attributes.
+
+        Parameters
+        ----------
+        *attrs : str
+            Schema attributes of the key. Keys are the converted values,
+            tuples of them for several attributes.
+        on_duplicate : {"error", "first", "last"}, default="error"
+            Whether a duplicated key raises, or keeps the first or the last
+            row with that key.
+
+        Returns
+        -------
+        RowIndex[TSchema]
+            Mapping of keys to rows.
+
+        Raises
+        ------
+        DuplicateKeyError
+            If two rows have the same key and ``on_duplicate="error"``.
+        """
+
+        bound, entries = self._index(attrs, on_duplicate)
+        return RowIndex(entries, bound)
+
+    def group_by(self, *attrs: str) -> "RowGroups[TSchema]":
+        """
+        Group the rows by the values of one or more schema attributes.
+
+        Parameters
+        ----------
+        *attrs : str
+            Schema attributes of the key, see ``index_by()``.
+
+        Returns
+        -------
+        RowGroups[TSchema]
+            Mapping of keys to the lists of rows with that key, in file
+            order.
+        """
+
+        bound, prepared = self._take()
+        key = _key_function(bound, attrs)
+        groups: dict[Any, list] = {}
+        try:
+            for entry in prepared:
+                k = key(entry[1])
+                group = groups.get(k)
+                if group is None:
+                    groups[k] = [entry]
+                else:
+                    group.append(entry)
+        finally:
+            release(prepared)
+        return RowGroups(groups, bound)
+
+    def unique(self, *attrs: str, on_duplicate: str = FIRST) -> Iterator[TSchema]:
+        """
+        Return the rows of the read with distinct keys.
+
+        Parameters
+        ----------
+        *attrs : str
+            Schema attributes of the key, see ``index_by()``.
+        on_duplicate : {"error", "first", "last"}, default="first"
+            Whether a duplicated key raises, or keeps the first or the last
+            row with that key.
+
+        Returns
+        -------
+        Iterator[TSchema]
+            Rows with distinct keys, ordered by the position of the kept
+            row in the file.
+
+        Raises
+        ------
+        DuplicateKeyError
+            If two rows have the same key and ``on_duplicate="error"``.
+        """
+
+        bound, entries = self._index(attrs, on_duplicate)
+        build = make_row_type(bound._schema)._from_prepared
+        return (build(row, i, bound) for i, row in entries.values())
+
+    def _index(self, attrs: tuple[str, ...], on_duplicate: str) -> tuple:
+        if on_duplicate not in _POLICIES:
+            raise ValueError(
+                f"on_duplicate must be one of {_POLICIES}, got {on_duplicate!r}"
+            )
+
+        bound, prepared = self._take()
+        key = _key_function(bound, attrs)
+        entries: dict[Any, tuple[int, tuple]] = {}
+        try:
+            for entry in prepared:
+                k = key(entry[1])
+                previous = entries.get(k)
+                if previous is not None:
+                    if on_duplicate == FIRST:
+                        continue
+                    if on_duplicate == ERROR:
+                        raise DuplicateKeyError(
+                            f"Duplicate key {k!r} in rows {previous[0]} and {entry[0]}"
+                        )
+                    # moved to the end to keep entries in file order
+                    del entries[k]
+                entries[k] = entry
+        finally:
+            release(prepared)
+        return bound, entries
+
+    def _take(self) -> tuple[BoundSchema, Iterator[tuple[int, tuple]]]:
+        if self._started:
+            raise RuntimeError(
+                "index_by(), group_by() and unique() must be called before "
+                "iterating the rows"
+            )
+        self._started = True
+        release(self._rows)
+        return next(self._prepared), self._prepared
+
+
+class RowIndex(Mapping[Any, TSchema]):
+    """
+    Rows of a read by key, built by ``Rows.index_by()``.
+
+    Row objects are built on lookup from the stored rows, which were
+    validated during the read.
+    """
+
+    def __init__(self, entries: dict[Any, tuple[int, tuple]], bound: BoundSchema):
+        self._entries = entries
+        self._bound = bound
+        self._build = make_row_type(bound._schema)._from_prepared
+
+    def __getitem__(self, key) -> TSchema:
+        i, row = self._entries[key]
+        return self._build(row, i, self._bound)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"RowIndex({self._bound._schema.__name__}, {len(self)} rows)"
+
+
+class RowGroups(Mapping[Any, list[TSchema]]):
+    """
+    Rows of a read grouped by key, built by ``Rows.group_by()``.
+
+    Row objects are built on lookup from the stored rows, which were
+    validated during the read.
+    """
+
+    def __init__(self, groups: dict[Any, list[tuple[int, tuple]]], bound: BoundSchema):
+        self._groups = groups
+        self._bound = bound
+        self._build = make_row_type(bound._schema)._from_prepared
+
+    def __getitem__(self, key) -> list[TSchema]:
+        build, bound = self._build, self._bound
+        return [build(row, i, bound) for i, row in self._groups[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self._groups
+
+    def __iter__(self) -> Iterator:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def count(self, key) -> int:
+        """
+        Return the number of rows with ``key``, 0 if there is none.
+        """
+
+        group = self._groups.get(key)
+        return 0 if group is None else len(group)
+
+    def __repr__(self):
+        return f"RowGroups({self._bound._schema.__name__}, {len(self)} keys)"
+
+
+def _key_function(bound: BoundSchema, attrs: tuple[str, ...]) -> Callable:
+    if not attrs:
+        raise ValueError("At least one schema attribute is required")
+
+    accessors = bound.plan.accessors
+    for attr in attrs:
+        if attr not in accessors:
+            raise ValueError(f"{bound._schema.__name__} has no column {attr!r}")
+
+    if len(attrs) == 1:
+        index, convert, default = accessors[attrs[0]]
+        if index is None:
+            return lambda row: default
+        return lambda row: convert(row[index])
+
+    getters = [accessors[attr] for attr in attrs]
+
+    def key(row):
+        return tuple(
+            [
+                default if index is None else convert(row[index])
+                for index, convert, default in getters
+            ]
+        )
+
+    return key
+
+
+__all__ = ("Rows", "RowIndex", "RowGroups")
@@ -0,0 +1,164 @@
+import re
+from re import Pattern
+from typing import Callable, Iterable, Mapping, Optional
+
+from xlea.core.column import _Column
+
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.ASCII, "a"),
+)
+# Patterns that refer to groups by number or change flags globally can't be
+# embedded in a larger expression without changing their meaning.
+_NOT_COMBINABLE = re.compile(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+class HeaderMatcher:
+    """
+    Compiled header matching for all columns of a schema.
+
+    Column patterns are indexed by kind so that a header cell is matched
+    against every column at once:
+
+    - exact strings are looked up in a dict;
+    - case-insensitive strings are looked up in a dict of casefolded
+      patterns;
+    - regular expressions are combined into one expression with a named
+      group per column, so a single ``match`` call reports every column
+      whose expression occurs in the cell;
+    - callables, and expressions that can't be combined (backreferences,
+      conditionals, global inline flags, verbose mode), are tried one by
+      one.
+
+    Parameters
+    ----------
+    columns : Mapping[str, _Column]
+        Schema columns keyed by attribute name.
+    delimiter : str
+        Delimiter joining the parts of hierarchical headers.
+    """
+
+    def __init__(self, columns: Mapping[str, _Column], delimiter: str):
+        self._exact: dict[str, list[str]] = {}
+        self._folded: dict[str, list[str]] = {}
+        self._scan: list[tuple[str, Callable[[str], bool]]] = []
+        self._regex: Optional[Pattern[str]] = None
+        self._groups: dict[str, str] = {}
+
+        regexes = []
+        for attr, col in columns.items():
+            pattern = col._pattern
+            if isinstance(pattern, str):
+                if col._ignore_case:
+                    self._folded.setdefault(col._folded, []).append(attr)
+                else:
+                    self._exact.setdefault(pattern, []).append(attr)
+            elif isinstance(pattern, Pattern):
+                regexes.append((attr, pattern))
+            else:
+                self._scan.append((attr, pattern))
+        self._combine(regexes)
+
+        self.required = frozenset(
+            attr for attr, col in columns.items() if col._required
+        )
+
+        folded_delimiter = delimiter.casefold()
+        self.exact_prefixes = tuple(
+            _prefixes(col._pattern, delimiter)
+            for col in columns.values()
+            if col._required and _is_name(col._pattern) and not col._ignore_case
+        )
+        self.folded_prefixes = tuple(
+            _prefixes(col._folded, folded_delimiter)
+            for col in columns.values()
+            if col._required and _is_name(col._pattern) and col._ignore_case
+        )
+
+    def _combine(self, regexes: list[tuple[str, Pattern[str]]]):
+        combined, parts = [], []
+        for attr, pattern in regexes:
+            if not _combinable(pattern):
+                self._scan.append((attr, pattern.search))
+                continue
+            group = f"c{len(combined)}"
+            combined.append((attr, pattern))
+            parts.append(f"(?:(?=[\\s\\S]*?(?P<{group}>{_scoped(pattern)})))?")
+
+        if not parts:
+            return
+        try:
+            self._regex = re.compile("".join(parts))
+        except re.error:
+            self._scan.extend((attr, pattern.search) for attr, pattern in combined)
+            return
+        self._groups = {f"c{i}": attr for i, (attr, _) in enumerate(combined)}
+
+    def match(self, value: str) -> list[str]:
+        """
+        Return the attributes of all columns matching the header ``value``.
+        """
+
+        matched = list(self._exact.get(value, ()))
+        if self._folded:
+            matched.extend(self._folded.get(value.casefold(), ()))
+        if self._regex is not None:
+            groups = self._regex.match(value).groupdict()
+            matched.extend(
+                self._groups[g] for g, found in groups.items() if found is not None
+            )
+        for attr, predicate in self._scan:
+            if predicate(value):
+                matched.append(attr)
+        return matched
+
+    def may_contain_header(self, cells: Iterable[str]) -> bool:
+        """
+        Cheaply check whether a multi-row header could be built from ``cells``.
+
+        A flattened header cell starts with one of the raw cells of its
+        rows, so every required exact (or case-insensitive) pattern needs a
+        raw cell equal to one of its delimiter-cut prefixes. A ``False``
+        result is definitive, ``True`` still requires a full match.
+        """
+
+        cells = set(cells)
+        for prefixes in self.exact_prefixes:
+            if cells.isdisjoint(prefixes):
+                return False
+
+        if self.folded_prefixes:
+            folded = {c.casefold() for c in cells}
+            for prefixes in self.folded_prefixes:
+                if folded.isdisjoint(prefixes):
+                    return False
+        return True
+
+
+def _is_name(pattern) -> bool:
+    # An empty name matches a flattened header made only of empty cells.
+    return isinstance(pattern, str) and pattern != ""
+
+
+def _prefixes(pattern: str, delimiter: str) -> frozenset[str]:
+    out = {pattern}
+    idx = pattern.find(delimiter)
+    while idx != -1:
+        out.add(pattern[:idx])
+        idx = pattern.find(delimiter, idx + 1)
+    return frozenset(out)
+
+
+def _combinable(pattern: Pattern) -> bool:
+    return (
+        isinstance(pattern.pattern, str)
+        and not pattern.flags & re.VERBOSE
+        and _NOT_COMBINABLE.search(pattern.pattern) is None
+    )
+
+
+def _scoped(pattern: Pattern[str]) -> str:
+    flags = "".join(f for flag, f in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{pattern.pattern})"
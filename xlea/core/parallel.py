@@ -0,0 +1,392 @@
+import glob
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from itertools import count, islice, product
+from pathlib import Path
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from xlea.core.columnar import read_columns
+from xlea.core.constants import DEFAULT_BATCH_SIZE, DEFAULT_SHARD_ROWS
+from xlea.core.reader import read
+from xlea.core.types import TSchema
+from xlea.providers import providers
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import release
+from xlea.exc import UnknownFileExtensionError
+
+
+class FileResult(NamedTuple):
+    """
+    Outcome of reading one sheet of one file in ``read_many()``.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the file that was read.
+    sheet : str | None
+        Sheet that was read, ``None`` for the provider's default sheet.
+    records : list | None
+        Rows as ``asdict()`` dictionaries, or column batches as produced by
+        ``read_columns()`` when ``columnar=True``. ``None`` on error.
+    error : BaseException | None
+        Exception raised while reading the file, if any.
+    """
+
+    path: Path
+    sheet: Optional[str]
+    records: Optional[list]
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def read_many(
+    paths: Union[str, Path, Iterable[Union[str, Path]]],
+    schema: Type[TSchema],
+    sheets: Union[str, Sequence[Optional[str]], None] = None,
+    *,
+    executor: Union[str, Executor] = "process",
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    columnar: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[FileResult]:
+    """
+    Read many files (and sheets) with one schema in parallel.
+
+    Parameters
+    ----------
+    paths : str | Path | Iterable[str | Path]
+        Files to read. Strings containing glob wildcards (``*``, ``?``,
+        ``[``) are expanded, ``**`` matches recursively.
+    schema : type
+        Schema class used to map rows. With a process executor the schema
+        must be importable (defined at module level) to be picklable.
+    sheets : str | Sequence[str | None], optional
+        Sheet or sheets read from every file. ``None`` reads the default
+        sheet of each file.
+    executor : {"process", "thread"} | Executor, default="process"
+        Pool used to read the files. An executor instance is used as is
+        and is not shut down.
+    workers : int, optional
+        Number of workers of the pool created for ``"process"`` and
+        ``"thread"``.
+    ordered : bool, default=True
+        Yield results in input order. If ``False``, results are yielded
+        as soon as they are completed.
+    columnar : bool, default=False
+        Return column batches from ``read_columns()`` instead of rows.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Batch size used when ``columnar=True``.
+
+    Yields
+    ------
+    FileResult
+        One result per file and sheet. Errors are captured in the result
+        instead of being raised.
+
+    Notes
+    -----
+    Rows are returned as plain ``asdict()`` dictionaries because row objects
+    are instances of dynamically generated classes, which can't be
+    transferred between processes.
+
+    At most twice as many files as workers are submitted ahead of the
+    result being consumed, so memory use is bounded by the results in
+    flight rather than by the number of files.
+    """
+
+    if isinstance(sheets, str) or sheets is None:
+        sheets = [sheets]
+    tasks = product(_expand_paths(paths), sheets)
+
+    pool, owned = _make_pool(executor, workers)
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending: deque[Future] = deque()
+
+    def submit():
+        for path, sheet in islice(tasks, window - len(pending)):
+            pending.append(
+                pool.submit(_read_file, path, sheet, schema, columnar, batch_size)
+            )
+
+    def take() -> FileResult:
+        # futures are dropped once taken, so yielded records are not kept
+        if ordered:
+            future = pending.popleft()
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            future = next(f for f in pending if f in done)
+            pending.remove(future)
+        submit()
+        return future.result()
+
+    try:
+        submit()
+        while pending:
+            yield take()
+    finally:
+        for f in pending:
+            f.cancel()
+        if owned:
+            pool.shutdown(wait=True)
+
+
+def read_parallel(
+    path: Union[str, Path],
+    schema: Type[TSchema],
+    sheet: Optional[str] = None,
+    *,
+    executor: Union[str, Executor] = "process",
+    workers: Optional[int] = None,
+    shard_rows: int = DEFAULT_SHARD_ROWS,
+    provider: Optional[Type[ProviderProto]] = None,
+    **options,
+) -> Iterator[TSchema]:
+    """
+    Read one large sheet with its rows parsed by parallel workers.
+
+    The header is resolved once, then the data rows are split in ranges
+    of ``shard_rows`` rows, each parsed by a worker with the provider's
+    ``iter_rows(start, columns, stop)``. Rows are bound to the schema as
+    ranges come back, in file order, exactly as in ``read()`` with the
+    same provider.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the input file.
+    schema : type
+        Schema class used to map rows into structured objects.
+    sheet : str, optional
+        Sheet name for multi-sheet formats.
+    executor : {"process", "thread"} | Executor, default="process"
+        Pool parsing the row ranges, see ``read_many()``.
+    workers : int, optional
+        Number of workers of the pool created for ``"process"`` and
+        ``"thread"``.
+    shard_rows : int, default=DEFAULT_SHARD_ROWS
+        Number of rows per range.
+    provider : type, optional
+        Provider class used instead of the one registered for the file
+        extension, e.g. ``XLSXStreamProvider`` to parse ``.xlsx`` files
+        in parallel when ``OpenPyXlProvider`` is registered for them.
+    **options
+        Keyword arguments of ``read()``.
+
+    Returns
+    -------
+    Iterator[TSchema]
+        Iterator of schema instances.
+
+    Raises
+    ------
+    UnknownFileExtensionError
+        If no provider is given nor registered for the file extension.
+
+    Notes
+    -----
+    Workers open the file themselves, so ranges are only read in parallel
+    with providers reaching the first row of a range without reading the
+    rows before it (``seekable`` providers, see ``ProviderProto``), such
+    as ``XLSXStreamProvider``. Other providers read the file sequentially
+    in the calling process, as ``read()`` does: re-reading every row
+    before each range would cost more than parsing in parallel saves.
+
+    ``XLSXStreamProvider`` does not read styles, so its date cells are
+    Excel serial numbers where ``OpenPyXlProvider`` returns datetimes.
+    ``date`` and ``datetime`` columns convert both, but untyped and
+    ``str`` columns differ between the two providers.
+
+    The pool is created when the first rows are requested, and shut down
+    when the read ends. The number of ranges parsed ahead is bounded to
+    twice the number of workers, which bounds memory use.
+    """
+
+    path = Path(path)
+    provider_type = provider or providers.select_by_extension(path.suffix)
+    if not provider_type:
+        raise UnknownFileExtensionError(
+            f"Cant find provider for extension {path.suffix}"
+        )
+
+    if not isinstance(executor, Executor) and executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor {executor!r}")
+
+    opened = provider_type(path, sheet)
+    if not getattr(provider_type, "seekable", False):
+        return read(opened, schema, **options)
+
+    window = 2 * (workers or os.cpu_count() or 1)
+    sharded = _ShardedProvider(
+        opened, path, sheet, executor, workers, shard_rows, window
+    )
+    return read(sharded, schema, **options)
+
+
+class _ShardedProvider:
+    # Provider reading the header itself and data row ranges in a pool.
+
+    def __init__(
+        self,
+        provider: ProviderProto,
+        path: Path,
+        sheet: Optional[str],
+        executor: Union[str, Executor],
+        workers: Optional[int],
+        shard_rows: int,
+        window: int,
+    ):
+        self._provider = provider
+        self._path = path
+        self._sheet = sheet
+        self._executor = executor
+        self._workers = workers
+        self._pool: Optional[Executor] = None
+        self._owned = False
+        self._shard_rows = shard_rows
+        self._window = window
+        self._pending: deque[Future] = deque()
+
+    def rows(self):
+        return self._provider.rows()
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        row_count = getattr(self._provider, "row_count", None)
+        end = None if row_count is None else row_count()
+        if end is not None and stop is not None:
+            end = min(end, stop)
+        return self._iter_shards(start, stop, end, columns)
+
+    def _iter_shards(self, start, stop, end, columns) -> Iterator[tuple]:
+        # Without a known end, ranges are submitted until one comes back
+        # shorter than requested. With one, the last range is open-ended
+        # (up to ``stop``) in case the declared row count is stale.
+        limit = stop if end is None else end
+        starts = count(start, self._shard_rows)
+        exhausted = False
+        if self._pool is None:
+            self._pool, self._owned = _make_pool(self._executor, self._workers)
+
+        def submit():
+            nonlocal exhausted
+            first = next(starts)
+            last = first + self._shard_rows
+            if limit is not None and last >= limit:
+                last, exhausted = stop, True
+            self._pending.append(
+                self._pool.submit(
+                    _read_range,
+                    type(self._provider),
+                    self._path,
+                    self._sheet,
+                    first,
+                    last,
+                    columns,
+                )
+            )
+
+        while not exhausted and len(self._pending) < self._window:
+            submit()
+
+        while self._pending:
+            rows = self._pending.popleft().result()
+            yield from rows
+            if len(rows) < self._shard_rows:
+                return
+            if not exhausted:
+                submit()
+
+    def close(self):
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._owned:
+            self._pool.shutdown(wait=True)
+        self._pool, self._owned = None, False
+        release(self._provider)
+
+
+def _read_range(
+    provider_type: type,
+    path: Path,
+    sheet: Optional[str],
+    start: int,
+    stop: Optional[int],
+    columns: Optional[Sequence[int]],
+) -> list[tuple]:
+    with provider_type(path, sheet) as provider:
+        rows = provider.iter_rows(start=start, columns=columns, stop=stop)
+        return [tuple(row) for row in rows]
+
+
+def _make_pool(executor: Union[str, Executor], workers: Optional[int]):
+    if isinstance(executor, Executor):
+        return executor, False
+    if executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=workers), True
+    if executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=workers), True
+    raise ValueError(f"Unknown executor {executor!r}")
+
+
+def _expand_paths(paths) -> list[Path]:
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    out = []
+    for path in paths:
+        if isinstance(path, str) and any(c in path for c in "*?["):
+            out.extend(Path(p) for p in sorted(glob.glob(path, recursive=True)))
+        else:
+            out.append(Path(path))
+    return out
+
+
+def _read_file(
+    path: Path,
+    sheet: Optional[str],
+    schema: Type[TSchema],
+    columnar: bool,
+    batch_size: int,
+) -> FileResult:
+    try:
+        provider = providers.select_by_extension(path.suffix)
+        if not provider:
+            raise UnknownFileExtensionError(
+                f"Cant find provider for extension {path.suffix}"
+            )
+
+        records: list[Any]
+        if columnar:
+            records = list(read_columns(provider(path, sheet), schema, batch_size))
+        else:
+            records = [row.asdict() for row in read(provider(path, sheet), schema)]
+    except Exception as exc:
+        return FileResult(path, sheet, None, exc)
+
+    return FileResult(path, sheet, records, None)
+
+
+__all__ = ("read_many", "read_parallel", "FileResult")
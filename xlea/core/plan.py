@@ -0,0 +1,97 @@
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Sequence
+
+
+class ColumnBinding(NamedTuple):
+    """
+    Position of a schema column in the rows of a single read.
+
+    Attributes
+    ----------
+    attr : str
+        Schema attribute name of the column.
+    index : int | None
+        Index of the column in the raw rows, ``None`` if unresolved.
+    name : str | None
+        Header value the column was matched against.
+    column : _Column
+        The column descriptor.
+    """
+
+    attr: str
+    index: Optional[int]
+    name: Optional[str]
+    column: Any
+
+
+class RowPlan(NamedTuple):
+    """
+    Immutable per-read description of how raw rows map to a schema.
+
+    A plan is compiled once by ``BoundSchema.resolve()`` and shared by every
+    row object produced by the read, so row construction does not have to
+    re-derive column positions from the schema. Column descriptors are never
+    mutated, which keeps concurrent reads of one schema independent.
+
+    Attributes
+    ----------
+    max_index : int
+        Largest bound column index. Shorter rows are padded up to it.
+    indices : tuple[int, ...]
+        Bound column indices in ascending order.
+    index_by_name : Mapping[str, int]
+        Header name to column index mapping of the bound columns.
+    index_by_attr : Mapping[str, int | None]
+        Schema attribute to column index mapping of every column.
+    validators : tuple[tuple[int, Callable[[str], bool], bool], ...]
+        ``(index, validator, skip_invalid_row)`` triples of the bound
+        columns that declare a validator.
+    accessors : Mapping[str, tuple[int | None, Callable[[Any], Any], Any]]
+        Schema attribute to ``(index, convert, default)`` mapping used to
+        read converted values out of a row.
+    columns : tuple[ColumnBinding, ...]
+        Bindings of every schema column in declaration order.
+    """
+
+    max_index: int
+    indices: tuple[int, ...]
+    index_by_name: Mapping[str, int]
+    index_by_attr: Mapping[str, Optional[int]]
+    validators: tuple[tuple[int, Callable[[str], bool], bool], ...]
+    accessors: Mapping[str, tuple[Optional[int], Callable[[Any], Any], Any]]
+    columns: tuple[ColumnBinding, ...]
+
+
+def compile_plan(columns: tuple[ColumnBinding, ...]) -> RowPlan:
+    bound = [c for c in columns if c.index is not None]
+    index_by_name = {c.name: c.index for c in bound}
+
+    return RowPlan(
+        max_index=max((c.index for c in bound), default=0),
+        indices=tuple(sorted(index_by_name.values())),
+        index_by_name=MappingProxyType(index_by_name),
+        index_by_attr=MappingProxyType({c.attr: c.index for c in columns}),
+        validators=tuple(
+            (c.index, c.column._validator, c.column._skip_invalid_row)
+            for c in bound
+            if c.column._validator is not None
+        ),
+        accessors=MappingProxyType(
+            {c.attr: (c.index, c.column.converter, c.column._default) for c in columns}
+        ),
+        columns=columns,
+    )
+
+
+def project_plan(plan: RowPlan, columns: Sequence[int]) -> RowPlan:
+    """
+    Remap ``plan`` onto rows that only contain ``columns``, in that order.
+    """
+
+    positions = {index: pos for pos, index in enumerate(columns)}
+    return compile_plan(
+        tuple(
+            c if c.index is None else c._replace(index=positions[c.index])
+            for c in plan.columns
+        )
+    )
@@ -1,27 +1,68 @@
-from typing import Iterator, overload, Iterable, Type, Optional, Union
+from itertools import islice
+from time import perf_counter
+from typing import Iterator, NamedTuple, overload, Iterable, Type, Optional, Union
 from pathlib import Path
 
 from xlea.core.types import TSchema
-from xlea.core.row import make_row_type
+from xlea.core.row import make_row_type, _prepare_row
 from xlea.core.bound_schema import BoundSchema
+from xlea.core.cache import HeaderCache
+from xlea.core.categorical import categorical_indices, interned_rows
+from xlea.core.index import Rows
+from xlea.core.report import ErrorReport, check_row, checked_plan, shared_indices
+from xlea.core.stats import ReadStats, instrument_plan, instrument_provider
 from xlea.providers.proto import ProviderProto
 from xlea.providers import providers
+from xlea.providers.utils import release
 from xlea.exc import UnknownFileExtensionError
 
 
+class _Window(NamedTuple):
+    # Rows requested by ``read(start=, stop=, sample=, seed=)``.
+
+    start: int = 0
+    stop: Optional[int] = None
+    sample: Optional[float] = None
+    seed: Optional[int] = None
+
+
+_ALL_ROWS = _Window()
+
+
 @overload
 def read(
     provider: ProviderProto,
+    *,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
 ) -> Iterable[Iterable]: ...
 @overload
 def read(
     provider: ProviderProto,
     schema: Type[TSchema],
-) -> Iterator[TSchema]: ...
+    *,
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> Rows[TSchema]: ...
 def read(
     provider: ProviderProto,
     schema: Optional[Type[TSchema]] = None,
-) -> Union[Iterable[Iterable], Iterator[TSchema]]:
+    *,
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> Union[Iterable[Iterable], Rows[TSchema]]:
     """
     Read rows from a provider and optionally bind them to a schema.
 
@@ -31,36 +72,242 @@ def read(
         Data provider instance producing raw rows.
     schema : type, optional
         Schema class used to map rows into structured objects.
+    cache : HeaderCache, optional
+        Cache of resolved header layouts, used to skip the header search
+        for files sharing a template.
+    stats : ReadStats, optional
+        Collect timings and row counts of the read. Reads without stats
+        are not instrumented.
+    errors : ErrorReport, optional
+        Collect invalid cells instead of failing. Every cell of every row
+        is validated and converted; rows with errors are left out and
+        recorded in ``errors``. The rows returned keep the converted
+        values, which ``row["Header"]`` then returns instead of the raw
+        ones.
+    start : int, default=0
+        Index of the first row read. With a schema, rows are counted from
+        the first data row, like ``row_index``.
+    stop : int, optional
+        Index of the row the read stops at, excluded. Defaults to reading
+        up to the last row.
+    sample : float, optional
+        Fraction of the rows returned, drawn at random. Rows left out are
+        never bound to the schema.
+    seed : int, optional
+        Seed of the random sample, for reproducible samples.
 
     Returns
     -------
     Iterable[Iterable]
         Raw rows if no schema is provided.
-    Iterator[TSchema]
-        Iterator of schema instances if a schema is provided.
+    Rows[TSchema]
+        Iterator of schema instances if a schema is provided. Instead of
+        iterating it, ``index_by()``, ``group_by()`` and ``unique()`` index
+        the rows without building a row object per row.
 
     Notes
     -----
-    When a schema is supplied, rows are buffered internally to allow
-    header resolution before data iteration begins.
+    When a schema is supplied, rows are read lazily. Only the rows up to
+    the header (bounded by the ``header_scan_depth`` option of ``@config``)
+    are buffered for header resolution; data rows are streamed straight
+    from the provider and only keep the columns bound by the schema. Values
+    of categorical columns (see ``Column(categorical=True)``) are shared
+    between the rows of a read.
+
+    The provider is closed once the returned iterator is exhausted, raises
+    or is closed (e.g. when the loop consuming it breaks early). Its rows
+    are only requested when the first row is, so a read that is never
+    iterated opens nothing.
+
+    Rows past ``stop`` are never requested from the provider, and providers
+    implementing ``iter_rows`` seek straight to ``start``, so previews of
+    the first rows of a large file do not parse the whole file.
     """
 
-    rows = provider.rows()
+    window = _window(start, stop, sample, seed)
+
+    if stats is not None:
+        if schema is None:
+            return _read_with_stats(provider, schema, cache, stats, errors, window)
+        return Rows(
+            _read_with_stats(provider, schema, cache, stats, errors, window),
+            _read_with_stats(provider, schema, cache, stats, errors, window, True),
+            provider,
+        )
 
     if schema is None:
-        return rows
+        return _read_rows(provider, window)
+
+    return Rows(
+        _read_schema(provider, schema, cache, errors=errors, window=window),
+        _read_schema(provider, schema, cache, None, errors, window, True),
+        provider,
+    )
+
+
+def _window(
+    start: int, stop: Optional[int], sample: Optional[float], seed: Optional[int]
+) -> _Window:
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError("start and stop must be non-negative")
+    if sample is not None and not 0 < sample <= 1:
+        raise ValueError(f"sample must be a fraction in (0, 1], got {sample!r}")
+    if (start, stop, sample) == (0, None, None):
+        return _ALL_ROWS
+    return _Window(start, stop, sample, seed)
+
+
+def _raw_rows(provider: ProviderProto, window: _Window) -> Iterable[Iterable]:
+    if window is _ALL_ROWS:
+        return provider.rows()
+    if hasattr(provider, "iter_rows"):
+        return provider.iter_rows(start=window.start, stop=window.stop)
+    return islice(provider.rows(), window.start, window.stop)
+
 
-    if not isinstance(rows, tuple):
-        rows = tuple(rows)
+def _read_rows(
+    provider: ProviderProto,
+    window: _Window,
+    stats: Optional[ReadStats] = None,
+) -> Iterator[Iterable]:
+    # the provider is only opened once the first row is requested
+    rows = None
+    try:
+        rows = _raw_rows(provider, window)
+        selected = rows
+        if stats is not None:
+            selected = _counted(selected, stats)
+        if window.sample is not None:
+            selected = _sampled(selected, window.sample, window.seed)
+        yield from selected
+    finally:
+        release(rows, provider)
+
+
+def _read_schema(
+    provider: ProviderProto,
+    schema: Type[TSchema],
+    cache: Optional[HeaderCache],
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    window: _Window = _ALL_ROWS,
+    prepared: bool = False,
+) -> Iterator[TSchema]:
+    # With ``prepared``, yields the bound schema, then ``(row_index, row)``
+    # pairs of padded, validated rows instead of row objects. The provider
+    # is only opened once the first row is requested.
+    rows = None
+    skipped = 0
+    try:
+        rows = provider.rows()
+        if stats is None:
+            resolved_schema = BoundSchema(rows, schema).resolve(cache)
+        else:
+            start, provider_seconds = perf_counter(), stats.provider_seconds
+            resolved_schema = BoundSchema(rows, schema).resolve(cache)
+            stats.resolve_seconds += (
+                perf_counter() - start - (stats.provider_seconds - provider_seconds)
+            )
+        RowType = make_row_type(schema)
+
+        data_rows = resolved_schema.data_rows(provider, window.start, window.stop)
+        declared, candidates = categorical_indices(
+            resolved_schema.plan,
+            getattr(schema, "__schema_config__", {}).get("auto_categorical", False),
+        )
+        if declared or candidates:
+            data_rows = interned_rows(data_rows, declared, candidates)
+        if stats is not None:
+            resolved_schema.plan = instrument_plan(resolved_schema.plan, stats)
+            data_rows = _counted(data_rows, stats)
+
+        data_rows = enumerate(data_rows, window.start)
+        if window.sample is not None:
+            data_rows = _sampled(data_rows, window.sample, window.seed)
+        if errors is not None:
+            # rows come out validated and converted, they are not checked twice
+            plan = resolved_schema.plan
+            shared = shared_indices(plan)
+            data_rows = _checked_rows(data_rows, plan, errors, shared, stats)
+            resolved_schema.plan = checked_plan(plan, shared)
+
+        if prepared:
+            yield resolved_schema
+            plan = resolved_schema.plan
+            for i, row in data_rows:
+                row = _prepare_row(row, i, plan)
+                if row is None:
+                    skipped += 1
+                    continue
+                yield i, row
+            return
 
-    resolved_schema = BoundSchema(rows, schema).resolve()
-    RowType = make_row_type(schema)
+        for i, row in data_rows:
+            row_object = RowType(row, i, resolved_schema)
+            if not hasattr(row_object, "row_index"):
+                skipped += 1
+                continue
+            yield row_object
+    finally:
+        # Row objects keep the bound schema, and so the provider iterator,
+        # alive: close it when the read ends rather than when rows are freed.
+        release(rows, provider)
+        if stats is not None:
+            stats.rows_skipped += skipped
 
-    for i, row in enumerate(rows[resolved_schema._data_row :]):
-        row_object = RowType(row, i, resolved_schema)
-        if not hasattr(row_object, "row_index"):
-            continue
-        yield row_object
+
+def _checked_rows(
+    rows: Iterator[tuple[int, Iterable]],
+    plan,
+    errors: ErrorReport,
+    shared: frozenset[int],
+    stats: Optional[ReadStats],
+) -> Iterator[tuple[int, tuple]]:
+    for i, row in rows:
+        invalid_rows = errors.invalid_rows
+        row = check_row(row, i, plan, errors, shared)
+        if row is not None:
+            yield i, row
+        elif stats is not None and errors.invalid_rows == invalid_rows:
+            stats.rows_skipped += 1
+
+
+def _counted(rows: Iterable, stats: ReadStats) -> Iterator:
+    # counts the rows pulled from the provider, before any is left out
+    for row in rows:
+        stats.rows_read += 1
+        yield row
+
+
+def _sampled(rows: Iterable, fraction: float, seed: Optional[int]) -> Iterator:
+    # imported lazily: random pulls in hashlib
+    from random import Random
+
+    draw = Random(seed).random
+    return (row for row in rows if draw() < fraction)
+
+
+def _read_with_stats(
+    provider: ProviderProto,
+    schema: Optional[Type[TSchema]],
+    cache: Optional[HeaderCache],
+    stats: ReadStats,
+    errors: Optional[ErrorReport],
+    window: _Window,
+    prepared: bool = False,
+) -> Iterator:
+    start = perf_counter()
+    provider = instrument_provider(provider, stats)
+    try:
+        if schema is None:
+            yield from _read_rows(provider, window, stats)
+        else:
+            yield from _read_schema(
+                provider, schema, cache, stats, errors, window, prepared
+            )
+    finally:
+        stats.total_seconds += perf_counter() - start
+        stats.finish()
 
 
 @overload
@@ -69,6 +316,10 @@ def autoread(
     sheet: Optional[str] = None,
     *,
     schema: None = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
 ) -> Iterable[Iterable]: ...
 @overload
 def autoread(
@@ -76,13 +327,27 @@ def autoread(
     sheet: Optional[str] = None,
     *,
     schema: Type[TSchema],
-) -> Iterator[TSchema]: ...
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> Rows[TSchema]: ...
 def autoread(
     path: Union[str, Path],
     sheet: Optional[str] = None,
     *,
     schema: Optional[Type[TSchema]] = None,
-) -> Union[Iterable[Iterable], Iterator[TSchema]]:
+    cache: Optional[HeaderCache] = None,
+    stats: Optional[ReadStats] = None,
+    errors: Optional[ErrorReport] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> Union[Iterable[Iterable], Rows[TSchema]]:
     """
     Automatically select a provider based on file extension and read data.
 
@@ -94,13 +359,22 @@ def autoread(
         Sheet name for multi-sheet formats (e.g. spreadsheets).
     schema : type, optional
         Schema class used to map rows into structured objects.
+    cache : HeaderCache, optional
+        Cache of resolved header layouts, see ``read()``.
+    stats : ReadStats, optional
+        Collect timings and row counts of the read, see ``read()``.
+    errors : ErrorReport, optional
+        Collect invalid cells instead of failing, see ``read()``.
+    start, stop, sample, seed
+        Rows read, see ``read()``.
 
     Returns
     -------
     Iterable[Iterable]
         Raw rows if no schema is provided.
-    Iterator[TSchema]
-        Iterator of schema instances if a schema is provided.
+    Rows[TSchema]
+        Iterator of schema instances if a schema is provided, see
+        ``read()``.
 
     Raises
     ------
@@ -118,9 +392,10 @@ def autoread(
         )
 
     provider = provider(path, sheet)
+    window = dict(start=start, stop=stop, sample=sample, seed=seed)
     if schema is None:
-        return read(provider)
-    return read(provider, schema)
+        return read(provider, stats=stats, **window)
+    return read(provider, schema, cache=cache, stats=stats, errors=errors, **window)
 
 
 __all__ = ("read", "autoread")
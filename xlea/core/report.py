@@ -0,0 +1,209 @@
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Iterator, NamedTuple, Optional
+
+from xlea.core.constants import DEFAULT_MAX_ERRORS
+from xlea.core.plan import RowPlan
+
+
+class RowError(NamedTuple):
+    """
+    One invalid cell reported by an ``ErrorReport``.
+
+    Attributes
+    ----------
+    row : int
+        Index of the data row, as ``row_index`` of row objects.
+    column : str
+        Schema attribute of the column.
+    value : Any
+        Raw cell value.
+    reason : str
+        Why the value was rejected.
+    """
+
+    row: int
+    column: str
+    value: Any
+    reason: str
+
+
+class ErrorReport:
+    """
+    Invalid cells collected by a read in collect-errors mode.
+
+    Pass an instance to ``read(..., errors=)``: instead of raising on the
+    first invalid row, every cell of every row is validated and converted,
+    rows with errors are left out of the results and their errors are
+    recorded here.
+
+    Errors are stored column-wise (one list per field) and at most
+    ``max_errors`` are kept, so memory stays bounded on files where every
+    row is invalid. Counters keep covering every error past the cap.
+
+    Parameters
+    ----------
+    max_errors : int, default=DEFAULT_MAX_ERRORS
+        Maximum number of errors stored.
+
+    Attributes
+    ----------
+    rows, columns, values, reasons : list
+        Stored errors, field by field.
+    total : int
+        Number of errors found, including those past the cap.
+    invalid_rows : int
+        Number of rows left out because of errors.
+    by_column : Counter
+        Number of errors per column, including those past the cap.
+    """
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.rows: list[int] = []
+        self.columns: list[str] = []
+        self.values: list[Any] = []
+        self.reasons: list[str] = []
+        self.total = 0
+        self.invalid_rows = 0
+        self.by_column: Counter = Counter()
+
+    def add(self, row: int, column: str, value: Any, reason: str):
+        self.total += 1
+        self.by_column[column] += 1
+        if len(self.rows) >= self.max_errors:
+            return
+        self.rows.append(row)
+        self.columns.append(column)
+        self.values.append(value)
+        self.reasons.append(reason)
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Whether errors were dropped because of ``max_errors``.
+        """
+
+        return self.total > len(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def __iter__(self) -> Iterator[RowError]:
+        return map(
+            RowError._make, zip(self.rows, self.columns, self.values, self.reasons)
+        )
+
+    def asdict(self) -> dict[str, list]:
+        return {
+            "row": self.rows,
+            "column": self.columns,
+            "value": self.values,
+            "reason": self.reasons,
+        }
+
+    def __repr__(self):
+        return (
+            f"ErrorReport(total={self.total}, invalid_rows={self.invalid_rows}, "
+            f"stored={len(self)}, by_column={dict(self.by_column)})"
+        )
+
+
+def check_row(
+    row,
+    row_idx: int,
+    plan: RowPlan,
+    report: ErrorReport,
+    shared: frozenset[int] = frozenset(),
+) -> Optional[tuple]:
+    """
+    Validate and convert every bound cell of ``row``, recording errors.
+
+    Returns the padded row with the converted values of its bound cells if
+    it is valid, ``None`` if it has errors or a ``skip_invalid_row``
+    validator rejected it. Skipped rows are not reported. Cells bound to
+    several columns (``shared``) keep their raw value.
+    """
+
+    if len(row) <= plan.max_index:
+        row = tuple(row) + (None,) * (plan.max_index - len(row) + 1)
+
+    failed = False
+    rejected = set()
+    for index, validator, skip in plan.validators:
+        if validator(row[index]):
+            continue
+        if skip:
+            return None
+        rejected.add(index)
+        failed = True
+
+    converted = list(row)
+    for attr, (index, convert, _) in plan.accessors.items():
+        if index is None:
+            continue
+        if index in rejected:
+            report.add(row_idx, attr, row[index], "validation failed")
+            continue
+        try:
+            value = convert(row[index])
+        except TypeError as exc:
+            report.add(row_idx, attr, row[index], str(exc))
+            failed = True
+            continue
+        if index not in shared:
+            converted[index] = value
+
+    if failed:
+        report.invalid_rows += 1
+        return None
+    return tuple(converted)
+
+
+def shared_indices(plan: RowPlan) -> frozenset[int]:
+    """
+    Return the row indices bound to more than one column of ``plan``.
+    """
+
+    seen = set()
+    shared = set()
+    for c in plan.columns:
+        if c.index is None:
+            continue
+        if c.index in seen:
+            shared.add(c.index)
+        seen.add(c.index)
+    return frozenset(shared)
+
+
+def checked_plan(plan: RowPlan, shared: frozenset[int]) -> RowPlan:
+    """
+    Return the plan of rows returned by ``check_row()``.
+
+    Rows are already validated and their cells converted, so the plan has
+    no validators and reads the converted cells as they are.
+    """
+
+    return plan._replace(
+        validators=(),
+        accessors=MappingProxyType(
+            {
+                attr: (
+                    (index, convert, default)
+                    if index is None or index in shared
+                    else (index, _identity, default)
+                )
+                for attr, (index, convert, default) in plan.accessors.items()
+            }
+        ),
+    )
+
+
+def _identity(value):
+    return value
+
+
+__all__ = ("ErrorReport", "RowError")
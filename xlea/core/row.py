@@ -1,63 +1,114 @@
 from typing import Optional
+
 from xlea.core.bound_schema import BoundSchema
+from xlea.core.column import _Column
+from xlea.core.plan import RowPlan
 from xlea.exc import InvalidRowError
 
 
 def make_row_type(schema):
-    class Row(schema, RowObject):
-        pass
+    """
+    Return the class used to build row objects of ``schema``.
+
+    Row classes hold no per-read state, so the class is created once and
+    cached on the schema.
+    """
+
+    row_type = schema.__dict__.get("__row_type__")
+    if row_type is not None:
+        return row_type
+
+    if getattr(schema, "__schema_config__", {}).get("materialize"):
+        row_type = make_record_type(schema)
+    else:
+
+        class Row(schema, RowObject):
+            pass
+
+        row_type = Row
+
+    setattr(schema, "__row_type__", row_type)
+    return row_type
+
+
+def make_record_type(schema):
+    """
+    Build a slot-based record class for ``schema``.
+
+    The record does not inherit from the schema: columns become slots
+    filled once with converted values, and the schema's own methods and
+    properties are copied over so they keep working on records.
+    """
+
+    namespace = {}
+    for klass in reversed(schema.__mro__):
+        if klass in RowObject.__mro__:
+            continue
+        for attr, value in vars(klass).items():
+            if attr.startswith("__") or isinstance(value, _Column):
+                continue
+            namespace[attr] = value
+
+    namespace["__slots__"] = tuple(
+        attr for attr, col in schema.__dict__.items() if isinstance(col, _Column)
+    )
+    namespace["__module__"] = schema.__module__
+    namespace["__qualname__"] = schema.__qualname__
+    namespace["__doc__"] = schema.__doc__
+
+    return type(schema.__name__, (RecordObject,), namespace)
+
+
+def _prepare_row(row, row_idx, plan: RowPlan) -> Optional[tuple]:
+    if len(row) <= plan.max_index:
+        row = tuple(row) + (None,) * (plan.max_index - len(row) + 1)
+
+    for index, validator, skip in plan.validators:
+        if validator(row[index]):
+            continue
+        if skip:
+            return None
+        raise InvalidRowError(
+            f"The value in row {row_idx} failed validation: {row[index]}"
+        )
 
-    return Row
+    return row
 
 
 class RowObject:
     def __init__(self, row, row_idx, schema: BoundSchema):
-        row = self._normalize_row(row, schema)
-        valid, skip, col_index = self._validate(row, schema)
-        if not valid and not skip:
-            raise InvalidRowError(
-                f"The value in row {row_idx} failed validation: {row[col_index]}"
-            )
-        if not valid:
+        row = _prepare_row(row, row_idx, schema.plan)
+        if row is None:
             return
+        self._bind(row, row_idx, schema)
+
+    @classmethod
+    def _from_prepared(cls, row: tuple, row_idx: int, schema: BoundSchema):
+        """
+        Build a row object from a row already padded and validated.
+        """
+
+        self = cls.__new__(cls)
+        self._bind(row, row_idx, schema)
+        return self
+
+    def _bind(self, row: tuple, row_idx: int, schema: BoundSchema):
         self._row = row
         self._row_idx = row_idx
         self._schema = schema
-        self._col_names = tuple(c.name for c in self._schema._columns.values())
-        self._indeces_by_names = {
-            c.name: c.index for c in self._schema._columns.values()
-        }
-
-    def _validate(self, row, schema: BoundSchema) -> tuple[bool, bool, Optional[int]]:
-        for col in schema._columns.values():
-            if col.index is None:
-                continue
-            valid = col.validate_value(row[col.index])
-            if not valid:
-                return False, col._skip_invalid_row, col.index
-        return True, False, None
-
-    def _normalize_row(self, row, schema: BoundSchema):
-        max_index = max(
-            (c.index for c in schema._columns.values() if c.index is not None),
-            default=0,
-        )
-        if len(row) <= max_index:
-            return row + (None,) * (max_index - len(row) + 1)
-        return row
+        self._plan = schema.plan
 
     def __contains__(self, key):
-        return key in self._col_names
+        return key in self._plan.index_by_name
 
     def __getitem__(self, key):
         if isinstance(key, str):
-            if key in self._col_names:
-                return self._row[self._indeces_by_names[key]]
+            if key in self._plan.index_by_name:
+                return self._row[self._plan.index_by_name[key]]
             raise KeyError(key)
 
         if isinstance(key, int):
-            index = tuple(sorted(self._indeces_by_names.values()))[key]
-            return self._row[index]
+            return self._row[self._plan.indices[key]]
 
     def __dir__(self):
         return list(self._schema._columns.keys())
@@ -76,8 +127,8 @@ class RowObject:
     def __repr__(self):
         values = ", ".join(
             [
-                f"{attr} ({col.name}): {None if col.index is None else self._row[col.index]}"
-                for attr, col in self._schema._columns.items()
+                f"{c.attr} ({c.name}): {None if c.index is None else self._row[c.index]}"
+                for c in self._plan.columns
             ]
         )
         return f"{self._schema._schema.__name__}({values})"
@@ -88,3 +139,100 @@ class RowObject:
 
     def asdict(self):
         return {name: getattr(self, name) for name in self._schema._columns.keys()}
+
+    def astuple(self):
+        row = self._row
+        return tuple(
+            [
+                default if index is None else convert(row[index])
+                for index, convert, default in self._plan.accessors.values()
+            ]
+        )
+
+
+class RecordObject:
+    """
+    Base class of materialized schema records.
+
+    Records are produced when a schema is configured with
+    ``@config(materialize=True)``. Every column value is converted exactly
+    once when the record is built and stored in a slot, so attribute
+    access is a plain slot read and records carry no per-instance
+    ``__dict__``.
+
+    Records are indexed like row objects, by header name or by position
+    among the bound columns, but raw values are not kept: ``record["Age"]``
+    and ``record[0]`` return converted values where ``row["Age"]`` returns
+    the cell as read.
+    """
+
+    __slots__ = ("_row_idx", "_schema")
+
+    def __init__(self, row, row_idx, schema: BoundSchema):
+        row = _prepare_row(row, row_idx, schema.plan)
+        if row is None:
+            return
+        self._bind(row, row_idx, schema)
+
+    @classmethod
+    def _from_prepared(cls, row: tuple, row_idx: int, schema: BoundSchema):
+        """
+        Build a record from a row already padded and validated.
+        """
+
+        self = cls.__new__(cls)
+        self._bind(row, row_idx, schema)
+        return self
+
+    def _bind(self, row: tuple, row_idx: int, schema: BoundSchema):
+        for attr, (index, convert, default) in schema.plan.accessors.items():
+            setattr(self, attr, default if index is None else convert(row[index]))
+
+        self._row_idx = row_idx
+        self._schema = schema
+
+    def __contains__(self, key):
+        return key in self._schema.plan.index_by_name
+
+    def __getitem__(self, key):
+        plan = self._schema.plan
+        if isinstance(key, str):
+            index = plan.index_by_name.get(key)
+            if index is None:
+                raise KeyError(key)
+        elif isinstance(key, int):
+            index = plan.indices[key]
+        else:
+            raise KeyError(key)
+
+        for c in plan.columns:
+            if c.index == index:
+                return getattr(self, c.attr)
+
+    def __dir__(self):
+        return list(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __eq__(self, other):
+        if isinstance(other, (RecordObject, RowObject)):
+            return self.asdict() == other.asdict()
+        if isinstance(other, dict):
+            return self.asdict() == other
+
+        return False
+
+    def __repr__(self):
+        values = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    @property
+    def row_index(self) -> int:
+        return self._row_idx
+
+    def asdict(self):
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def astuple(self):
+        return tuple([getattr(self, attr) for attr in self.__slots__])
@@ -1,8 +1,17 @@
+from typing import Optional
+
 from xlea.core.row import RowObject
-from xlea.core.constants import DEFAULT_DELIMITER
+from xlea.core.constants import DEFAULT_DELIMITER, DEFAULT_HEADER_SCAN_DEPTH
 
 
-def config(header_rows: int = 1, delimiter: str = DEFAULT_DELIMITER, **options):
+def config(
+    header_rows: int = 1,
+    delimiter: str = DEFAULT_DELIMITER,
+    header_scan_depth: Optional[int] = DEFAULT_HEADER_SCAN_DEPTH,
+    materialize: bool = False,
+    auto_categorical: bool = False,
+    **options,
+):
     """
     Configure a schema class with file-level parsing options.
 
@@ -17,6 +26,21 @@ def config(header_rows: int = 1, delimiter: str = DEFAULT_DELIMITER, **options):
         are used for column resolution and are not treated as data rows.
     delimiter : str, default=DEFAULT_DELIMITER
         Field delimiter used by the underlying provider.
+    header_scan_depth : int | None, default=DEFAULT_HEADER_SCAN_DEPTH
+        Maximum number of leading rows inspected while searching for the
+        header. Only these rows are buffered; the rest of the file is
+        streamed. ``None`` scans, and buffers, until the header is found
+        or the file ends.
+    materialize : bool, default=False
+        Convert every value once while reading and yield slot-based
+        records instead of lazily converting row objects. Records are
+        not instances of the schema class, but keep its methods and
+        properties.
+    auto_categorical : bool, default=False
+        Detect low-cardinality columns: columns other than ``int``,
+        ``float``, ``bool``, ``datetime`` and ``date`` ones are handled as
+        if declared with ``Column(categorical=True)`` as long as they have
+        at most ``DEFAULT_CATEGORICAL_LIMIT`` distinct values.
     **options
         Arbitrary additional configuration options. All keyword arguments
         are stored verbatim and made available to the schema resolver.
@@ -38,6 +62,9 @@ def config(header_rows: int = 1, delimiter: str = DEFAULT_DELIMITER, **options):
             {
                 "header_rows": header_rows,
                 "delimiter": delimiter,
+                "header_scan_depth": header_scan_depth,
+                "materialize": materialize,
+                "auto_categorical": auto_categorical,
             }
         )
         setattr(schema, "__schema_config__", options)
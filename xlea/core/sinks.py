@@ -0,0 +1,289 @@
+from contextlib import closing
+from datetime import date, datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from xlea.core.constants import DEFAULT_BATCH_SIZE
+from xlea.core.converters import value_type
+
+_SQLITE_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+}
+
+_ARROW_TYPES = {
+    int: "int64",
+    float: "float64",
+    bool: "bool_",
+    str: "string",
+    date: "date32",
+}
+
+
+def to_sqlite(
+    rows: Iterable,
+    conn,
+    table: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Insert schema rows into an SQLite table, one ``executemany`` per batch.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Rows returned by ``read()`` or ``autoread()`` with a schema.
+    conn : sqlite3.Connection | str | Path
+        Open connection, or path of the database file to open.
+    table : str
+        Table name. The table is created with one column per schema
+        attribute if it does not exist.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Number of rows inserted per ``executemany`` call.
+
+    Returns
+    -------
+    int
+        Number of rows inserted.
+
+    Notes
+    -----
+    Every batch is inserted and committed in its own transaction. Values
+    must be supported by ``sqlite3``; register an adapter with
+    ``sqlite3.register_adapter`` for other types (e.g. ``Decimal``).
+    """
+
+    import sqlite3
+
+    if isinstance(conn, (str, Path)):
+        with closing(sqlite3.connect(conn)) as db:
+            return to_sqlite(rows, db, table, batch_size)
+
+    batches = _batches(rows, batch_size)
+    columns = next(batches, None)
+    if columns is None:
+        return 0
+
+    name = _quote(table)
+    definitions = ", ".join(
+        f"{_quote(attr)} {_SQLITE_TYPES.get(value_type(col._type), '')}".rstrip()
+        for attr, col in columns.items()
+    )
+    insert = (
+        f"INSERT INTO {name} ({', '.join(map(_quote, columns))}) "
+        f"VALUES ({', '.join('?' * len(columns))})"
+    )
+
+    with conn:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {name} ({definitions})")
+
+    count = 0
+    for batch in batches:
+        with conn:
+            conn.executemany(insert, batch)
+        count += len(batch)
+    return count
+
+
+def to_csv(
+    rows: Iterable,
+    file,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    header: bool = True,
+    **fmtparams,
+) -> int:
+    """
+    Write schema rows to a CSV file, one ``writerows`` call per batch.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Rows returned by ``read()`` or ``autoread()`` with a schema.
+    file : str | Path | TextIO
+        Path of the file to write, or a text file opened with
+        ``newline=""``.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Number of rows written per ``writerows`` call.
+    header : bool, default=True
+        Whether the schema attribute names are written as the first row.
+    **fmtparams
+        Formatting parameters of ``csv.writer``.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+
+    import csv
+
+    if isinstance(file, (str, Path)):
+        with open(file, "w", newline="", encoding="utf-8") as f:
+            return to_csv(rows, f, batch_size, header=header, **fmtparams)
+
+    writer = csv.writer(file, **fmtparams)
+    batches = _batches(rows, batch_size)
+    columns = next(batches, None)
+    if columns is None:
+        return 0
+
+    if header:
+        writer.writerow(columns)
+    count = 0
+    for batch in batches:
+        writer.writerows(batch)
+        count += len(batch)
+    return count
+
+
+def to_arrow(rows: Iterable, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Collect schema rows into a ``pyarrow.Table``.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Rows returned by ``read()`` or ``autoread()`` with a schema.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Number of rows per record batch.
+
+    Returns
+    -------
+    pyarrow.Table
+        One column per schema attribute. ``int``, ``float``, ``bool``,
+        ``str``, ``datetime`` and ``date`` columns (optional or not) get
+        the matching Arrow type, the type of other columns is inferred
+        from the first batch.
+
+    Raises
+    ------
+    ValueError
+        If ``rows`` is empty: the Arrow schema is derived from the first
+        row, so there is none to build the table with.
+    """
+
+    pa = _import_pyarrow()
+    record_batches = _record_batches(pa, rows, batch_size)
+    schema = next(record_batches)
+    return pa.Table.from_batches(list(record_batches), schema=schema)
+
+
+def to_parquet(
+    rows: Iterable,
+    path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **options,
+) -> int:
+    """
+    Write schema rows to a Parquet file, one record batch at a time.
+
+    Parameters
+    ----------
+    rows : Iterable
+        Rows returned by ``read()`` or ``autoread()`` with a schema.
+    path : str | Path
+        Path of the Parquet file.
+    batch_size : int, default=DEFAULT_BATCH_SIZE
+        Number of rows per record batch.
+    **options
+        Keyword arguments of ``pyarrow.parquet.ParquetWriter``.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If ``rows`` is empty, see ``to_arrow()``. No file is written.
+
+    Notes
+    -----
+    Batches are written as they are read, so memory use is bounded by
+    ``batch_size`` whatever the size of the input.
+    """
+
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    record_batches = _record_batches(pa, rows, batch_size)
+    schema = next(record_batches)
+    count = 0
+    with pq.ParquetWriter(str(path), schema, **options) as writer:
+        for batch in record_batches:
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+def _batches(rows: Iterable, batch_size: int) -> Iterator:
+    # Yields the columns of the schema (attribute -> column), then lists of
+    # row tuples in the same order. Nothing is yielded for empty inputs.
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+
+    yield first._schema._columns
+    astuple = type(first).astuple
+    rows = chain((first,), rows)
+    while True:
+        batch = list(map(astuple, islice(rows, batch_size)))
+        if not batch:
+            return
+        yield batch
+
+
+def _record_batches(pa, rows: Iterable, batch_size: int) -> Iterator:
+    # Yields the Arrow schema first, then record batches following it.
+    batches = _batches(rows, batch_size)
+    columns = next(batches, None)
+    if columns is None:
+        raise ValueError("Cant infer the Arrow schema of an empty read")
+
+    first = next(batches)
+    types = [_arrow_type(pa, col._type) for col in columns.values()]
+    arrays = [pa.array(values, type=kind) for values, kind in zip(zip(*first), types)]
+    schema = pa.schema(
+        [pa.field(attr, array.type) for attr, array in zip(columns, arrays)]
+    )
+    yield schema
+    yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    for batch in batches:
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(zip(*batch), schema)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _arrow_type(pa, annotation) -> Optional[Any]:
+    annotation = value_type(annotation)
+    if annotation is datetime:
+        return pa.timestamp("us")
+    name = _ARROW_TYPES.get(annotation)
+    return None if name is None else getattr(pa, name)()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow not found, ensure that you installed it:\n"
+            "pip install xlea[arrow]"
+        )
+    return pyarrow
+
+
+__all__ = ("to_sqlite", "to_csv", "to_arrow", "to_parquet")
@@ -0,0 +1,227 @@
+import logging
+from collections import defaultdict
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+
+from xlea.core.plan import RowPlan
+from xlea.providers.utils import release
+
+
+class ReadStats:
+    """
+    Timings and counters of the reads it is passed to.
+
+    Pass an instance to ``read(..., stats=)`` or ``autoread(..., stats=)``.
+    Reads without stats are not instrumented at all.
+
+    Parameters
+    ----------
+    sink : Callable[[ReadStats], None], optional
+        Called with the stats every time a read ends, e.g. ``log_stats()``
+        or a function pushing ``asdict()`` to a metrics system.
+    tags : Mapping[str, Any], optional
+        Arbitrary labels (vendor, file name, ...) included in ``asdict()``.
+
+    Attributes
+    ----------
+    provider : str | None
+        Class name of the provider of the last read.
+    provider_seconds : float
+        Time spent in the provider: ``rows()`` and producing every row.
+    resolve_seconds : float
+        Time spent searching the header and binding columns, without the
+        time the provider took to produce the scanned rows.
+    validation_seconds : dict[str, float]
+        Time spent in validators, per schema attribute.
+    conversion_seconds : dict[str, float]
+        Time spent converting values, per target type name.
+    total_seconds : float
+        Wall time of the reads, from the first row requested until the
+        iterator returned by ``read()`` is exhausted or closed.
+    rows_read : int
+        Data rows produced by the provider after the header.
+    rows_skipped : int
+        Data rows dropped by ``skip_invalid_row`` validators.
+
+    Notes
+    -----
+    Stats accumulate over all reads an instance is passed to. Time spent
+    by the consumer between rows is part of ``total_seconds``. Values of
+    row objects are converted lazily, when attributes are read, so their
+    conversion time is only counted for attributes read while iterating.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Callable[["ReadStats"], None]] = None,
+        tags: Optional[Mapping[str, Any]] = None,
+    ):
+        self.sink = sink
+        self.tags = dict(tags or {})
+
+        self.provider: Optional[str] = None
+        self.provider_seconds = 0.0
+        self.resolve_seconds = 0.0
+        self.validation_seconds: dict[str, float] = defaultdict(float)
+        self.conversion_seconds: dict[str, float] = defaultdict(float)
+        self.total_seconds = 0.0
+        self.rows_read = 0
+        self.rows_skipped = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.total_seconds:
+            return 0.0
+        return self.rows_read / self.total_seconds
+
+    def asdict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "provider_seconds": self.provider_seconds,
+            "resolve_seconds": self.resolve_seconds,
+            "validation_seconds": dict(self.validation_seconds),
+            "conversion_seconds": dict(self.conversion_seconds),
+            "total_seconds": self.total_seconds,
+            "rows_read": self.rows_read,
+            "rows_skipped": self.rows_skipped,
+            "rows_per_second": self.rows_per_second,
+            **self.tags,
+        }
+
+    def __repr__(self):
+        return (
+            f"ReadStats(provider={self.provider!r}, rows_read={self.rows_read}, "
+            f"rows_skipped={self.rows_skipped}, "
+            f"rows_per_second={self.rows_per_second:.0f}, "
+            f"provider_seconds={self.provider_seconds:.3f}, "
+            f"resolve_seconds={self.resolve_seconds:.3f}, "
+            f"total_seconds={self.total_seconds:.3f})"
+        )
+
+    def finish(self):
+        """
+        Notify the sink that a read ended.
+        """
+
+        if self.sink is not None:
+            self.sink(self)
+
+
+def log_stats(
+    logger: Optional[logging.Logger] = None, level: int = logging.INFO
+) -> Callable[[ReadStats], None]:
+    """
+    Build a ``ReadStats`` sink writing one log record per read.
+
+    Parameters
+    ----------
+    logger : logging.Logger, optional
+        Logger to write to, ``logging.getLogger("xlea")`` by default.
+    level : int, default=logging.INFO
+        Level of the records.
+
+    Returns
+    -------
+    Callable[[ReadStats], None]
+        Sink logging the stats summary, with ``stats.asdict()`` attached to
+        the record as the ``xlea_stats`` attribute.
+    """
+
+    if logger is None:
+        logger = logging.getLogger("xlea")
+
+    def sink(stats: ReadStats):
+        logger.log(level, "%r", stats, extra={"xlea_stats": stats.asdict()})
+
+    return sink
+
+
+class _TimedProvider:
+    # Provider proxy adding the time spent producing rows to the stats.
+
+    def __init__(self, provider, stats: ReadStats):
+        self._provider = provider
+        self._stats = stats
+
+    def rows(self):
+        start = perf_counter()
+        rows = self._provider.rows()
+        self._stats.provider_seconds += perf_counter() - start
+        return _timed_rows(rows, self._stats)
+
+    def close(self):
+        release(self._provider)
+
+
+class _TimedRangeProvider(_TimedProvider):
+    def iter_rows(self, *args, **kwargs):
+        start = perf_counter()
+        rows = self._provider.iter_rows(*args, **kwargs)
+        self._stats.provider_seconds += perf_counter() - start
+        return _timed_rows(rows, self._stats)
+
+
+def instrument_provider(provider, stats: ReadStats):
+    stats.provider = type(provider).__name__
+    if hasattr(provider, "iter_rows"):
+        return _TimedRangeProvider(provider, stats)
+    return _TimedProvider(provider, stats)
+
+
+def _timed_rows(rows: Iterable, stats: ReadStats) -> Iterator:
+    rows = iter(rows)
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                stats.provider_seconds += perf_counter() - start
+            yield row
+    finally:
+        release(rows)
+
+
+def instrument_plan(plan: RowPlan, stats: ReadStats) -> RowPlan:
+    """
+    Return ``plan`` with timed validators and converters.
+    """
+
+    validators = tuple(
+        (
+            c.index,
+            _timed(c.column._validator, stats.validation_seconds, c.attr),
+            c.column._skip_invalid_row,
+        )
+        for c in plan.columns
+        if c.index is not None and c.column._validator is not None
+    )
+
+    accessors = {}
+    for c in plan.columns:
+        index, convert, default = plan.accessors[c.attr]
+        kind = getattr(c.column._type, "__name__", str(c.column._type))
+        accessors[c.attr] = (
+            index,
+            _timed(convert, stats.conversion_seconds, kind),
+            default,
+        )
+
+    return plan._replace(validators=validators, accessors=MappingProxyType(accessors))
+
+
+def _timed(func: Callable, totals: dict[str, float], key: str) -> Callable:
+    def timed(value):
+        start = perf_counter()
+        try:
+            return func(value)
+        finally:
+            totals[key] += perf_counter() - start
+
+    return timed
+
+
+__all__ = ("ReadStats", "log_stats")
@@ -0,0 +1,216 @@
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Type, Union
+
+from xlea.core.bound_schema import BoundSchema
+from xlea.core.constants import DEFAULT_HEADER_SCAN_DEPTH
+from xlea.core.reader import read
+from xlea.core.types import TSchema
+from xlea.exc import HeaderNotFound, MissingRequiredColumnError
+from xlea.exc import UnknownFileExtensionError
+from xlea.providers import providers
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import release
+
+
+class Workbook:
+    """
+    A workbook opened once and read sheet by sheet.
+
+    Workbook-level state (the loaded ``openpyxl`` or ``xlrd`` book, the
+    shared strings table of the streaming ``.xlsx`` provider) is parsed on
+    the first read and reused by every sheet, instead of once per sheet as
+    with repeated ``autoread()`` calls.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the workbook.
+    provider : type[ProviderProto], optional
+        Provider class. Defaults to the provider registered for the file
+        extension.
+
+    Raises
+    ------
+    UnknownFileExtensionError
+        If no provider is registered for the file extension.
+
+    Notes
+    -----
+    Sheets are shared by providers implementing ``sheet_names()`` and
+    ``sheet(name)``, the latter returning a provider for one sheet that
+    reuses the open book and leaves it open when closed. Other providers
+    are created anew for each sheet.
+
+    Examples
+    --------
+    ::
+
+        with xlea.open("2024.xlsx") as book:
+            for sheet in book.sheets:
+                for row in book.read(sheet, [Sales, Returns]):
+                    ...
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        provider: Optional[Type[ProviderProto]] = None,
+    ):
+        path = Path(path)
+        if provider is None:
+            provider = providers.select_by_extension(path.suffix)
+        if not provider:
+            raise UnknownFileExtensionError(
+                f"Cant find provider for extension {path.suffix}"
+            )
+
+        self._path = path
+        self._provider_type = provider
+        self._provider = provider(path)
+
+    @property
+    def sheets(self) -> list[Optional[str]]:
+        """
+        Sheet names, in workbook order. Formats without sheets (CSV) have a
+        single unnamed sheet, ``None``.
+        """
+
+        sheet_names = getattr(self._provider, "sheet_names", None)
+        if sheet_names is None:
+            return [None]
+        return list(sheet_names())
+
+    def sheet(self, name: Optional[str] = None) -> ProviderProto:
+        """
+        Return a provider reading the sheet ``name`` of the workbook.
+
+        Parameters
+        ----------
+        name : str, optional
+            Sheet name. Defaults to the provider's default sheet.
+        """
+
+        sheet = getattr(self._provider, "sheet", None)
+        if sheet is None:
+            return self._provider_type(self._path, name)
+        return sheet(name)
+
+    def match(
+        self,
+        sheet: Optional[str],
+        schemas: Sequence[Type[TSchema]],
+        depth: Optional[int] = DEFAULT_HEADER_SCAN_DEPTH,
+    ) -> Type[TSchema]:
+        """
+        Return the first of ``schemas`` whose header is found in ``sheet``.
+
+        Parameters
+        ----------
+        sheet : str, optional
+            Sheet name. Defaults to the provider's default sheet.
+        schemas : Sequence[type]
+            Candidate schema classes, tried in order.
+        depth : int | None, default=DEFAULT_HEADER_SCAN_DEPTH
+            Maximum number of leading rows searched for the header of each
+            candidate, or fewer if its ``header_scan_depth`` is smaller.
+            Every schema that doesn't match reads and buffers up to this
+            many rows. ``None`` only applies the ``header_scan_depth`` of
+            each schema.
+
+        Raises
+        ------
+        HeaderNotFound
+            If no schema matches the sheet.
+        """
+
+        for schema in schemas:
+            provider = self.sheet(sheet)
+            rows = provider.rows()
+            probed = rows
+            if depth is not None:
+                header_rows = getattr(schema, "__schema_config__", {}).get(
+                    "header_rows", 1
+                )
+                probed = islice(rows, depth + header_rows - 1)
+            try:
+                BoundSchema(probed, schema).resolve()
+            except (HeaderNotFound, MissingRequiredColumnError):
+                continue
+            finally:
+                release(rows, provider)
+            return schema
+
+        raise HeaderNotFound(
+            f"No schema of {[s.__name__ for s in schemas]} matches sheet {sheet!r}"
+        )
+
+    def read(
+        self,
+        sheet: Optional[str] = None,
+        schema: Union[Type[TSchema], Sequence[Type[TSchema]], None] = None,
+        **options,
+    ) -> Union[Iterable[Iterable], Iterator[TSchema]]:
+        """
+        Read a sheet of the workbook.
+
+        Parameters
+        ----------
+        sheet : str, optional
+            Sheet name. Defaults to the provider's default sheet.
+        schema : type | Sequence[type], optional
+            Schema class, or candidate schema classes: the first one whose
+            header is found in the sheet is used, see ``match()`` (which
+            searches the default ``depth`` of rows).
+        **options
+            Keyword arguments of ``read()``.
+
+        Returns
+        -------
+        Iterable[Iterable] | Iterator[TSchema]
+            As returned by ``read()``.
+        """
+
+        if isinstance(schema, (list, tuple)):
+            schema = self.match(sheet, schema)
+        return read(self.sheet(sheet), schema, **options)
+
+    def close(self):
+        """
+        Release the workbook. Safe to call repeatedly.
+        """
+
+        release(self._provider)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open(
+    path: Union[str, Path], provider: Optional[Type[ProviderProto]] = None
+) -> Workbook:
+    """
+    Open a workbook to read several of its sheets.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the workbook.
+    provider : type[ProviderProto], optional
+        Provider class. Defaults to the provider registered for the file
+        extension.
+
+    Returns
+    -------
+    Workbook
+        The opened workbook; close it, or use it as a context manager, once
+        done.
+    """
+
+    return Workbook(path, provider)
+
+
+__all__ = ("Workbook", "open")
@@ -0,0 +1,170 @@
+import codecs
+import csv
+import mmap
+from itertools import islice
+from typing import Iterator, Optional, Sequence, Union
+from weakref import WeakSet
+
+from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import projector
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+DEFAULT_SNIFF_SIZE = 64 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class CSVProvider(ProviderProto):
+    """
+    Provider for delimited text files.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the file.
+    sheet : str, optional
+        Ignored, text files have a single table.
+    encoding : str, optional
+        File encoding. Detected from a byte order mark or by trying UTF-8
+        on the sniffed prefix when omitted.
+    delimiter : str, optional
+        Field delimiter. Sniffed from the prefix when omitted.
+    dialect : csv.Dialect | str, optional
+        Full ``csv`` dialect, takes precedence over sniffing.
+    fallback_encoding : str, default="latin-1"
+        Encoding used when the prefix is not valid UTF-8.
+    buffer_size : int, default=DEFAULT_BUFFER_SIZE
+        Size of the read buffer.
+    sniff_size : int, default=DEFAULT_SNIFF_SIZE
+        Number of leading bytes used to detect encoding and dialect.
+    use_mmap : bool, default=False
+        Read the file through a memory map. Only used for encodings in
+        which a newline is always a single ``\\n`` byte (not UTF-16/32).
+    """
+
+    default_delimiter: Optional[str] = None
+
+    def __init__(
+        self,
+        path,
+        sheet: Optional[str] = None,
+        *,
+        encoding: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        dialect: Union[csv.Dialect, str, None] = None,
+        fallback_encoding: str = "latin-1",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        sniff_size: int = DEFAULT_SNIFF_SIZE,
+        use_mmap: bool = False,
+    ):
+        self._path = path
+        self._sheet = sheet
+        self._encoding = encoding
+        self._delimiter = delimiter or self.default_delimiter
+        self._dialect = dialect
+        self._fallback_encoding = fallback_encoding
+        self._buffer_size = buffer_size
+        self._sniff_size = sniff_size
+        self._use_mmap = use_mmap
+        self._open: "WeakSet[Iterator]" = WeakSet()
+
+    def rows(self):
+        return self.iter_rows()
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        encoding, dialect = self._sniff()
+        if self._use_mmap and _is_ascii_compatible(encoding):
+            records = self._mmap_records(encoding, dialect)
+        else:
+            records = self._buffered_records(encoding, dialect)
+        self._open.add(records)
+
+        if start or stop is not None:
+            records = islice(records, start, stop)
+        return map(tuple if columns is None else projector(columns), records)
+
+    def close(self):
+        for records in list(self._open):
+            records.close()
+
+    def _buffered_records(self, encoding: str, dialect) -> Iterator[list]:
+        with open(
+            self._path,
+            encoding=encoding,
+            newline="",
+            buffering=self._buffer_size,
+        ) as f:
+            yield from csv.reader(f, dialect)
+
+    def _mmap_records(self, encoding: str, dialect) -> Iterator[list]:
+        with open(self._path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return
+            with mm:
+                lines = (line.decode(encoding) for line in iter(mm.readline, b""))
+                yield from csv.reader(lines, dialect)
+
+    def _sniff(self):
+        with open(self._path, "rb") as f:
+            prefix = f.read(self._sniff_size)
+
+        encoding = self._encoding or self._detect_encoding(prefix)
+
+        if self._dialect is not None:
+            return encoding, self._dialect
+
+        base = csv.excel_tab if self._delimiter == "\t" else csv.excel
+        if self._delimiter is not None:
+            return encoding, _with_delimiter(base, self._delimiter)
+
+        sample = codecs.getincrementaldecoder(encoding)(errors="replace").decode(prefix)
+        # Drop the last line, which may have been cut by the prefix size.
+        if len(prefix) == self._sniff_size:
+            sample = sample[: sample.rfind("\n") + 1] or sample
+        try:
+            return encoding, csv.Sniffer().sniff(sample, delimiters=",;\t|")
+        except csv.Error:
+            return encoding, base
+
+    def _detect_encoding(self, prefix: bytes) -> str:
+        for bom, encoding in _BOMS:
+            if prefix.startswith(bom):
+                return encoding
+
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(prefix)
+        except UnicodeDecodeError:
+            return self._fallback_encoding
+        return "utf-8"
+
+
+class TSVProvider(CSVProvider):
+    """
+    Provider for tab separated files.
+
+    Same as ``CSVProvider`` with the delimiter defaulting to a tab.
+    """
+
+    default_delimiter = "\t"
+
+
+def _with_delimiter(base, delimiter: str):
+    return type("Dialect", (base,), {"delimiter": delimiter})
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    name = codecs.lookup(encoding).name
+    return not name.startswith(("utf-16", "utf-32"))
@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Iterator, Optional, Sequence
+from weakref import WeakSet
 
 from xlea.exc import ProviderError
 
@@ -10,16 +11,84 @@ except ImportError:
     )
 
 from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import projector
 
 
 class OpenPyXlProvider(ProviderProto):
-    def __init__(self, path, sheet: Optional[str] = None):
+    def __init__(self, path, sheet: Optional[str] = None, book=None):
         self._path = path
         self._sheet = sheet
+        self._book = book
+        # a book passed in belongs to the provider that loaded it
+        self._owns_book = book is None
+        self._open: "WeakSet[Iterator]" = WeakSet()
 
-    def rows(self):
-        book = openpyxl.load_workbook(self._path, read_only=True)
-        sheet = book.active if self._sheet is None else book[self._sheet]
+    def _workbook(self):
+        if self._book is None:
+            self._book = openpyxl.load_workbook(self._path, read_only=True)
+        return self._book
+
+    def _worksheet(self):
+        book = self._workbook()
+        try:
+            sheet = book.active if self._sheet is None else book[self._sheet]
+        except KeyError:
+            sheet = None
         if sheet is None:
             raise ProviderError("Sheet not found")
-        return sheet.values
+        return sheet
+
+    def sheet_names(self) -> list[str]:
+        return self._workbook().sheetnames
+
+    def sheet(self, name: Optional[str] = None) -> "OpenPyXlProvider":
+        return OpenPyXlProvider(self._path, name, book=self._workbook())
+
+    def row_count(self) -> Optional[int]:
+        # read-only sheets take it from the declared dimension, if any
+        return self._worksheet().max_row
+
+    def rows(self):
+        return self._track(self._worksheet().values)
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        if stop is not None and stop <= start:
+            # openpyxl reads max_row=0 as no limit
+            return iter(())
+
+        sheet = self._worksheet()
+        if columns is None:
+            rows = sheet.iter_rows(min_row=start + 1, max_row=stop, values_only=True)
+            return self._track(rows)
+        if not columns:
+            rows = sheet.iter_rows(
+                min_row=start + 1, max_row=stop, max_col=1, values_only=True
+            )
+            return (() for _ in self._track(rows))
+
+        rows = sheet.iter_rows(
+            min_row=start + 1,
+            max_row=stop,
+            min_col=columns[0] + 1,
+            max_col=columns[-1] + 1,
+            values_only=True,
+        )
+        return map(projector([c - columns[0] for c in columns]), self._track(rows))
+
+    def _track(self, rows: Iterator) -> Iterator:
+        self._open.add(rows)
+        return rows
+
+    def close(self):
+        # Open sheet readers hold the archive file until they are closed,
+        # even once the read-only workbook itself is closed.
+        for rows in list(self._open):
+            rows.close()
+        if self._book is not None and self._owns_book:
+            self._book.close()
+            self._book = None
@@ -15,6 +15,35 @@ class ProviderProto(Protocol):
     -----
     Providers should not perform schema-specific logic.
 
+    Providers may additionally implement
+    ``iter_rows(start=0, columns=None, stop=None)``, yielding rows from the
+    0-based row ``start`` up to, excluding, row ``stop`` and keeping only
+    the given ascending column indices (rows too short are padded with
+    ``None``). Once the header is resolved, the reader calls it with the
+    columns bound by the schema so that unused cells are never
+    materialized, and with the rows requested by ``read(start=, stop=)``
+    so that providers able to seek skip the others.
+
+    Multi-sheet providers may implement ``sheet_names()`` and
+    ``sheet(name)``, returning a provider for another sheet of the same
+    workbook. ``Workbook`` uses them to open a file once and read several
+    sheets: the returned provider reuses the open book and leaves it open
+    when closed.
+
+    Providers that know the number of rows of their sheet without reading
+    it (e.g. from the sheet dimension) may implement ``row_count()``,
+    returning ``None`` when it is unknown. ``read_parallel()`` uses it to
+    split the rows in ranges read by separate workers, which it only does
+    for providers whose ``iter_rows(start=)`` reaches ``start`` without
+    reading the rows before it. These declare the class attribute
+    ``seekable = True``.
+
+    Providers holding files open release them in ``close()``. ``read()``
+    and ``autoread()`` close the provider when a read ends, whether the rows
+    were exhausted, an error was raised or iteration stopped early. A closed
+    provider can be read again and reopens its file. Providers are also
+    context managers closing themselves on exit.
+
     Examples
     --------
     Minimal provider::
@@ -35,3 +64,14 @@ class ProviderProto(Protocol):
     def __init__(*args, **kwargs): ...
 
     def rows(self) -> Iterable[Iterable]: ...
+
+    def close(self) -> None:
+        """
+        Release the files held by the provider. Safe to call repeatedly.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
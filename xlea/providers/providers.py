@@ -1,17 +1,22 @@
+import sys
+from importlib import import_module
 from typing import Union
-from xlea.providers.openpyxl import OpenPyXlProvider
+
 from xlea.providers.proto import ProviderProto
-from xlea.providers.pyxlsb import PyXLSBProvider
-from xlea.providers.xlrd import XLRDProvider
 
-_PROVIDERS = {
-    ".xlsx": OpenPyXlProvider,
-    ".xls": XLRDProvider,
-    ".xlsb": PyXLSBProvider,
+ENTRY_POINT_GROUP = "xlea.providers"
+
+_PROVIDERS: dict[str, Union[str, type[ProviderProto]]] = {
+    ".xlsx": "xlea.providers.openpyxl:OpenPyXlProvider",
+    ".xls": "xlea.providers.xlrd:XLRDProvider",
+    ".xlsb": "xlea.providers.pyxlsb:PyXLSBProvider",
+    ".csv": "xlea.providers.csv:CSVProvider",
+    ".tsv": "xlea.providers.csv:TSVProvider",
 }
+_entry_points_loaded = False
 
 
-def register_provider(ext: str, provider: ProviderProto):
+def register_provider(ext: str, provider: Union[str, type[ProviderProto]]):
     """
     Register a data provider for a file extension.
 
@@ -24,14 +29,19 @@ def register_provider(ext: str, provider: ProviderProto):
     ext : str
         File extension to register (e.g. ``".csv"``, ``"xlsx"``).
         The extension is normalized internally and is case-insensitive.
-    provider : ProviderProto
+    provider : type[ProviderProto] | str
         Provider class responsible for reading files with the given
-        extension.
+        extension, or its lazy entry point in ``"package.module:Class"``
+        form. Entry points are imported on first use.
 
     Notes
     -----
     If a provider is already registered for the given extension,
     it will be silently overwritten.
+
+    Third-party packages can also register providers through the
+    ``xlea.providers`` entry point group, using the extension as the
+    entry point name.
     """
 
     _PROVIDERS[_normalize_ext(ext)] = provider
@@ -53,12 +63,47 @@ def select_by_extension(ext: str) -> Union[type[ProviderProto], None]:
         Provider class registered for the given extension, or ``None``
         if no matching provider is found.
 
+    Raises
+    ------
+    ProviderError
+        If the provider's parsing library is not installed.
+
     Notes
     -----
     This function does not instantiate the provider; it only returns
     the provider class. Instantiation is the responsibility of the caller.
+    Lazily registered providers are imported here, on the first lookup.
     """
-    return _PROVIDERS.get(_normalize_ext(ext))
+    ext = _normalize_ext(ext)
+    if ext not in _PROVIDERS:
+        _load_entry_points()
+
+    provider = _PROVIDERS.get(ext)
+    if isinstance(provider, str):
+        provider = _PROVIDERS[ext] = _import_provider(provider)
+    return provider
+
+
+def _import_provider(path: str) -> type[ProviderProto]:
+    module, _, name = path.partition(":")
+    return getattr(import_module(module), name)
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    else:
+        eps = entry_points().get(ENTRY_POINT_GROUP, ())
+
+    for ep in eps:
+        _PROVIDERS.setdefault(_normalize_ext(ep.name), ep.value)
 
 
 def _normalize_ext(ext: str) -> str:
@@ -1,4 +1,6 @@
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional, Sequence
+from weakref import WeakSet
 
 from xlea.exc import ProviderError
 
@@ -16,14 +18,52 @@ class PyXLSBProvider(ProviderProto):
     def __init__(self, path, sheet: Optional[str] = None):
         self._path = path
         self._sheet = sheet
+        self._open: "WeakSet[Iterator]" = WeakSet()
 
     def rows(self):
+        return self.iter_rows()
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        rows = self._iter_rows(start, stop, columns)
+        self._open.add(rows)
+        return rows
+
+    def sheet_names(self) -> list[str]:
         with pyxlsb.open_workbook(self._path) as book:
-            if self._sheet:
-                idx = book.sheets.index(self._sheet)
-                sheet = book.get_sheet(idx)
-            else:
-                sheet = book.get_sheet(1)
-            if sheet is None:
+            return book.sheets
+
+    def row_count(self) -> Optional[int]:
+        with pyxlsb.open_workbook(self._path) as book:
+            try:
+                sheet = book.get_sheet(self._sheet or 1)
+            except (ValueError, IndexError):
                 raise ProviderError("Sheet not found")
-            return (tuple(c.v for c in r) for r in sheet.rows())
+            with sheet:
+                dimension = sheet.dimension
+        return None if dimension is None else dimension.r + dimension.h
+
+    def close(self):
+        for rows in list(self._open):
+            rows.close()
+
+    def _iter_rows(
+        self, start: int, stop: Optional[int], columns: Optional[Sequence[int]]
+    ):
+        with pyxlsb.open_workbook(self._path) as book:
+            try:
+                sheet = book.get_sheet(self._sheet or 1)
+            except (ValueError, IndexError):
+                raise ProviderError("Sheet not found")
+
+            with sheet:
+                rows = islice(sheet.rows(), start, stop)
+                if columns is None:
+                    yield from (tuple(c.v for c in r) for r in rows)
+                    return
+                for r in rows:
+                    yield tuple(r[i].v if i < len(r) else None for i in columns)
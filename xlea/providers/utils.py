@@ -0,0 +1,59 @@
+from operator import itemgetter
+from typing import Any, Callable, Sequence
+
+
+def projector(columns: Sequence[int]) -> Callable[[Sequence], tuple]:
+    """
+    Build a function that picks ``columns`` out of a row.
+
+    Parameters
+    ----------
+    columns : Sequence[int]
+        Ascending column indices to keep.
+
+    Returns
+    -------
+    Callable[[Sequence], tuple]
+        Function returning a tuple with the values of ``columns`` in order.
+        Rows that are too short are padded with ``None``.
+    """
+
+    if not columns:
+        return lambda row: ()
+
+    width = columns[-1] + 1
+    getter = itemgetter(*columns)
+
+    if len(columns) == 1:
+
+        def project(row):
+            return (row[columns[0]] if len(row) >= width else None,)
+
+    else:
+
+        def project(row):
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+            return getter(row)
+
+    return project
+
+
+def release(*resources: Any) -> None:
+    """
+    Close every resource that has a ``close()`` method.
+
+    Used to close providers and the iterators they returned once a read
+    ends. Every resource is closed even if closing an earlier one fails.
+    """
+
+    if not resources:
+        return
+
+    resource, rest = resources[0], resources[1:]
+    close = getattr(resource, "close", None)
+    try:
+        if close is not None:
+            close()
+    finally:
+        release(*rest)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from xlea.exc import ProviderError
 
@@ -10,19 +10,62 @@ except ImportError:
     )
 
 from xlea.providers.proto import ProviderProto
+from xlea.providers.utils import projector
 
 
 class XLRDProvider(ProviderProto):
-    def __init__(self, path, sheet: Optional[str] = None):
+    def __init__(self, path, sheet: Optional[str] = None, book=None):
         self._path = path
         self._sheet = sheet
+        self._book = book
+        # a book passed in belongs to the provider that opened it
+        self._owns_book = book is None
 
-    def rows(self):
-        book = xlrd.open_workbook(self._path, on_demand=True)
-        if self._sheet:
-            sheet = book.sheet_by_name(self._sheet)
-        else:
-            sheet = book.sheet_by_index(0)
+    def _workbook(self):
+        if self._book is None:
+            self._book = xlrd.open_workbook(self._path, on_demand=True)
+        return self._book
+
+    def _worksheet(self):
+        book = self._workbook()
+        try:
+            if self._sheet:
+                sheet = book.sheet_by_name(self._sheet)
+            else:
+                sheet = book.sheet_by_index(0)
+        except xlrd.XLRDError:
+            sheet = None
         if sheet is None:
             raise ProviderError("Sheet not found")
-        return (sheet._cell_values[i] for i in range(sheet.nrows))
+        return sheet
+
+    def sheet_names(self) -> list[str]:
+        return self._workbook().sheet_names()
+
+    def sheet(self, name: Optional[str] = None) -> "XLRDProvider":
+        return XLRDProvider(self._path, name, book=self._workbook())
+
+    def row_count(self) -> int:
+        return self._worksheet().nrows
+
+    def rows(self):
+        return self.iter_rows()
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        sheet = self._worksheet()
+        stop = sheet.nrows if stop is None else min(stop, sheet.nrows)
+        rows = (sheet._cell_values[i] for i in range(start, stop))
+        if columns is None:
+            return rows
+        return map(projector(columns), rows)
+
+    def close(self):
+        # Workbooks opened on demand keep the file mapped until released.
+        if self._book is not None and self._owns_book:
+            self._book.release_resources()
+            self._book = None
@@ -0,0 +1,427 @@
+import posixpath
+import re
+import zipfile
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
+from weakref import WeakSet
+from xml.etree import ElementTree as ET
+from xml.parsers import expat
+
+from xlea.exc import ProviderError
+from xlea.providers.proto import ProviderProto
+
+CHUNK_SIZE = 1 << 16
+
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Byte patterns locating rows in the sheet XML without parsing it. Cell
+# text can't contain "<", so they only match actual tags.
+_SHEET_DATA = re.compile(rb"<(?:[\w.-]+:)?sheetData(?:\s[^>]*)?(/?)>")
+_ROW_TAG = re.compile(rb"<(?:[\w.-]+:)?row[\s>/]")
+_ROW_NUMBER = re.compile(rb'\sr="(\d+)"')
+_DIMENSION = re.compile(rb'<(?:[\w.-]+:)?dimension\s+ref="[A-Z]*\d*:?[A-Z]*(\d+)"')
+
+
+class XLSXStreamProvider(ProviderProto):
+    """
+    Streaming ``.xlsx`` provider that parses the sheet XML directly.
+
+    Unlike ``OpenPyXlProvider`` it does not build cell objects and does not
+    read styles: the shared strings table is loaded once into a list and
+    the sheet XML is parsed incrementally with expat straight from the zip
+    stream.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the workbook.
+    sheet : str, optional
+        Sheet name. Defaults to the active sheet.
+    book : _Book, optional
+        Workbook state shared with the provider this one was created from
+        by ``sheet()``.
+
+    Notes
+    -----
+    Because styles are skipped, date cells are returned as Excel serial
+    numbers, exactly as stored in the file. Missing rows are yielded as
+    empty tuples and rows are not padded to the sheet width.
+
+    Select it for ``.xlsx`` files with::
+
+        register_provider(".xlsx", "xlea.providers.xlsx:XLSXStreamProvider")
+    """
+
+    # ``iter_rows(start=)`` scans row tags up to ``start`` without parsing
+    seekable = True
+
+    def __init__(self, path, sheet: Optional[str] = None, book=None):
+        self._path = path
+        self._sheet = sheet
+        self._book = _Book() if book is None else book
+        self._owns_book = book is None
+        self._open: "WeakSet[Iterator]" = WeakSet()
+
+    def sheet_names(self) -> list[str]:
+        with zipfile.ZipFile(self._path) as archive:
+            ns, _, sheets = self._book.sheets(archive)
+        return [s.get("name") for s in sheets]
+
+    def sheet(self, name: Optional[str] = None) -> "XLSXStreamProvider":
+        return XLSXStreamProvider(self._path, name, book=self._book)
+
+    def row_count(self) -> Optional[int]:
+        """
+        Number of rows declared by the sheet dimension, ``None`` if absent.
+        """
+
+        with zipfile.ZipFile(self._path) as archive:
+            _, sheet_path = self._locate_sheet(archive)
+            with archive.open(sheet_path) as source:
+                head = source.read(CHUNK_SIZE)
+        found = _DIMENSION.search(head)
+        return None if found is None else int(found.group(1))
+
+    def rows(self):
+        return self.iter_rows()
+
+    def iter_rows(
+        self,
+        start: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        stop: Optional[int] = None,
+    ):
+        rows = self._iter_rows(start, stop, columns)
+        self._open.add(rows)
+        return rows
+
+    def close(self):
+        for rows in list(self._open):
+            rows.close()
+        if self._owns_book:
+            self._book = _Book()
+
+    def _iter_rows(
+        self, start: int, stop: Optional[int], columns: Optional[Sequence[int]]
+    ):
+        with zipfile.ZipFile(self._path) as archive:
+            ns, sheet_path = self._locate_sheet(archive)
+            # expat reports namespaced names as "uri}name"
+            ns = f"{ns[1:-1]}}}"
+            shared = self._shared_strings(archive, ns)
+            source = archive.open(sheet_path)
+            if start:
+                skipped = _skip_rows(source, start)
+                if skipped is _PAST_END:
+                    source.close()
+                    return
+                if skipped is None:
+                    source.close()
+                    source = archive.open(sheet_path)
+                else:
+                    source = skipped
+            yield from _iter_sheet(source, ns, shared, start, columns, stop)
+
+    def _locate_sheet(self, archive: zipfile.ZipFile):
+        ns, active, sheets = self._book.sheets(archive)
+        if self._sheet is None:
+            sheet = sheets[active] if active < len(sheets) else None
+        else:
+            sheet = next((s for s in sheets if s.get("name") == self._sheet), None)
+        if sheet is None:
+            raise ProviderError("Sheet not found")
+
+        rid = next(v for k, v in sheet.attrib.items() if k.endswith("}id"))
+        rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels.iter(f"{{{_REL_NS}}}Relationship"):
+            if rel.get("Id") == rid:
+                return ns, _resolve_target(rel.get("Target"))
+        raise ProviderError("Sheet not found")
+
+    def _shared_strings(self, archive: zipfile.ZipFile, ns: str) -> list[str]:
+        if self._book.shared is not None:
+            return self._book.shared
+
+        try:
+            source = archive.open("xl/sharedStrings.xml")
+        except KeyError:
+            shared = []
+        else:
+            with source:
+                shared = _read_shared_strings(source, ns)
+        self._book.shared = shared
+        return shared
+
+
+class _Book:
+    # Workbook-level parts, parsed once and shared by the providers of the
+    # sheets of one workbook.
+
+    def __init__(self):
+        self.shared: Optional[list[str]] = None
+        self._sheets = None
+
+    def sheets(self, archive: zipfile.ZipFile):
+        if self._sheets is None:
+            root = ET.fromstring(archive.read("xl/workbook.xml"))
+            ns = root.tag[: root.tag.index("}") + 1]
+            view = root.find(f"{ns}bookViews/{ns}workbookView")
+            active = int(view.get("activeTab", 0)) if view is not None else 0
+            self._sheets = ns, active, root.findall(f"{ns}sheets/{ns}sheet")
+        return self._sheets
+
+
+def _parser(start, end, data) -> "expat.XMLParserType":
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = data
+    return parser
+
+
+def _read_shared_strings(source, ns: str) -> list[str]:
+    si_tag, t_tag, rph_tag = f"{ns}si", f"{ns}t", f"{ns}rPh"
+    strings: list[str] = []
+    parts: list[str] = []
+    in_text = in_phonetic = False
+
+    def start(name, attrs):
+        nonlocal in_text, in_phonetic
+        if name == t_tag:
+            in_text = not in_phonetic
+        elif name == rph_tag:
+            in_phonetic = True
+
+    def end(name):
+        nonlocal in_text, in_phonetic
+        if name == t_tag:
+            in_text = False
+        elif name == rph_tag:
+            in_phonetic = False
+        elif name == si_tag:
+            strings.append("".join(parts))
+            parts.clear()
+
+    def data(text):
+        if in_text:
+            parts.append(text)
+
+    _parser(start, end, data).ParseFile(source)
+    return strings
+
+
+def _iter_sheet(
+    source,
+    ns: str,
+    shared: list[str],
+    start_row: int = 0,
+    wanted: Optional[Sequence[int]] = None,
+    stop_row: Optional[int] = None,
+) -> Iterator[tuple]:
+    """
+    Parse worksheet XML from ``source`` into value tuples.
+
+    Rows before ``start_row`` and cells outside ``wanted`` are parsed but
+    their values are never converted. Parsing stops once the rows before
+    ``stop_row`` are produced. The expat handlers are closures over
+    local state because they run for every element of the sheet.
+    """
+
+    row_tag, c_tag, v_tag, t_tag = f"{ns}row", f"{ns}c", f"{ns}v", f"{ns}t"
+    columns: dict[str, int] = {}
+    positions = None if wanted is None else {c: p for p, c in enumerate(wanted)}
+    empty = () if wanted is None else (None,) * len(wanted)
+    ready: list[tuple] = []
+    values: list = []
+    expected = 1
+    column = 0
+    position = None
+    kind = "n"
+    text = None
+    in_value = False
+    skip_row = False
+
+    def start(name, attrs):
+        nonlocal kind, text, in_value, values, expected, column, position, skip_row
+        if name == c_tag:
+            if skip_row:
+                position = None
+                return
+            kind = attrs.get("t", "n")
+            text = None
+            ref = attrs.get("r")
+            if ref is not None:
+                letters = ref.rstrip("0123456789")
+                column = columns.get(letters)
+                if column is None:
+                    column = columns[letters] = _column_index(letters)
+            if positions is not None:
+                position = positions.get(column)
+            elif column > len(values):
+                values.extend([None] * (column - len(values)))
+            column += 1
+        elif name == v_tag or name == t_tag:
+            in_value = not skip_row and (positions is None or position is not None)
+        elif name == row_tag:
+            number = int(attrs.get("r", expected))
+            for _ in range(max(expected, start_row + 1), number):
+                ready.append(empty)
+            expected = number + 1
+            skip_row = number <= start_row
+            values = [] if positions is None else [None] * len(positions)
+            column = 0
+
+    def end(name):
+        nonlocal in_value
+        if name == c_tag:
+            if skip_row:
+                return
+            value = None if text is None else _convert(kind, text, shared)
+            if positions is None:
+                values.append(value)
+            elif position is not None:
+                values[position] = value
+        elif name == v_tag or name == t_tag:
+            in_value = False
+        elif name == row_tag and not skip_row:
+            ready.append(tuple(values))
+
+    def data(chunk):
+        nonlocal text
+        if in_value:
+            text = chunk if text is None else text + chunk
+
+    parser = _parser(start, end, data)
+    remaining = None if stop_row is None else max(stop_row - start_row, 0)
+    with source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            if remaining == 0:
+                return
+            parser.Parse(chunk, False)
+            if not ready:
+                continue
+            if remaining is not None:
+                if len(ready) >= remaining:
+                    yield from ready[:remaining]
+                    return
+                remaining -= len(ready)
+            yield from ready
+            ready.clear()
+        parser.Parse(b"", True)
+    yield from ready[:remaining]
+
+
+_PAST_END = object()
+
+
+def _skip_rows(source, start_row: int):
+    """
+    Skip the XML of the rows before ``start_row`` without parsing it.
+
+    Returns a stream of the sheet XML up to ``<sheetData>`` followed by the
+    first row at or after ``start_row``, ``_PAST_END`` if there is no such
+    row and ``None`` if rows can't be located (e.g. rows without numbers),
+    in which case ``source`` is partially consumed.
+    """
+
+    data = b""
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return None
+        data += chunk
+        found = _SHEET_DATA.search(data)
+        if found is not None:
+            break
+    if found.group(1):  # <sheetData/>
+        return _PAST_END
+    head, data = data[: found.end()], data[found.end() :]
+
+    while True:
+        keep = max(len(data) - 16, 0)
+        # Rows are in ascending order: if the last row of the buffer is
+        # before ``start_row``, so are the others.
+        last = _last_row_number(data)
+        if last is not None and last <= start_row:
+            keep = data.rfind(b"<")
+        else:
+            for tag in _ROW_TAG.finditer(data):
+                end = data.find(b">", tag.start())
+                if end < 0:
+                    keep = tag.start()
+                    break
+                number = _ROW_NUMBER.search(data, tag.start(), end)
+                if number is None:
+                    return None
+                if int(number.group(1)) > start_row:
+                    return _Prefixed(head + data[tag.start() :], source)
+
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return _PAST_END
+        data = data[keep:] + chunk
+
+
+def _last_row_number(data: bytes) -> Optional[int]:
+    # Number of the last complete row tag within the end of ``data``.
+    last = None
+    for last in _ROW_TAG.finditer(data, max(len(data) - 4096, 0)):
+        pass
+    if last is None:
+        return None
+    end = data.find(b">", last.start())
+    if end < 0:
+        return None
+    number = _ROW_NUMBER.search(data, last.start(), end)
+    return None if number is None else int(number.group(1))
+
+
+class _Prefixed:
+    # Readable stream returning ``prefix`` before the rest of ``source``.
+
+    def __init__(self, prefix: bytes, source):
+        self._prefix = prefix
+        self._source = source
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prefix:
+            data, self._prefix = self._prefix, b""
+            return data
+        return self._source.read(size)
+
+    def close(self):
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _convert(kind: str, text: str, shared: list[str]):
+    if kind == "n":
+        if "." in text or "E" in text or "e" in text:
+            return float(text)
+        return int(text)
+    if kind == "s":
+        return shared[int(text)]
+    if kind == "b":
+        return text == "1"
+    if kind == "d":
+        return datetime.fromisoformat(text.rstrip("Z"))
+    return text
+
+
+def _column_index(letters: str) -> int:
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + ord(ch) - 64
+    return idx - 1
+
+
+def _resolve_target(target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join("xl", target))